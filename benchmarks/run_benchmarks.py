@@ -0,0 +1,269 @@
+import os
+
+# Frame benchmarks render headless; must be set before pygame initialises the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import numpy as np
+import pygame
+from config.constant import *
+from frameworks.physic import (calculate_tensions, solution, calculate_body_position,
+                               calculate_tensions_batch, solution_batch, calculate_body_position_batch)
+from frameworks.tension_table import get_tension_table
+from frameworks.state import StateManager
+from frameworks.truss import Structure
+
+BENCHMARKS = []
+
+class SkipBenchmark(Exception):
+    """The benchmark cannot run in this environment."""
+
+def benchmark(name):
+    """Register a setup function that returns the callable to time."""
+    def register(setup):
+        BENCHMARKS.append((name, setup))
+        return setup
+    return register
+
+def time_callable(fn, repeat=5, min_time=0.2):
+    """Median seconds per call over several autoranged runs."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    runs = timer.repeat(repeat=repeat, number=number)
+    return {'seconds': statistics.median(runs) / number, 'best': min(runs) / number, 'loops': number}
+
+# Physics
+
+@benchmark('physics.calculate_tensions')
+def _():
+    return lambda: calculate_tensions(100, 30, 60)
+
+@benchmark('physics.solution')
+def _():
+    return lambda: solution(100, 30, 60)
+
+@benchmark('physics.calculate_body_position')
+def _():
+    return lambda: calculate_body_position(337, 1012, 210, 86.6, 50.0, 30, 60)
+
+@benchmark('physics.table_tensions')
+def _():
+    table = get_tension_table()
+    return lambda: table.tensions(100, 30, 60)
+
+@benchmark('physics.table_solution')
+def _():
+    table = get_tension_table()
+    return lambda: table.solution(100, 30, 60)
+
+@benchmark('physics.table_lookup')
+def _():
+    table = get_tension_table()
+    return lambda: (table.solution(100, 30, 60), table.body_position(337, 1012, 210, 100, 30, 60))
+
+@benchmark('physics.batch_100k')
+def _():
+    rng = np.random.default_rng(0)
+    weight = rng.uniform(0, 1000, 100_000)
+    theta1 = rng.integers(1, 91, 100_000)
+    theta2 = rng.integers(1, 91, 100_000)
+
+    def run():
+        T1, T2 = calculate_tensions_batch(weight, theta1, theta2)
+        solution_batch(weight, theta1, theta2)
+        calculate_body_position_batch(337, 1012, 210, T1, T2, theta1, theta2)
+    return run
+
+@benchmark('physics.truss_resolve_2000')
+def _():
+    # Triangulated cantilever of 2000 nodes; solving again reuses the factorization
+    structure = Structure()
+    structure.add_anchor(0, 0)
+    structure.add_anchor(0, 1)
+    for i in range(2000):
+        node = structure.add_node(1 + i // 2, i % 2)
+        structure.add_member(node, node - 1)
+        structure.add_member(node, node - 2)
+    loads = np.zeros((len(structure.points), 2))
+    loads[-1] = (0, -100)
+    structure.solve(loads)
+    return lambda: structure.solve(loads * 2)
+
+# Frames
+
+_scene = None
+
+def _headless_scene():
+    """Create the display, GraphicsManager and UI once for every frame benchmark."""
+    global _scene
+    if _scene is None:
+        from interfaces.graphicInterface import GraphicsManager
+        from interfaces.uiInterface import UI
+
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        try:
+            graphics = GraphicsManager()
+        except (pygame.error, FileNotFoundError) as e:
+            _scene = SkipBenchmark(f"assets could not be loaded: {e}")
+        else:
+            state = StateManager()
+            _scene = (screen, graphics, UI(graphics, state), state)
+    if isinstance(_scene, SkipBenchmark):
+        raise _scene
+    return _scene
+
+def _reset_ui(ui, state):
+    state.update_state(weight=INITIAL_WEIGHT, theta1=INITIAL_THETA1, theta2=INITIAL_THETA2)
+    ui.conversor_visible = False
+    ui.mostrar_grafico = False
+    ui.historial_visible = False
+    if ui.graph_worker is not None:
+        ui.graph_worker.close()
+        ui.graph_worker = None
+
+def _frame_scenario(configure, changing):
+    screen, graphics, ui, state = _headless_scene()
+    _reset_ui(ui, state)
+    configure(ui)
+    weights = [INITIAL_WEIGHT + i for i in range(200)]
+    counter = [0]
+
+    def frame():
+        if changing:
+            counter[0] += 1
+            state.update_state(weight=weights[counter[0] % len(weights)])
+        if ui.mostrar_grafico:
+            ui.update_graph()
+        ui.draw_scene(screen)
+    return frame
+
+@benchmark('frame.ui_draw_scene.static')
+def _():
+    return _frame_scenario(lambda ui: None, changing=False)
+
+@benchmark('frame.ui_draw_scene.dragging')
+def _():
+    return _frame_scenario(lambda ui: None, changing=True)
+
+@benchmark('frame.ui_draw_scene.converter_open')
+def _():
+    return _frame_scenario(lambda ui: setattr(ui, 'conversor_visible', True), changing=False)
+
+@benchmark('frame.ui_draw_scene.graph_open_dragging')
+def _():
+    return _frame_scenario(lambda ui: setattr(ui, 'mostrar_grafico', True), changing=True)
+
+@benchmark('frame.ui_draw_scene.graph_open_dragging_worker')
+def _():
+    from interfaces.graphWorker import GraphWorker
+
+    def configure(ui):
+        ui.mostrar_grafico = True
+        ui.graph_worker = GraphWorker()
+    return _frame_scenario(configure, changing=True)
+
+@benchmark('frame.graphics_draw_scene')
+def _():
+    screen, graphics, ui, state = _headless_scene()
+    anchor1_x, anchor2_x, anchor_y = ui.anchors()
+    return lambda: graphics.draw_scene(screen, 674, 400, anchor1_x, anchor2_x, anchor_y, 30, 60)
+
+@benchmark('frame.graphics_create_graph')
+def _():
+    screen, graphics, ui, state = _headless_scene()
+    angles = [(30 + i % 40, 60 - i % 40) for i in range(80)]
+    counter = [0]
+
+    def run():
+        counter[0] += 1
+        theta1, theta2 = angles[counter[0] % len(angles)]
+        graphics.create_graph(100, theta1, theta2, 86.6, 50.0)
+    return run
+
+def run_benchmarks(pattern=None, repeat=5, min_time=0.2):
+    results = {}
+    for name, setup in BENCHMARKS:
+        if pattern and pattern not in name:
+            continue
+        try:
+            results[name] = time_callable(setup(), repeat, min_time)
+            print(f"{name:45s} {results[name]['seconds'] * 1e6:12.2f} us")
+        except SkipBenchmark as e:
+            results[name] = {'skipped': str(e)}
+            print(f"{name:45s} skipped: {e}")
+        except Exception as e:
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+            print(f"{name:45s} ERROR: {type(e).__name__}: {e}")
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+def compare(current, baseline, tolerance):
+    """Return a list of (name, baseline, current, ratio) for every regression beyond tolerance."""
+    regressions = []
+    for name, result in current['results'].items():
+        reference = baseline['results'].get(name, {})
+        if 'seconds' not in result or 'seconds' not in reference:
+            continue
+        ratio = result['seconds'] / reference['seconds']
+        if ratio > 1 + tolerance:
+            regressions.append((name, reference['seconds'], result['seconds'], ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the physics functions and headless frame rendering.")
+    parser.add_argument('--output', default='bench_results.json', help="where to write this run's results")
+    parser.add_argument('--baseline', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json'))
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument('--filter', default=None, help="only run benchmarks whose name contains this text")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2, help="seconds per timed run")
+    args = parser.parse_args()
+
+    current = run_benchmarks(args.filter, args.repeat, args.min_time)
+    with open(args.output, 'w') as f:
+        json.dump(current, f, indent=2)
+
+    errors = [name for name, result in current['results'].items() if 'error' in result]
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.tolerance)
+        for name, before, after, ratio in regressions:
+            print(f"REGRESSION {name}: {before * 1e6:.2f} us -> {after * 1e6:.2f} us ({ratio:.2f}x)")
+        if regressions:
+            errors.extend(name for name, *_ in regressions)
+        else:
+            print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    else:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+
+    return 1 if errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
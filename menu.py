@@ -1,7 +1,13 @@
+import os
 import pygame
 import sys
 from pages.Static_Balance import main 
 
+# Rutas relativas al proyecto
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BASE_DIR, 'src'))
+from frameworks.scheduler import FrameScheduler
+
 # Inicializar Pygame
 pygame.init()
 
@@ -25,14 +31,24 @@ brightness = 100  # Nivel de brillo de la pantalla (0-100)
 sound_volume = 50  # Volumen del sonido (0-100)
 fullscreen = False  # Estado de pantalla completa
 
+# Los menús solo se redibujan cuando llega un evento (o unas pocas veces por segundo)
+scheduler = FrameScheduler()
+
 # Cargar la imagen de fondo
-background_image = pygame.image.load("C:/Users/carli/Documents/Proyectos/SimuladorCuerposEquilibrio/sources/img/log.png")  # Cambia por la ruta de tu imagen
+background_image = pygame.image.load(os.path.join(BASE_DIR, "assets", "img", "log.png"))
 background_image = pygame.transform.scale(background_image, (1300,750))  # Escala la imagen al tamaño de la ventana
 
-# Cargar música
-pygame.mixer.music.load("C:/Users/carli/Documents/Proyectos/SimuladorCuerposEquilibrio/sources/music/logr.mp3")  # Cambia por la ruta de tu archivo de música
-pygame.mixer.music.set_volume(sound_volume / 100)
-pygame.mixer.music.play(-1)  # Reproducir en bucle (-1)
+# Cargar música (opcional: el archivo no se distribuye con el proyecto)
+MUSIC_PATH = os.path.join(BASE_DIR, "assets", "music", "logr.mp3")
+music_loaded = False
+if os.path.exists(MUSIC_PATH):
+    try:
+        pygame.mixer.music.load(MUSIC_PATH)
+        pygame.mixer.music.set_volume(sound_volume / 100)
+        pygame.mixer.music.play(-1)  # Reproducir en bucle (-1)
+        music_loaded = True
+    except pygame.error as e:
+        print("No se pudo reproducir la música:", e)
 
 # Función para dibujar texto
 def draw_text(text, font, color, surface, x, y):
@@ -75,7 +91,8 @@ def adjust_sound():
     sound_volume = (sound_volume + 10) % 110
     if sound_volume == 0:
         sound_volume = 10
-    pygame.mixer.music.set_volume(sound_volume / 100)
+    if music_loaded:
+        pygame.mixer.music.set_volume(sound_volume / 100)
 
 # Función para alternar pantalla completa
 def toggle_fullscreen():
@@ -120,12 +137,12 @@ def show_options():
         button(button_x, button_height_start + 2 * button_spacing, button_width, button_height, GRAY, "Pantalla Completa", button_font, WHITE, toggle_fullscreen)
         button(button_x, button_height_start + 3 * button_spacing, button_width, button_height, GRAY, "Regresar", button_font, WHITE, return_to_menu)
 
+        pygame.display.update()
+        
         # Manejo de eventos
-        for event in pygame.event.get():
+        for event in scheduler.next_frame(pygame.mouse.get_pressed()[0]):
             if event.type == pygame.QUIT:
                 running = False
-        
-        pygame.display.update()
 
 # Función principal del menú
 def main_menu():
@@ -143,11 +160,11 @@ def main_menu():
         button(button_x, 400, 400, 50, GRAY, "Opciones", button_font, WHITE, show_options)
         button(button_x, 500, 400, 50, GRAY, "Salir", button_font, WHITE, salir)
         
-        for event in pygame.event.get():
+        pygame.display.update()
+        
+        for event in scheduler.next_frame(pygame.mouse.get_pressed()[0]):
             if event.type == pygame.QUIT:
                 running = False
-        
-        pygame.display.update()
 
     pygame.quit()
     sys.exit()
@@ -1,8 +1,25 @@
+import os
 import pygame
 
-# Window dimensions
+# Window dimensions (the logical resolution every layout is written for)
 WIDTH = 1350
 HEIGHT = 840
+# Render at WIDTH x HEIGHT and let SDL scale the frame to the window in one pass.
+# None: only when the desktop is smaller than WIDTH x HEIGHT, so the window still
+# fits on a 1280x720 screen. A scaled window uploads and draws its whole texture
+# on every display.update(), so the dirty rects stop saving anything (two small
+# rects cost the same ~1.8 ms as a full flip, against ~0.04 ms unscaled); where
+# the window fits it is left unscaled. True/False force it on or off.
+DISPLAY_SCALED = None
+
+# Frame pacing (FrameScheduler): full rate while something moves, event-driven when idle
+ACTIVE_FPS = 90
+IDLE_FPS = 4  # wake-ups per second with nothing happening; 0 sleeps until the next event
+IDLE_LINGER_MS = 250  # keep the full rate this long after the last activity
+
+# Input: a held key repeats as KEYDOWN events (arrow keys, backspace)
+KEY_REPEAT_DELAY = 300  # ms before the first repeat
+KEY_REPEAT_INTERVAL = 30  # ms between repeats
 
 # Colors
 WHITE = (255, 255, 255)
@@ -10,16 +27,72 @@ BLACK = (0, 0, 0)
 GREEN = (0, 255, 0)
 BLUE = (0, 71, 125)
 RED = ()
+ROW_COLORKEY = (255, 0, 255)  # transparent margin of the cached history rows
 
 # Physics constants
 GRAVITY = 9.81
 
-# Image paths
-ROTACION_IMAGE_PATH = 'C:/Users/carli/Documents/Proyectos/SimuladorCuerposEquilibrioNew/assets/img/Giro.png'
-PESO_IMAGE_PATH = 'C:/Users/carli/Documents/Proyectos/SimuladorCuerposEquilibrioNew/assets/img/Peso.png'
-POLEA_IMAGE_PATH = 'C:/Users/carli/Documents/Proyectos/SimuladorCuerposEquilibrioNew/assets/img/Poleas2.png'
-ROPE_IMAGE_PATH = 'C:/Users/carli/Documents/Proyectos/SimuladorCuerposEquilibrioNew/assets/img/1.png'
-FONDO_IMAGE_PATH = 'C:/Users/carli/Documents/Proyectos/SimuladorCuerposEquilibrioNew/assets/img/Fondo3.png'
+# Dynamic mode
+DYNAMIC_TIMESTEP = 1 / 240  # seconds per integration step
+ROPE_STATIC_STRETCH = 0.05  # metres a rope stretches under its static load
+DAMPING_RATIO = 0.08
+PIXELS_PER_METER = 200
+
+# Rope sprite cache (GraphicsManager.draw_rope)
+# Coarse enough that consecutive frames of a weight drag share sprites.
+# The sprite is centred on the rope's midpoint, so rounding the length moves
+# each end up to 1 px along the rope, and rounding the angle moves each end
+# up to (length / 2) * sin(0.5°) ≈ 0.0044 * length sideways: 2 px for a
+# 450 px rope, 4 px for a 900 px one.
+ROPE_LENGTH_STEP = 4  # pixels
+ROPE_ANGLE_STEP = 1  # degrees
+ROPE_CACHE_MAX_ITEMS = 512
+ROPE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Rendered text cache (GraphicsManager.render_text)
+TEXT_CACHE_MAX_ITEMS = 2048
+TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Image paths (relative to the project, so the simulator runs from any checkout)
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+IMG_DIR = os.path.join(BASE_DIR, 'assets', 'img')
+ROTACION_IMAGE_PATH = os.path.join(IMG_DIR, 'Giro.png')
+PESO_IMAGE_PATH = os.path.join(IMG_DIR, 'Peso.png')
+POLEA_IMAGE_PATH = os.path.join(IMG_DIR, 'Poleas2.png')
+ROPE_IMAGE_PATH = os.path.join(IMG_DIR, '1.png')
+FONDO_IMAGE_PATH = os.path.join(IMG_DIR, 'Fondo3.png')
+
+# Scaled images baked into the asset pack: name -> (source, size, has alpha)
+ASSET_PACK_PATH = os.path.join(BASE_DIR, 'assets', 'assets.pack')
+ASSET_SPECS = {
+    'rotacion': (ROTACION_IMAGE_PATH, (90, 70), True),
+    'peso': (PESO_IMAGE_PATH, (520, 450), True),
+    'polea': (POLEA_IMAGE_PATH, (200, 140), True),
+    'rope': (ROPE_IMAGE_PATH, (420, 420), True),
+    'fondo': (FONDO_IMAGE_PATH, (1610, 1000), False),
+}
+
+# Frame profiler (F3 shows the overlay, F4 exports the recorded frames)
+PROFILER_ENABLED = False
+PROFILER_WINDOW = 600  # frames kept for the rolling percentiles and exports
+PROFILER_OVERLAY_INTERVAL = 0.25  # seconds between recomputing the overlay's percentiles
+PROFILE_DIR = os.path.join(BASE_DIR, 'profiles')
+
+# Backend
+STORAGE_BACKEND = 'http'  # 'http' for the Node backend, 'sqlite' for the embedded store (no server needed)
+LOCAL_DB_PATH = os.path.join(BASE_DIR, 'simulations.db')
+API_URL = 'http://localhost:5000/api/simulations'
+HISTORY_TTL = 30  # seconds before the cached history is refetched
+HISTORY_PAGE_SIZE = 50  # simulations per history request
+HISTORY_CACHED_PAGES = 16  # pages whose ETag and rows the history client keeps for conditional requests
+HISTORY_PREFETCH_ROWS = 20  # load the next page when scrolling gets this close to the last loaded row
+
+# Background save queue (SaveQueue)
+SAVE_JOURNAL_PATH = os.path.join(BASE_DIR, 'pending_saves.json')  # unsent saves survive a restart
+SAVE_BATCH_SIZE = 50
+SAVE_BATCH_WINDOW = 0.25  # seconds to wait for more saves before sending a burst
+SAVE_RETRY_DELAY = 1  # seconds, doubled after every failure
+SAVE_MAX_RETRY_DELAY = 60
 
 # Initial values
 INITIAL_WEIGHT = 100
@@ -12,10 +12,41 @@ exports.saveSimulation = async (req, res) => {
     }
 };
 
-// Obtener todas las simulaciones
+// Guardar varias simulaciones en una sola petición
+exports.saveSimulations = async (req, res) => {
+    try {
+        if (!Array.isArray(req.body) || req.body.length === 0) {
+            return res.status(400).json({ message: 'Se esperaba una lista de simulaciones' });
+        }
+        const docs = req.body.map(({ weight, theta1, theta2, tension1, tension2 }) =>
+            ({ weight, theta1, theta2, tension1, tension2 }));
+        const simulations = await Simulation.insertMany(docs);
+        res.status(201).json(simulations);
+    } catch (error) {
+        if (error.name === 'ValidationError') {
+            return res.status(400).json({ message: 'Simulación inválida', error });
+        }
+        res.status(500).json({ message: 'Error guardando las simulaciones', error });
+    }
+};
+
+// Obtener las simulaciones, de la más reciente a la más antigua.
+// Con ?limit=N&offset=M se devuelve solo esa página y el total va en X-Total-Count;
+// Express añade el ETag y responde 304 si la página no cambió (If-None-Match).
+// El _id desempata las simulaciones guardadas juntas (mismo createdAt), así las páginas no se solapan.
 exports.getSimulations = async (req, res) => {
     try {
-        const simulations = await Simulation.find().sort({ createdAt: -1 });
+        const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 0, 0), 500);
+        const offset = Math.max(parseInt(req.query.offset, 10) || 0, 0);
+        let query = Simulation.find().sort({ createdAt: -1, _id: -1 });
+        if (limit > 0) {
+            query = query.skip(offset).limit(limit);
+            // El total sale de los metadatos de la colección: no recorre el índice en cada página
+            const [simulations, total] = await Promise.all([query, Simulation.estimatedDocumentCount()]);
+            res.set('X-Total-Count', String(total));
+            return res.status(200).json(simulations);
+        }
+        const simulations = await query;
         res.status(200).json(simulations);
     } catch (error) {
         res.status(500).json({ message: 'Error obteniendo las simulaciones', error });
@@ -0,0 +1,98 @@
+import math
+import numpy as np
+from config.constant import GRAVITY, DYNAMIC_TIMESTEP, ROPE_STATIC_STRETCH, DAMPING_RATIO
+from frameworks.physic import calculate_tensions_batch
+
+class SwingBatch:
+    """Fixed-timestep simulation of many bodies swinging into static equilibrium.
+
+    Each body hangs from two elastic ropes at theta1/theta2 from the vertical.
+    Both ropes have the same stiffness, weight / static_stretch newtons per
+    metre: stretching a rope by static_stretch adds one body weight to its
+    static tension, whatever that tension is. The natural frequency is then
+    sqrt(GRAVITY / static_stretch) for every weight. Offsets are in metres
+    from the equilibrium given by calculate_tensions, in screen orientation
+    (y grows downwards).
+    """
+
+    def __init__(self, weight, theta1, theta2, offset_x=0.0, offset_y=0.0, velocity_x=0.0, velocity_y=0.0,
+                 dt=DYNAMIC_TIMESTEP, static_stretch=ROPE_STATIC_STRETCH, damping_ratio=DAMPING_RATIO):
+        weight, theta1, theta2, offset_x, offset_y, velocity_x, velocity_y = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(value, dtype=np.float64))
+              for value in (weight, theta1, theta2, offset_x, offset_y, velocity_x, velocity_y)))
+
+        self.dt = dt
+        self.static_stretch = static_stretch
+        self.weight = weight.copy()
+        self.x = offset_x.copy()
+        self.y = offset_y.copy()
+        self.vx = velocity_x.copy()
+        self.vy = velocity_y.copy()
+        self.time = 0.0
+
+        # Per-newton static tensions and rope directions (body towards anchor)
+        self.static_t1, self.static_t2 = calculate_tensions_batch(1.0, theta1, theta2)
+        theta1_rad = np.radians(theta1)
+        theta2_rad = np.radians(theta2)
+        self.u1x = -np.sin(theta1_rad)
+        self.u1y = -np.cos(theta1_rad)
+        self.u2x = np.sin(theta2_rad)
+        self.u2y = -np.cos(theta2_rad)
+
+        # Stiffness scales with weight, so everything per unit mass is weight independent
+        omega = math.sqrt(GRAVITY / static_stretch)
+        self.damping = 2 * damping_ratio * omega
+
+        self.t1, self.t2 = self._tension_factors()
+        self.peak_t1 = self.t1.copy()
+        self.peak_t2 = self.t2.copy()
+        self.ax = np.zeros_like(self.x)
+        self.ay = np.zeros_like(self.y)
+
+    def _tension_factors(self):
+        """Current per-newton rope tensions; a rope never pushes."""
+        stretch1 = -(self.u1x * self.x + self.u1y * self.y)
+        stretch2 = -(self.u2x * self.x + self.u2y * self.y)
+        t1 = np.maximum(self.static_t1 + stretch1 / self.static_stretch, 0.0)
+        t2 = np.maximum(self.static_t2 + stretch2 / self.static_stretch, 0.0)
+        return t1, t2
+
+    def step(self, steps=1):
+        """Advance every body by a number of fixed timesteps (semi-implicit Euler)."""
+        dt = self.dt
+        for _ in range(steps):
+            t1, t2 = self._tension_factors()
+            self.ax = GRAVITY * (t1 * self.u1x + t2 * self.u2x) - self.damping * self.vx
+            self.ay = GRAVITY * (t1 * self.u1y + t2 * self.u2y + 1.0) - self.damping * self.vy
+            self.vx += self.ax * dt
+            self.vy += self.ay * dt
+            self.x += self.vx * dt
+            self.y += self.vy * dt
+            np.maximum(self.peak_t1, t1, out=self.peak_t1)
+            np.maximum(self.peak_t2, t2, out=self.peak_t2)
+        self.t1, self.t2 = self._tension_factors()
+        self.time += steps * dt
+
+    def settled(self, tolerance=1e-4):
+        """Boolean array of bodies that are (numerically) at rest."""
+        speed = np.hypot(self.vx, self.vy)
+        acceleration = np.hypot(self.ax, self.ay)
+        return (speed < tolerance) & (acceleration < tolerance * math.sqrt(GRAVITY / self.static_stretch))
+
+    def run_until_settled(self, tolerance=1e-4, max_time=60.0, chunk=240):
+        """Step until every body has settled or max_time has passed. Returns True if all settled."""
+        while self.time < max_time:
+            self.step(chunk)
+            if self.settled(tolerance).all():
+                return True
+        return False
+
+    @property
+    def tensions(self):
+        """Current rope tensions in newtons."""
+        return self.weight * self.t1, self.weight * self.t2
+
+    @property
+    def peak_tensions(self):
+        """Largest rope tensions seen so far, in newtons."""
+        return self.weight * self.peak_t1, self.weight * self.peak_t2
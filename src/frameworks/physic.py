@@ -1,4 +1,5 @@
 import math
+import numpy as np
 
 def calculate_tensions(weight, theta1, theta2):
     """Calculate tensions in the ropes."""
@@ -35,6 +36,66 @@ def calculate_body_position(anchor1_x, anchor2_x, anchor_y, T1, T2, theta1, thet
     
     return int(body_x), int(body_y)
 
+def _as_batch(*values):
+    """Broadcast scalars and array-likes to float64 arrays of a common shape."""
+    return np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in values))
+
+def calculate_tensions_batch(weight, theta1, theta2):
+    """Vectorized calculate_tensions over arrays of weights and angles."""
+    weight, theta1, theta2 = _as_batch(weight, theta1, theta2)
+    theta1_rad = np.radians(theta1)
+    theta2_rad = np.radians(theta2)
+
+    denominator = np.sin(theta1_rad + theta2_rad)
+    valid = denominator != 0
+
+    # Same as the scalar version: a zero denominator gives (0, 0)
+    T2 = np.divide(weight * np.sin(theta1_rad), denominator, out=np.zeros_like(denominator), where=valid)
+    T1 = np.divide(weight * np.sin(theta2_rad), denominator, out=np.zeros_like(denominator), where=valid)
+
+    return T1, T2
+
+def solution_batch(weight, theta1, theta2, strict=True):
+    """Vectorized solution over arrays of weights and angles.
+
+    Like the scalar version, a zero denominator raises ZeroDivisionError.
+    With strict=False those entries are returned as NaN instead.
+    """
+    weight, theta1, theta2 = _as_batch(weight, theta1, theta2)
+    theta1_rad = np.radians(theta1)
+    theta2_rad = np.radians(theta2)
+    denominator22 = np.sin(theta2_rad) + np.cos(theta2_rad) * np.tan(theta1_rad)
+    denominator11 = np.sin(theta1_rad) + np.cos(theta1_rad) * np.tan(theta2_rad)
+
+    valid11 = denominator11 != 0
+    valid22 = denominator22 != 0
+    if strict and not (valid11.all() and valid22.all()):
+        raise ZeroDivisionError("float division by zero")
+
+    T22 = np.divide(weight, denominator22, out=np.full_like(denominator22, np.nan), where=valid22)
+    T11 = np.divide(weight, denominator11, out=np.full_like(denominator11, np.nan), where=valid11)
+
+    return T11, T22
+
+def calculate_body_position_batch(anchor1_x, anchor2_x, anchor_y, T1, T2, theta1, theta2):
+    """Vectorized calculate_body_position; returns integer arrays of x and y."""
+    anchor1_x, anchor2_x, anchor_y, T1, T2, theta1, theta2 = _as_batch(
+        anchor1_x, anchor2_x, anchor_y, T1, T2, theta1, theta2)
+    cos1 = np.cos(np.radians(theta1))
+    cos2 = np.cos(np.radians(theta2))
+    denominator = (T1 * cos1 + T2 * cos2)
+    valid = denominator != 0
+
+    body_x = np.divide(T2 * cos2 * anchor1_x + T1 * cos1 * anchor2_x, denominator,
+                       out=np.zeros_like(denominator), where=valid)
+    body_y = anchor_y + T1 * np.sin(np.radians(theta1))
+
+    # Degenerate entries fall back to the first anchor, like the scalar version
+    body_x = np.where(valid, np.trunc(body_x), anchor1_x).astype(np.int64)
+    body_y = np.where(valid, np.trunc(body_y), anchor_y).astype(np.int64)
+
+    return body_x, body_y
+
 def conversor(kg):
     """Convert kilograms to Newtons."""
     return kg * 9.81
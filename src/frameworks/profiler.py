@@ -0,0 +1,136 @@
+import json
+import time
+from collections import deque
+import numpy as np
+
+class _NullStage:
+    """Context manager that does nothing; handed out while profiling is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_STAGE = _NullStage()
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+class FrameProfiler:
+    """Per-stage frame timings over a rolling window of frames.
+
+    Wrap each stage in `with profiler.stage(name):` and bracket the frame
+    with begin_frame/end_frame. While disabled, stage() returns a shared
+    no-op context and nothing is recorded.
+    """
+
+    def __init__(self, enabled=False, window=600):
+        self.enabled = enabled
+        self.always_on = enabled
+        self.window = window
+        self.overlay_visible = False
+        self.samples = {}
+        self.frames = deque(maxlen=window)
+        self.frame_index = 0
+        self._origin = time.perf_counter()
+        self._frame_start = None
+        self._frame_stages = None
+        self._summary = None
+        self._summary_at = None
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay; profiling runs while it is shown."""
+        self.overlay_visible = not self.overlay_visible
+        self.enabled = self.overlay_visible or self.always_on
+
+    def stage(self, name):
+        if not self.enabled:
+            return NULL_STAGE
+        return _Stage(self, name)
+
+    def begin_frame(self):
+        if not self.enabled:
+            self._frame_stages = None
+            return
+        self._frame_start = time.perf_counter()
+        self._frame_stages = []
+
+    def end_frame(self):
+        if self._frame_stages is None:
+            return
+        duration = time.perf_counter() - self._frame_start
+        self._add_sample('frame', duration)
+        self.frames.append((self.frame_index, self._frame_start - self._origin, duration, self._frame_stages))
+        self.frame_index += 1
+        self._frame_stages = None
+
+    def _record(self, name, start, duration):
+        self._add_sample(name, duration)
+        if self._frame_stages is not None:
+            self._frame_stages.append((name, start - self._origin, duration))
+
+    def _add_sample(self, name, duration):
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        samples.append(duration * 1000)
+
+    def percentiles(self, name, quantiles=(50, 95, 99)):
+        """Return the given percentiles of a stage in milliseconds, or None before any sample."""
+        samples = self.samples.get(name)
+        if not samples:
+            return None
+        return tuple(float(value) for value in np.percentile(np.fromiter(samples, float), quantiles))
+
+    def summary(self):
+        """{stage: {'p50', 'p95', 'p99', 'count'}} over the rolling window, in milliseconds."""
+        result = {}
+        for name, samples in self.samples.items():
+            p50, p95, p99 = self.percentiles(name)
+            result[name] = {'p50': p50, 'p95': p95, 'p99': p99, 'count': len(samples)}
+        return result
+
+    def recent_summary(self, max_age):
+        """summary(), recomputed at most once every max_age seconds; for the overlay, which asks every frame."""
+        now = time.monotonic()
+        if self._summary is None or now - self._summary_at >= max_age:
+            self._summary = self.summary()
+            self._summary_at = now
+        return self._summary
+
+    def export_jsonl(self, path):
+        """Write one JSON object per recorded frame with the time spent in each stage."""
+        with open(path, 'w') as f:
+            for index, start, duration, stages in self.frames:
+                totals = {}
+                for name, _, stage_duration in stages:
+                    totals[name] = totals.get(name, 0.0) + stage_duration * 1000
+                f.write(json.dumps({'frame': index, 'start_ms': start * 1000,
+                                    'total_ms': duration * 1000, 'stages': totals}) + '\n')
+
+    def export_chrome_trace(self, path):
+        """Write the recorded frames in Chrome trace format (chrome://tracing, Perfetto)."""
+        events = []
+        for index, start, duration, stages in self.frames:
+            events.append(_trace_event('frame', start, duration, index))
+            events.extend(_trace_event(name, stage_start, stage_duration, index)
+                          for name, stage_start, stage_duration in stages)
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+def _trace_event(name, start, duration, frame):
+    return {'name': name, 'ph': 'X', 'ts': start * 1e6, 'dur': duration * 1e6,
+            'pid': 1, 'tid': 1, 'args': {'frame': frame}}
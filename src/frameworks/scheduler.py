@@ -0,0 +1,39 @@
+import pygame
+from config.constant import ACTIVE_FPS, IDLE_FPS, IDLE_LINGER_MS
+
+class FrameScheduler:
+    """Paces a pygame loop: full frame rate while something moves, asleep otherwise.
+
+    While active, frames are capped at active_fps. Once nothing has been
+    active for linger_ms, the loop blocks in pygame.event.wait until an
+    event arrives, waking at most idle_fps times a second (0 sleeps until
+    the next event).
+    """
+
+    def __init__(self, active_fps=ACTIVE_FPS, idle_fps=IDLE_FPS, linger_ms=IDLE_LINGER_MS):
+        self.clock = pygame.time.Clock()
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.linger_ms = linger_ms
+        self.idle = False
+        self._last_active = pygame.time.get_ticks()
+
+    def next_frame(self, active):
+        """Wait until the next frame is due and return the events to handle in it."""
+        now = pygame.time.get_ticks()
+        if active:
+            self._last_active = now
+
+        # Keep the full rate a little longer so transitions and key repeats start smoothly
+        self.idle = now - self._last_active >= self.linger_ms
+        if not self.idle:
+            self.clock.tick(self.active_fps)
+            return pygame.event.get()
+
+        timeout = int(1000 / self.idle_fps) if self.idle_fps else 0
+        first = pygame.event.wait(timeout)
+        self.clock.tick()
+        if first.type == pygame.NOEVENT:
+            return pygame.event.get()
+        self._last_active = pygame.time.get_ticks()
+        return [first] + pygame.event.get()
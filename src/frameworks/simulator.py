@@ -1,24 +1,54 @@
+import os
+import time
 import pygame
 import subprocess
 from config.constant import *
-from core.physic import calculate_tensions, solution, calculate_body_position
+from frameworks.tension_table import get_tension_table
+from frameworks.dynamics import SwingBatch
+from frameworks.state import StateManager
+from frameworks.scheduler import FrameScheduler
+from frameworks.profiler import FrameProfiler
 from interfaces.graphicInterface import GraphicsManager
+from interfaces.graphWorker import GraphWorker
+from interfaces.saveQueue import SaveQueue
+from interfaces.localStore import LocalStore
+from interfaces.historyCache import HistoryCache
 from interfaces.uiInterface import UI
 
+def use_scaled_display(setting, desktop_sizes):
+    """Whether to open a scaled window: as configured, or when the first desktop cannot hold WIDTH x HEIGHT."""
+    if setting is not None:
+        return setting
+    if not desktop_sizes:
+        return False
+    desktop_width, desktop_height = desktop_sizes[0]
+    return desktop_width < WIDTH or desktop_height < HEIGHT
+
 class PhysicsSimulator:
     def __init__(self):
         pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+        self.screen = self._create_window()
         pygame.display.set_caption("Simulador de Cuerpos en Equilibrio")
-        
-        self.graphics = GraphicsManager()
-        self.ui = UI(self.graphics)
-        self.clock = pygame.time.Clock()
+        pygame.key.set_repeat(KEY_REPEAT_DELAY, KEY_REPEAT_INTERVAL)
         
         # Simulation state
-        self.weight = INITIAL_WEIGHT
-        self.theta1 = INITIAL_THETA1
-        self.theta2 = INITIAL_THETA2
+        self.state_manager = StateManager()
+        
+        self.graphics = GraphicsManager()
+        # The force diagram is rendered off the main loop, by a process started when the graph is first opened
+        self.graph_worker = GraphWorker()
+        self.profiler = FrameProfiler(PROFILER_ENABLED, PROFILER_WINDOW)
+        if STORAGE_BACKEND == 'sqlite':
+            # Embedded store: saves and history stay on this machine, no server needed
+            self.save_queue = LocalStore()
+            history = HistoryCache(client=self.save_queue)
+        else:
+            self.save_queue = SaveQueue()
+            history = HistoryCache()
+        self.ui = UI(self.graphics, self.state_manager, self.graph_worker, self.profiler, self.save_queue, history)
+        self.save_queue.on_saved = self.ui.history.invalidate
+        self.scheduler = FrameScheduler()
+        self.clock = self.scheduler.clock
         
         # Drag state
         self.dragging = False
@@ -26,17 +56,37 @@ class PhysicsSimulator:
         self.drag_start_y = 0
         self.start_weight = INITIAL_WEIGHT
         
-        # Change flags
-        self.peso_cambiado = False
-        self.theta1_cambiado = False
-        self.theta2_cambiado = False
+        # Dynamic mode
+        self.dynamic_mode = False
+        self.swing = None
+        self.swing_version = None
+        self.swing_equilibrium = None
+        self.time_accumulator = 0.0
+
+    def _create_window(self):
+        """Open the window; when scaled, resizing it never changes the logical resolution."""
+        if use_scaled_display(DISPLAY_SCALED, pygame.display.get_desktop_sizes()):
+            try:
+                return pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.RESIZABLE)
+            except pygame.error as e:
+                print("Escalado no disponible, se usa la ventana sin escalar:", e)
+        return pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
 
-    def handle_events(self):
+    def handle_events(self, events=None):
         """Handle all pygame events."""
-        for event in pygame.event.get():
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 return False
-                
+            
+            # The window contents are gone or have a new size: redraw everything
+            if event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWSIZECHANGED, pygame.WINDOWEXPOSED):
+                self.screen = pygame.display.get_surface()
+                self.graphics.ensure_display_format()
+                self.ui.invalidate_layers()
+            
+            # Clicks, scrolling and typing on the UI's widgets stop here
+            if self.ui.handle_event(event):
+                continue
             self._handle_mouse_events(event)
             self._handle_keyboard_events(event)
             
@@ -52,88 +102,91 @@ class PhysicsSimulator:
             self._handle_mouse_drag(event)
 
     def _handle_mouse_down(self, event):
-        """Handle mouse button down events."""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Converter button
-        if pygame.Rect(40, HEIGHT - 22, 180, 40).collidepoint(mouse_pos):
-            self.ui.conversor_visible = not self.ui.conversor_visible
-        
-        # Graph button
-        elif pygame.Rect(240, HEIGHT - 22, 180, 40).collidepoint(mouse_pos):
-            self._toggle_graph()
-        
-        
-        # Convert button in converter
-        elif self.ui.conversor_visible:
-            convert_button = pygame.Rect(65, 680, 300, 40)
-            input_field = pygame.Rect(65, 630, 300, 45)
-            
-            if convert_button.collidepoint(mouse_pos):
-                try:
-                    value = float(self.ui.text)
-                    self.ui.result_conversion = value * GRAVITY
-                except ValueError:
-                    print("Please enter a valid number")
-            elif input_field.collidepoint(mouse_pos):
-                self.ui.active = True
-            else:
-                self.ui.active = False
-        
-        # Handle weight dragging
-        else:
-            self.dragging = True
-            self.drag_start_x, self.drag_start_y = mouse_pos
-            self.start_weight = self.weight
+        """A click that no widget took starts dragging the weight."""
+        self.dragging = True
+        self.drag_start_x, self.drag_start_y = event.pos
+        self.start_weight = self.state_manager.weight
 
     def _handle_mouse_drag(self, event):
         """Handle mouse drag events."""
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = event.pos
         delta_y = mouse_y - self.drag_start_y
         
         # Update weight based on drag
-        self.weight = max(0, self.start_weight + delta_y * 2)
-        self.peso_cambiado = True
+        self.state_manager.update_state(weight=max(0, self.start_weight + delta_y * 2))
 
     def _handle_keyboard_events(self, event):
-        """Handle keyboard events."""
-        if event.type == pygame.KEYDOWN:
-            if self.ui.active:
-                if event.key == pygame.K_RETURN:
-                    try:
-                        value = float(self.ui.text)
-                        self.ui.result_conversion = value * GRAVITY
-                    except ValueError:
-                        print("Please enter a valid number")
-                elif event.key == pygame.K_BACKSPACE:
-                    self.ui.text = self.ui.text[:-1]
-                else:
-                    # Only allow numbers and decimal point
-                    if event.unicode.isnumeric() or event.unicode == '.':
-                        self.ui.text += event.unicode
-        
+        """Handle keyboard events; held arrow keys arrive as repeated KEYDOWNs."""
+        if event.type != pygame.KEYDOWN:
+            return
+        state = self.state_manager
+        if event.key == pygame.K_d:
+            self._toggle_dynamic_mode()
+        elif event.key == pygame.K_F3:
+            self.profiler.toggle_overlay()
+        elif event.key == pygame.K_F4:
+            self._export_profile()
         # Handle angle adjustments
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
-            self.theta1 = max(0, self.theta1 - 1)
-            self.theta1_cambiado = True
-        if keys[pygame.K_RIGHT]:
-            self.theta1 = min(90, self.theta1 + 1)
-            self.theta1_cambiado = True
-        if keys[pygame.K_UP]:
-            self.theta2 = max(0, self.theta2 - 1)
-            self.theta2_cambiado = True
-        if keys[pygame.K_DOWN]:
-            self.theta2 = min(90, self.theta2 + 1)
-            self.theta2_cambiado = True
-
-    def _toggle_graph(self):
-        """Toggle the force diagram graph."""
-        self.ui.mostrar_grafico = not self.ui.mostrar_grafico
-        if self.ui.mostrar_grafico:
-            T1, T2 = calculate_tensions(self.weight, self.theta1, self.theta2)
-            self.ui.superficie_grafico = self.graphics.create_graph(
-                self.weight, self.theta1, self.theta2, T1, T2)
+        elif event.key == pygame.K_LEFT:
+            state.update_state(theta1=max(0, state.theta1 - 1))
+        elif event.key == pygame.K_RIGHT:
+            state.update_state(theta1=min(90, state.theta1 + 1))
+        elif event.key == pygame.K_UP:
+            state.update_state(theta2=max(0, state.theta2 - 1))
+        elif event.key == pygame.K_DOWN:
+            state.update_state(theta2=min(90, state.theta2 + 1))
+
+    def _toggle_dynamic_mode(self):
+        """Switch between the static answer and the swinging body."""
+        self.dynamic_mode = not self.dynamic_mode
+        self.swing = None
+        self.time_accumulator = 0.0
+        self.ui.body_offset = (0, 0)
+        self.ui.peak_tensions = None
+
+    def _export_profile(self):
+        """Write the recorded frames as JSONL and as a Chrome trace."""
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, time.strftime('profile_%Y%m%d_%H%M%S'))
+        self.profiler.export_jsonl(base + '.jsonl')
+        self.profiler.export_chrome_trace(base + '.trace.json')
+        print(f"Perfil exportado a {base}.jsonl y {base}.trace.json")
+
+    def _restart_swing(self):
+        """Start a new swing towards the current equilibrium, keeping the body where it is."""
+        state = self.state_manager
+        anchor1_x, anchor2_x, anchor_y = self.ui.anchors()
+        body_x, body_y = get_tension_table().body_position(
+            anchor1_x, anchor2_x, anchor_y, state.weight, state.theta1, state.theta2)
+        
+        offset_x = offset_y = velocity_x = velocity_y = 0.0
+        if self.swing is not None:
+            old_x, old_y = self.swing_equilibrium
+            offset_x = self.swing.x[0] + (old_x - body_x) / PIXELS_PER_METER
+            offset_y = self.swing.y[0] + (old_y - body_y) / PIXELS_PER_METER
+            velocity_x = self.swing.vx[0]
+            velocity_y = self.swing.vy[0]
+        
+        self.swing = SwingBatch(state.weight, state.theta1, state.theta2,
+                                offset_x, offset_y, velocity_x, velocity_y)
+        self.swing_version = state.version
+        self.swing_equilibrium = (body_x, body_y)
+
+    def _update_dynamics(self):
+        """Advance the swinging body by whole fixed timesteps of elapsed frame time."""
+        if self.swing is None or self.swing_version != self.state_manager.version:
+            self._restart_swing()
+        
+        # Cap the backlog so a stalled frame does not trigger a burst of steps
+        self.time_accumulator = min(self.time_accumulator + self.clock.get_time() / 1000, 0.25)
+        steps = int(self.time_accumulator / self.swing.dt)
+        if steps:
+            self.swing.step(steps)
+            self.time_accumulator -= steps * self.swing.dt
+        
+        self.ui.body_offset = (float(self.swing.x[0]) * PIXELS_PER_METER, float(self.swing.y[0]) * PIXELS_PER_METER)
+        peak1, peak2 = self.swing.peak_tensions
+        self.ui.peak_tensions = (float(peak1[0]), float(peak2[0]))
 
     #def _return_to_menu(self):
         """Return to the main menu."""
@@ -142,31 +195,47 @@ class PhysicsSimulator:
 
     def update(self):
         """Update simulation state."""
-        if self.ui.mostrar_grafico and (self.peso_cambiado or self.theta1_cambiado or self.theta2_cambiado):
-            T1, T2 = calculate_tensions(self.weight, self.theta1, self.theta2)
-            self.ui.superficie_grafico = self.graphics.create_graph(
-                self.weight, self.theta1, self.theta2, T1, T2)
-            
-            # Reset change flags
-            self.peso_cambiado = False
-            self.theta1_cambiado = False
-            self.theta2_cambiado = False
-            
-            """Update simulation state."""
-            state = self.state_manager.get_state()
-            # Update logic here
-            self.state_manager.update_state(state)
+        if self.dynamic_mode:
+            with self.profiler.stage('physics'):
+                self._update_dynamics()
+        
+        # Request a new force diagram after a change and pick up finished ones
+        if self.ui.mostrar_grafico:
+            with self.profiler.stage('graph'):
+                self.ui.update_graph()
 
     def render(self):
-        """Render the current frame."""
-        self.ui.draw_scene(self.screen, self.weight, self.theta1, self.theta2)
-        pygame.display.flip()
+        """Render the current frame, pushing only the rects that changed."""
+        with self.profiler.stage('draw'):
+            dirty_rects = self.ui.draw_scene(self.screen)
+        if dirty_rects:
+            with self.profiler.stage('display'):
+                pygame.display.update(dirty_rects)
+
+    def is_active(self):
+        """True while something is moving and the loop should run at full frame rate."""
+        keys = pygame.key.get_pressed()
+        return (self.dragging
+                or self.ui.scene_changed
+                or any(keys[key] for key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN))
+                or pygame.mouse.get_pressed()[0]
+                or (self.dynamic_mode and (self.swing is None or not self.swing.settled().all()))
+                or (self.ui.mostrar_grafico and self.graph_worker.busy))
 
     def run(self):
         """Main simulation loop."""
         running = True
+        profiler = self.profiler
         while running:
-            running = self.handle_events()
-            self.update()
+            events = self.scheduler.next_frame(self.is_active())
+            # Time spent waiting for the next frame is not part of the frame
+            profiler.begin_frame()
+            with profiler.stage('events'):
+                running = self.handle_events(events)
+            with profiler.stage('update'):
+                self.update()
             self.render()
-            self.clock.tick(90)
\ No newline at end of file
+            profiler.end_frame()
+        self.graph_worker.close()
+        self.save_queue.close()
+        self.ui.history.client.close()
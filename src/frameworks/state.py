@@ -0,0 +1,51 @@
+from config.constant import INITIAL_WEIGHT, INITIAL_THETA1, INITIAL_THETA2
+
+class StateManager:
+    """Weight and angles of the simulation, versioned for cheap change detection.
+
+    Every effective change bumps the version. Values derived from the state
+    (physics results, rendered labels, the force diagram) are cached with
+    the version they were computed for and only recomputed after a change.
+    """
+
+    def __init__(self, weight=INITIAL_WEIGHT, theta1=INITIAL_THETA1, theta2=INITIAL_THETA2):
+        self.weight = weight
+        self.theta1 = theta1
+        self.theta2 = theta2
+        self.version = 0
+        self._derived = {}
+
+    def get_state(self):
+        """Return the current parameters as a dict."""
+        return {'weight': self.weight, 'theta1': self.theta1, 'theta2': self.theta2}
+
+    def update_state(self, state=None, **changes):
+        """Apply new parameter values; the version only moves if something changed."""
+        if state:
+            changes = {**state, **changes}
+        changed = False
+        for name, value in changes.items():
+            if name not in ('weight', 'theta1', 'theta2'):
+                raise KeyError(name)
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed = True
+        if changed:
+            self.version += 1
+        return changed
+
+    def derived(self, key, compute):
+        """Return compute(), cached until the state version changes."""
+        entry = self._derived.get(key)
+        if entry is not None and entry[0] == self.version:
+            return entry[1]
+        value = compute()
+        self._derived[key] = (self.version, value)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one cached derived value (or all of them) regardless of the version."""
+        if key is None:
+            self._derived.clear()
+        else:
+            self._derived.pop(key, None)
@@ -0,0 +1,140 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from frameworks.physic import calculate_tensions_batch, solution_batch
+
+MANIFEST_NAME = 'manifest.json'
+COLUMNS = ('weight', 'theta1', 'theta2', 'tension1', 'tension2', 'solution1', 'solution2')
+
+class SweepGrid:
+    """Cartesian grid of weights and angles, addressed by a flat point index."""
+
+    def __init__(self, weights, theta1, theta2):
+        self.weights = np.asarray(weights, dtype=np.float64).ravel()
+        self.theta1 = np.asarray(theta1, dtype=np.float64).ravel()
+        self.theta2 = np.asarray(theta2, dtype=np.float64).ravel()
+        self.shape = (len(self.weights), len(self.theta1), len(self.theta2))
+        self.size = int(np.prod(self.shape))
+
+    @classmethod
+    def from_ranges(cls, weight_range, theta1_range, theta2_range):
+        """Build a grid from (start, stop, step) tuples; stop is inclusive."""
+        return cls(*(np.arange(start, stop + step / 2, step)
+                     for start, stop, step in (weight_range, theta1_range, theta2_range)))
+
+    def points(self, start, stop):
+        """Return weight, theta1 and theta2 arrays for flat indices [start, stop)."""
+        i, j, k = np.unravel_index(np.arange(start, stop), self.shape)
+        return self.weights[i], self.theta1[j], self.theta2[k]
+
+    def describe(self):
+        """JSON-friendly description used to check that a resumed sweep is the same grid."""
+        return {'weights': self.weights.tolist(), 'theta1': self.theta1.tolist(), 'theta2': self.theta2.tolist()}
+
+def evaluate_points(weight, theta1, theta2):
+    """Solve every point of a chunk; degenerate solution entries come back as NaN."""
+    T1, T2 = calculate_tensions_batch(weight, theta1, theta2)
+    T11, T22 = solution_batch(weight, theta1, theta2, strict=False)
+    return dict(zip(COLUMNS, (weight, theta1, theta2, T1, T2, T11, T22)))
+
+def shard_path(output_dir, index, fmt):
+    return os.path.join(output_dir, f'shard_{index:06d}.{fmt}')
+
+def _write_shard(path, columns, fmt):
+    """Write a shard atomically so an interrupted run never leaves a partial file behind."""
+    tmp_path = path + '.tmp'
+    if fmt == 'npz':
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **columns)
+    else:
+        data = np.column_stack([columns[name] for name in COLUMNS])
+        np.savetxt(tmp_path, data, delimiter=',', header=','.join(COLUMNS), comments='', fmt='%.17g')
+    os.replace(tmp_path, path)
+
+def _run_chunk(grid, index, start, stop, output_dir, fmt):
+    """Worker entry point: evaluate one chunk and stream it to its shard."""
+    columns = evaluate_points(*grid.points(start, stop))
+    _write_shard(shard_path(output_dir, index, fmt), columns, fmt)
+    return index, stop - start
+
+def _load_manifest(output_dir, manifest):
+    """Check a previous run in output_dir was the same sweep before resuming it."""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if os.path.exists(path):
+        with open(path) as f:
+            previous = json.load(f)
+        if previous != manifest:
+            raise ValueError(f"{output_dir} holds a different sweep; use a new output directory")
+        return
+    with open(path, 'w') as f:
+        json.dump(manifest, f)
+
+def print_progress(done, total, elapsed):
+    rate = done / elapsed if elapsed > 0 else 0
+    print(f"\r{done}/{total} points ({100 * done / total:.1f}%) {rate:,.0f} points/s", end='', flush=True)
+
+def run_sweep(grid, output_dir, chunk_size=1_000_000, fmt='npz', workers=None, progress=print_progress):
+    """Evaluate the grid across a process pool, one shard file per chunk.
+
+    Shards that already exist are skipped, so re-running the same sweep in
+    the same output directory resumes after an interruption. Returns the
+    number of points evaluated by this call.
+    """
+    if fmt not in ('npz', 'csv'):
+        raise ValueError("fmt must be 'npz' or 'csv'")
+    os.makedirs(output_dir, exist_ok=True)
+    _load_manifest(output_dir, {'grid': grid.describe(), 'chunk_size': chunk_size, 'format': fmt})
+
+    chunks = [(index, start, min(start + chunk_size, grid.size))
+              for index, start in enumerate(range(0, grid.size, chunk_size))]
+    pending = [chunk for chunk in chunks if not os.path.exists(shard_path(output_dir, chunk[0], fmt))]
+    done = grid.size - sum(stop - start for _, start, stop in pending)
+
+    start_time = time.perf_counter()
+    evaluated = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, grid, index, start, stop, output_dir, fmt)
+                   for index, start, stop in pending]
+        for future in as_completed(futures):
+            _, count = future.result()
+            evaluated += count
+            if progress:
+                progress(done + evaluated, grid.size, time.perf_counter() - start_time)
+    if progress is print_progress and pending:
+        # End the console progress line
+        print()
+    return evaluated
+
+def load_results(output_dir, fmt='npz'):
+    """Yield the columns of every shard in order, one chunk at a time."""
+    index = 0
+    while os.path.exists(shard_path(output_dir, index, fmt)):
+        path = shard_path(output_dir, index, fmt)
+        if fmt == 'npz':
+            with np.load(path) as data:
+                yield {name: data[name] for name in COLUMNS}
+        else:
+            data = np.loadtxt(path, delimiter=',', skiprows=1, ndmin=2)
+            yield dict(zip(COLUMNS, data.T))
+        index += 1
+
+def main():
+    parser = argparse.ArgumentParser(description="Parameter sweep over weight, theta1 and theta2.")
+    parser.add_argument('output_dir')
+    parser.add_argument('--weight', nargs=3, type=float, default=(0, 1000, 1), metavar=('START', 'STOP', 'STEP'))
+    parser.add_argument('--theta1', nargs=3, type=float, default=(0, 90, 1), metavar=('START', 'STOP', 'STEP'))
+    parser.add_argument('--theta2', nargs=3, type=float, default=(0, 90, 1), metavar=('START', 'STOP', 'STEP'))
+    parser.add_argument('--chunk-size', type=int, default=1_000_000)
+    parser.add_argument('--format', choices=('npz', 'csv'), default='npz')
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    grid = SweepGrid.from_ranges(args.weight, args.theta1, args.theta2)
+    run_sweep(grid, args.output_dir, args.chunk_size, args.format, args.workers)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import numpy as np
+from frameworks.physic import (calculate_tensions, solution, calculate_body_position,
+                               calculate_tensions_batch, solution_batch)
+
+MAX_ANGLE = 90
+# Below this |sin(theta1 + theta2)| the ropes are (numerically) collinear: sin(pi) is
+# about 1.2e-16, not 0, so a NaN check alone does not catch the 90/90 corner
+DEGENERATE_EPSILON = 1e-9
+
+class TensionTable:
+    """Per-newton tension and body position factors for integer angles 0-90.
+
+    Tension is linear in weight, so every lookup is a single multiply.
+    Integer angles read one precomputed tuple of all factors for their
+    cell; fractional angles are interpolated bilinearly and anything
+    outside the table is computed directly. Cells where the ropes are
+    collinear (0/0 and 90/90) hold NaN, which the interpolation carries
+    along, so a point with a degenerate neighbour is computed directly too.
+    """
+
+    def __init__(self, max_angle=MAX_ANGLE):
+        self.max_angle = max_angle
+
+        angles = np.arange(max_angle + 1, dtype=np.float64)
+        theta1, theta2 = np.meshgrid(angles, angles, indexing='ij')
+
+        T1, T2 = calculate_tensions_batch(1.0, theta1, theta2)
+        T11, T22 = solution_batch(1.0, theta1, theta2, strict=False)
+
+        # The body x position is a weighted average of the anchors where the
+        # weight cancels out; the drop below the anchors is linear in weight.
+        cos1 = np.cos(np.radians(theta1))
+        cos2 = np.cos(np.radians(theta2))
+        denominator = T1 * cos1 + T2 * cos2
+        valid = denominator != 0
+        anchor1_factor = np.divide(T2 * cos2, denominator, out=np.full_like(denominator, np.nan), where=valid)
+        anchor2_factor = np.divide(T1 * cos1, denominator, out=np.full_like(denominator, np.nan), where=valid)
+        drop = np.where(valid, T1 * np.sin(np.radians(theta1)), np.nan)
+
+        degenerate = np.abs(np.sin(np.radians(theta1 + theta2))) < DEGENERATE_EPSILON
+        for factor in (T1, T2, T11, T22, anchor1_factor, anchor2_factor, drop):
+            factor[degenerate] = np.nan
+
+        # Nested lists give plain Python floats on scalar indexing
+        self.T1 = T1.tolist()
+        self.T2 = T2.tolist()
+        self.T11 = T11.tolist()
+        self.T22 = T22.tolist()
+        self.anchor1_factor = anchor1_factor.tolist()
+        self.anchor2_factor = anchor2_factor.tolist()
+        self.drop = drop.tolist()
+
+        # (T1, T2, T11, T22, anchor1, anchor2, drop) per integer cell, None for degenerate factors.
+        # Keyed by the angle pair, so one dict lookup is also the bounds check (30.0 finds 30 too).
+        factors = np.stack([T1, T2, T11, T22, anchor1_factor, anchor2_factor, drop], axis=-1)
+        self._cells = {}
+        for i in range(max_angle + 1):
+            for j in range(max_angle + 1):
+                self._cells[i, j] = tuple(None if value != value else value for value in factors[i, j].tolist())
+
+    def _factor(self, table, theta1, theta2):
+        """Read a per-newton factor, interpolating fractional angles. None if out of range."""
+        i = int(theta1)
+        j = int(theta2)
+        if i == theta1 and j == theta2 and 0 <= i <= self.max_angle and 0 <= j <= self.max_angle:
+            value = table[i][j]
+        elif 0 <= theta1 <= self.max_angle and 0 <= theta2 <= self.max_angle:
+            i = min(i, self.max_angle - 1)
+            j = min(j, self.max_angle - 1)
+            f1 = theta1 - i
+            f2 = theta2 - j
+            value = (table[i][j] * (1 - f1) * (1 - f2) + table[i + 1][j] * f1 * (1 - f2)
+                     + table[i][j + 1] * (1 - f1) * f2 + table[i + 1][j + 1] * f1 * f2)
+        else:
+            return None
+
+        # NaN marks (or interpolates from) a degenerate configuration
+        return None if value != value else value
+
+    def tensions(self, weight, theta1, theta2):
+        """Table-driven equivalent of calculate_tensions."""
+        cell = self._cells.get((theta1, theta2))
+        if cell is not None:
+            t1, t2 = cell[0], cell[1]
+            if t1 is not None and t2 is not None:
+                return weight * t1, weight * t2
+            return calculate_tensions(weight, theta1, theta2)
+        t1 = self._factor(self.T1, theta1, theta2)
+        t2 = self._factor(self.T2, theta1, theta2)
+        if t1 is None or t2 is None:
+            return calculate_tensions(weight, theta1, theta2)
+        return weight * t1, weight * t2
+
+    def solution(self, weight, theta1, theta2):
+        """Table-driven equivalent of solution."""
+        cell = self._cells.get((theta1, theta2))
+        if cell is not None:
+            t11, t22 = cell[2], cell[3]
+            if t11 is not None and t22 is not None:
+                return weight * t11, weight * t22
+            return solution(weight, theta1, theta2)
+        t11 = self._factor(self.T11, theta1, theta2)
+        t22 = self._factor(self.T22, theta1, theta2)
+        if t11 is None or t22 is None:
+            return solution(weight, theta1, theta2)
+        return weight * t11, weight * t22
+
+    def body_position(self, anchor1_x, anchor2_x, anchor_y, weight, theta1, theta2):
+        """Body position for a given weight, without computing the tensions first."""
+        if weight == 0:
+            return anchor1_x, anchor_y
+
+        cell = self._cells.get((theta1, theta2))
+        if cell is not None:
+            factor1, factor2, drop = cell[4], cell[5], cell[6]
+        else:
+            factor1 = self._factor(self.anchor1_factor, theta1, theta2)
+            factor2 = self._factor(self.anchor2_factor, theta1, theta2)
+            drop = self._factor(self.drop, theta1, theta2)
+        if factor1 is None or factor2 is None or drop is None:
+            T1, T2 = calculate_tensions(weight, theta1, theta2)
+            return calculate_body_position(anchor1_x, anchor2_x, anchor_y, T1, T2, theta1, theta2)
+
+        body_x = factor1 * anchor1_x + factor2 * anchor2_x
+        body_y = anchor_y + weight * drop
+        return int(body_x), int(body_y)
+
+_table = None
+
+def get_tension_table():
+    """Return the shared tension table, building it on first use."""
+    global _table
+    if _table is None:
+        _table = TensionTable()
+    return _table
@@ -0,0 +1,180 @@
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.linalg import splu
+
+class StaticsError(Exception):
+    """The structure cannot be solved by statics alone."""
+
+class IndeterminateError(StaticsError):
+    """More unknown member forces than equilibrium equations."""
+
+class MechanismError(StaticsError):
+    """The structure can move without resistance.
+
+    Either fewer members than equations, or as many but arranged so some
+    load cannot be carried (a singular system, e.g. collinear ropes under
+    a sideways load).
+    """
+
+class TrussSolution:
+    """Member forces for one or more load cases (tension is positive)."""
+
+    def __init__(self, forces, reactions, slack):
+        self.forces = forces
+        self.reactions = reactions
+        self.slack = slack
+
+    @property
+    def taut(self):
+        """True when no rope would need to carry compression."""
+        return not self.slack.any()
+
+class Structure:
+    """Pin-jointed graph of anchors, free nodes, ropes and rigid members.
+
+    Every free node contributes two equilibrium equations and every member
+    one unknown axial force. The sparse equilibrium matrix is factorized
+    once and reused for every load case until the geometry changes.
+    """
+
+    def __init__(self):
+        self.points = []
+        self.fixed = []
+        self.members = []
+        self.is_rope = []
+        self._lu = None
+        self._geometry_cache = None
+
+    def add_anchor(self, x, y):
+        """Add a fixed point and return its index."""
+        return self._add_point(x, y, True)
+
+    def add_node(self, x, y):
+        """Add a free node (a body or a joint) and return its index."""
+        return self._add_point(x, y, False)
+
+    def add_rope(self, a, b):
+        """Connect two points with a rope, which can only pull."""
+        return self._add_member(a, b, True)
+
+    def add_member(self, a, b):
+        """Connect two points with a rigid member, which can pull or push."""
+        return self._add_member(a, b, False)
+
+    def _add_point(self, x, y, fixed):
+        self.points.append((x, y))
+        self.fixed.append(fixed)
+        self._invalidate()
+        return len(self.points) - 1
+
+    def _add_member(self, a, b, rope):
+        if a == b:
+            raise ValueError("A member needs two different end points")
+        self.members.append((a, b))
+        self.is_rope.append(rope)
+        self._invalidate()
+        return len(self.members) - 1
+
+    def _invalidate(self):
+        self._lu = None
+        self._geometry_cache = None
+
+    def _geometry(self):
+        if self._geometry_cache is not None:
+            return self._geometry_cache
+
+        points = np.asarray(self.points, dtype=np.float64).reshape(-1, 2)
+        members = np.asarray(self.members, dtype=np.int64).reshape(-1, 2)
+        fixed = np.asarray(self.fixed, dtype=bool)
+
+        free_index = np.full(len(points), -1, dtype=np.int64)
+        free_index[~fixed] = np.arange(np.count_nonzero(~fixed))
+
+        delta = points[members[:, 1]] - points[members[:, 0]]
+        length = np.hypot(delta[:, 0], delta[:, 1])
+        if np.any(length == 0):
+            raise ValueError("Members must have a non-zero length")
+
+        self._geometry_cache = (members, free_index, delta / length[:, None])
+        return self._geometry_cache
+
+    def assemble(self):
+        """Return the sparse equilibrium matrix (2 rows per free node, 1 column per member)."""
+        members, free_index, unit = self._geometry()
+        n_equations = 2 * np.count_nonzero(free_index >= 0)
+        columns = np.arange(len(members))
+
+        rows = []
+        cols = []
+        values = []
+        # A tension pulls end a towards b and end b towards a
+        for end, sign in ((0, 1.0), (1, -1.0)):
+            node = free_index[members[:, end]]
+            attached = node >= 0
+            for axis in (0, 1):
+                rows.append(2 * node[attached] + axis)
+                cols.append(columns[attached])
+                values.append(sign * unit[attached, axis])
+
+        return coo_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+                          shape=(n_equations, len(members))).tocsc()
+
+    def factorize(self):
+        """Factorize the equilibrium matrix, raising if the structure is not statically determinate."""
+        matrix = self.assemble()
+        n_equations, n_members = matrix.shape
+        if n_members > n_equations:
+            raise IndeterminateError(
+                f"{n_members} members but only {n_equations} equilibrium equations")
+        if n_members < n_equations:
+            raise MechanismError(
+                f"{n_members} members for {n_equations} equilibrium equations")
+
+        try:
+            self._lu = splu(matrix)
+        except RuntimeError as e:
+            raise MechanismError(f"Singular equilibrium matrix: {e}") from e
+        return self._lu
+
+    def solve(self, loads, slack_tolerance=1e-9):
+        """Solve member forces for external loads.
+
+        loads is either a dict {point: (fx, fy)}, an array of shape
+        (n_points, 2), or a stack of load cases of shape (k, n_points, 2).
+        """
+        if self._lu is None:
+            self.factorize()
+
+        if isinstance(loads, dict):
+            load_array = np.zeros((len(self.points), 2))
+            for point, force in loads.items():
+                load_array[point] += force
+            loads = load_array
+        loads = np.asarray(loads, dtype=np.float64)
+        single = loads.ndim == 2
+        if single:
+            loads = loads[None]
+
+        _, free_index, _ = self._geometry()
+        rhs = -loads[:, free_index >= 0, :].reshape(len(loads), -1).T
+        forces = self._lu.solve(np.ascontiguousarray(rhs)).T
+
+        reactions = self._reactions(forces, loads)
+
+        scale = np.abs(loads).max(axis=(1, 2), keepdims=True)[:, :, 0]
+        slack = np.asarray(self.is_rope, dtype=bool) & (forces < -slack_tolerance * np.maximum(scale, 1.0))
+
+        if single:
+            return TrussSolution(forces[0], reactions[0], slack[0])
+        return TrussSolution(forces, reactions, slack)
+
+    def _reactions(self, forces, loads):
+        """Forces the anchors must provide to hold the structure in place."""
+        members, free_index, unit = self._geometry()
+        member_forces = forces[:, :, None] * unit[None]
+        totals = np.zeros_like(loads)
+        np.add.at(totals, (slice(None), members[:, 0]), member_forces)
+        np.add.at(totals, (slice(None), members[:, 1]), -member_forces)
+        reactions = -(totals + loads)
+        reactions[:, free_index >= 0] = 0
+        return reactions
@@ -0,0 +1,160 @@
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+from config.constant import ASSET_SPECS, ASSET_PACK_PATH
+
+MAGIC = b'SIMPACK1'
+ALIGNMENT = 64
+
+def _source_stamp(path):
+    """Size and modification time of a source image, or None if it is not there."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _source_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _load_scaled(path, size, alpha):
+    """Decode, convert and smoothscale an image: the slow path the pack replaces."""
+    image = pygame.image.load(path)
+    image = image.convert_alpha() if alpha else image.convert()
+    return pygame.transform.smoothscale(image, size)
+
+def build_pack(specs=ASSET_SPECS, path=ASSET_PACK_PATH):
+    """Decode and scale every asset once and write the raw pixels into one file.
+
+    Layout: magic, little-endian uint32 index length, JSON index, then each
+    image's RGBA or RGB rows at a 64-byte aligned offset. Needs a display
+    mode, like the loader, so the pixels go through the same conversion.
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for name, (source, size, alpha) in specs.items():
+        fmt = 'RGBA' if alpha else 'RGB'
+        pixels = pygame.image.tobytes(_load_scaled(source, size, alpha), fmt)
+        offset = -(-offset // ALIGNMENT) * ALIGNMENT
+        index[name] = {'offset': offset, 'size': list(size), 'format': fmt,
+                       'source': os.path.basename(source), 'source_stamp': _source_stamp(source),
+                       'source_hash': _source_hash(source)}
+        blobs.append((offset, pixels))
+        offset += len(pixels)
+
+    header = json.dumps(index).encode('utf-8')
+    data_start = -(-(len(MAGIC) + 4 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(header)) + header)
+        for blob_offset, pixels in blobs:
+            f.seek(data_start + blob_offset)
+            f.write(pixels)
+    os.replace(tmp_path, path)
+    return index
+
+class AssetPack:
+    """Memory-mapped asset pack; images are converted straight from the mapping."""
+
+    def __init__(self, path=ASSET_PACK_PATH):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.index, self._data_start = self._read_index(path)
+        except Exception:
+            self._map.close()
+            raise
+
+    def _read_index(self, path):
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an asset pack")
+        (header_length,) = struct.unpack_from('<I', self._map, len(MAGIC))
+        header_end = len(MAGIC) + 4 + header_length
+        index = json.loads(self._map[len(MAGIC) + 4:header_end])
+        data_start = -(-header_end // ALIGNMENT) * ALIGNMENT
+        for name, entry in index.items():
+            size = entry['size']
+            if data_start + entry['offset'] + size[0] * size[1] * len(entry['format']) > len(self._map):
+                raise ValueError(f"{path} is truncated ({name} is cut off)")
+        return index, data_start
+
+    def matches(self, specs):
+        """True if the pack holds every spec at the same size and from the same source file.
+
+        A source whose size and modification time are unchanged is taken as
+        is; otherwise (edited, or just checked out again) its content hash
+        decides.
+        """
+        for name, (source, size, alpha) in specs.items():
+            entry = self.index.get(name)
+            if entry is None or tuple(entry['size']) != tuple(size) or entry['format'] != ('RGBA' if alpha else 'RGB'):
+                return False
+            # A kiosk may ship the pack without the sources; only compare when they exist
+            stamp = _source_stamp(source)
+            if stamp is None or stamp == entry.get('source_stamp'):
+                continue
+            if _source_hash(source) != entry.get('source_hash'):
+                return False
+        return True
+
+    def surface(self, name):
+        """Return the image as a display-format surface (one copy, from the mapped pixels)."""
+        entry = self.index[name]
+        size = tuple(entry['size'])
+        start = self._data_start + entry['offset']
+        length = size[0] * size[1] * len(entry['format'])
+        raw = pygame.image.frombuffer(memoryview(self._map)[start:start + length], size, entry['format'])
+        surface = raw.convert_alpha() if entry['format'] == 'RGBA' else raw.convert()
+        del raw
+        return surface
+
+    def close(self):
+        self._map.close()
+
+def display_format():
+    """Pixel format of the current display, used to notice when surfaces need reconverting."""
+    screen = pygame.display.get_surface()
+    return None if screen is None else (screen.get_bitsize(), screen.get_masks())
+
+def load_assets(specs=ASSET_SPECS, path=ASSET_PACK_PATH):
+    """Return {name: display-format surface}, from the pack when it is present and up to date.
+
+    A pack that cannot be read (corrupt, truncated, an older format) is
+    ignored and the images are decoded from their sources.
+    """
+    if os.path.exists(path):
+        try:
+            pack = AssetPack(path)
+            try:
+                if pack.matches(specs):
+                    return {name: pack.surface(name) for name in specs}
+            finally:
+                pack.close()
+        except (OSError, ValueError, KeyError, TypeError, struct.error) as e:
+            print(f"Paquete de imágenes inválido ({e}); se cargan las imágenes originales")
+
+    return {name: _load_scaled(source, size, alpha) for name, (source, size, alpha) in specs.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description="Bake the scaled simulator images into a raw-pixel asset pack.")
+    parser.add_argument('--output', default=ASSET_PACK_PATH)
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    index = build_pack(ASSET_SPECS, args.output)
+    print(f"{len(index)} images written to {args.output} ({os.path.getsize(args.output) / 2**20:.1f} MiB)")
+
+if __name__ == '__main__':
+    main()
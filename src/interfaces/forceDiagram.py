@@ -0,0 +1,68 @@
+import math
+import pygame
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+class ForceDiagram:
+    """Long-lived matplotlib figure for the force diagram.
+
+    The axes, grid, title and body marker are rendered once and saved as a
+    background. An update only changes the three arrows and the legend
+    texts, restores the background and redraws those artists on top. The
+    pygame surface is a view of the Agg RGBA buffer, so no pixels are copied.
+    """
+
+    def __init__(self, size=(300, 300), dpi=100):
+        self.figure = Figure(figsize=(size[0] / dpi, size[1] / dpi), dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.ax = self.figure.add_subplot(111)
+
+        ancla1_x, ancla2_x = 0, 10
+        ancla_y = 10
+        cuerpo_x = (ancla1_x + ancla2_x) / 2
+        cuerpo_y = ancla_y - 5
+
+        self.ax.plot([cuerpo_x], [cuerpo_y], 'ro', markersize=10)
+        self.weight_arrow = self.ax.quiver(cuerpo_x, cuerpo_y, 0, -1, scale=3, color='g', width=0.005,
+                                           label='Peso', animated=True)
+        self.arrow1 = self.ax.quiver(cuerpo_x, cuerpo_y, 1, 0, scale=2, color='b', width=0.005,
+                                     label='Angulo 1', animated=True)
+        self.arrow2 = self.ax.quiver(cuerpo_x, cuerpo_y, -1, 0, scale=2, color='r', width=0.005,
+                                     label='Angulo 2', animated=True)
+
+        self.ax.set_xlim(-2, 12)
+        self.ax.set_ylim(0, 12)
+        self.ax.set_aspect('equal')
+        self.legend = self.ax.legend(fontsize='x-small')
+        self.legend.set_animated(True)
+        self.ax.set_title('Diagrama de Equilibrio', fontsize='small')
+        self.ax.grid(True)
+        self.figure.tight_layout()
+
+        # Animated artists are left out of a full draw, which gives a clean background
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.buffer = self.canvas.buffer_rgba()
+        self.surface = pygame.image.frombuffer(self.buffer, self.canvas.get_width_height(), 'RGBA')
+
+    def update(self, peso, theta1, theta2):
+        """Point the arrows at the given angles and return the (shared) surface."""
+        theta1_rad = math.radians(theta1)
+        theta2_rad = math.radians(theta2)
+        self.arrow1.set_UVC(math.cos(theta1_rad), math.sin(theta1_rad))
+        self.arrow2.set_UVC(-math.cos(theta2_rad), math.sin(theta2_rad))
+
+        labels = (f'Peso: {peso:.2f}N', f'Angulo 1: {theta1}', f'Angulo 2: {theta2}')
+        for artist, text, label in zip((self.weight_arrow, self.arrow1, self.arrow2), self.legend.get_texts(), labels):
+            artist.set_label(label)
+            text.set_text(label)
+
+        self.canvas.restore_region(self.background)
+        for artist in (self.weight_arrow, self.arrow1, self.arrow2, self.legend):
+            self.ax.draw_artist(artist)
+        return self.surface
+
+    def render_rgba(self, peso, theta1, theta2):
+        """Update the diagram and return its size and a copy of its RGBA pixels."""
+        self.update(peso, theta1, theta2)
+        return self.canvas.get_width_height(), bytes(self.buffer)
@@ -0,0 +1,184 @@
+import importlib
+import os
+import subprocess
+import sys
+import threading
+from multiprocessing.connection import Client, Listener
+import pygame
+
+# The worker runs as `python -m interfaces.graphWorker` from here, so it imports
+# only the project sources and the installed packages, never the parent's __main__
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIAGRAM_FACTORY = 'interfaces.forceDiagram:ForceDiagram'
+
+def _serve(conn, diagram_factory):
+    """Worker process: render each request and send back the RGBA pixels."""
+    diagram = diagram_factory()
+    while True:
+        request = conn.recv()
+        if request is None:
+            return
+        key, weight, theta1, theta2 = request
+        try:
+            size, pixels = diagram.render_rgba(weight, theta1, theta2)
+        except Exception as e:
+            print("Error dibujando el diagrama:", e)
+            size, pixels = None, None
+        conn.send((key, size, pixels))
+
+def _load_factory(name):
+    module, _, attribute = name.partition(':')
+    return getattr(importlib.import_module(module), attribute)
+
+class GraphWorker:
+    """Render the force diagram in a separate process.
+
+    A process rather than a thread, so matplotlib never holds the GIL the
+    main loop needs. At most one request is in flight; newer requests
+    overwrite a single pending slot, so during a drag only the latest
+    parameters are rendered and the intermediate ones are dropped.
+
+    The process is this module run with -m from the source directory; it
+    connects back over a local multiprocessing connection. It is started
+    by the first request, so an app that never opens the graph never
+    imports matplotlib. diagram_factory names the diagram class as
+    'module:attribute'.
+
+    If the process dies, failed is set and requests are ignored from then
+    on; the caller is expected to draw the diagram itself instead.
+    """
+
+    def __init__(self, diagram_factory=DIAGRAM_FACTORY):
+        self.diagram_factory = diagram_factory
+        self._process = None
+        self._listener = None
+        self._accepting = None
+        self._conn = None
+        self._busy = False
+        self._pending = None
+        self.sent = 0
+        self.failed = False
+
+    @property
+    def busy(self):
+        """True while a diagram is being drawn or waiting to be sent."""
+        return self._busy or self._pending is not None
+
+    def start(self):
+        """Launch the worker process if it is not running; it connects in the background."""
+        if self._process is not None:
+            return
+        authkey = os.urandom(16)
+        self._listener = Listener(authkey=authkey)
+        env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+        self._process = subprocess.Popen(
+            [sys.executable, '-m', 'interfaces.graphWorker', self._listener.address, self.diagram_factory],
+            cwd=SRC_DIR, env=env, stdin=subprocess.PIPE)
+        # The key goes through stdin rather than the command line, where other users could read it
+        self._process.stdin.write(authkey.hex().encode() + b'\n')
+        self._process.stdin.close()
+        self._accepting = threading.Thread(target=self._accept, name='graph-worker-accept', daemon=True)
+        self._accepting.start()
+
+    def request(self, key, weight, theta1, theta2):
+        """Ask for a diagram, replacing any request that has not been sent yet."""
+        if self.failed:
+            return
+        self.start()
+        self._pending = (key, weight, theta1, theta2)
+        self._send_pending()
+
+    def poll(self):
+        """Return (key, surface) for a newly finished diagram, or None if nothing is ready."""
+        if not self._connected():
+            return None
+        self._send_pending()
+        if not self._busy:
+            return None
+        try:
+            if not self._conn.poll():
+                return None
+            key, size, pixels = self._conn.recv()
+        except (EOFError, BrokenPipeError, OSError) as e:
+            self._fail(e)
+            return None
+
+        self._busy = False
+        self._send_pending()
+        if pixels is None:
+            return None
+        return key, pygame.image.frombuffer(pixels, size, 'RGBA')
+
+    def close(self, timeout=1.0):
+        """Stop the worker process."""
+        if self._process is None:
+            return
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        try:
+            self._process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        if self._conn is not None:
+            self._conn.close()
+        self._listener.close()
+
+    def _accept(self):
+        try:
+            self._conn = self._listener.accept()
+        except (OSError, EOFError):
+            # Closed by _fail() or close(), or the child failed to authenticate
+            pass
+
+    def _connected(self):
+        """True once the process has connected; fails the worker if it exited before that."""
+        if self._conn is not None:
+            return True
+        if self._process is None or self.failed:
+            return False
+        if self._accepting.is_alive() and self._process.poll() is None:
+            return False
+        if self._conn is None:
+            self._fail(None)
+            return False
+        return True
+
+    def _send_pending(self):
+        if self._busy or self._pending is None or self._conn is None:
+            return
+        try:
+            self._conn.send(self._pending)
+        except (BrokenPipeError, OSError) as e:
+            self._fail(e)
+            return
+        self._pending = None
+        self._busy = True
+        self.sent += 1
+
+    def _fail(self, error):
+        print("El proceso del diagrama se detuvo:", error or "conexión cerrada")
+        self.failed = True
+        self._busy = False
+        self._pending = None
+        # Unblocks an accept() still waiting for a process that is gone
+        self._listener.close()
+
+def main():
+    """Worker process entry point: the listener address and factory come as arguments, the key on stdin."""
+    address, factory = sys.argv[1], sys.argv[2]
+    authkey = bytes.fromhex(sys.stdin.readline().strip())
+    conn = Client(address, authkey=authkey)
+    try:
+        _serve(conn, _load_factory(factory))
+    except (EOFError, BrokenPipeError, OSError):
+        # The main process went away
+        pass
+    finally:
+        conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -1,65 +1,96 @@
 import pygame
 import math
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_agg import FigureCanvasAgg
 from config.constant import *
+from interfaces.surfaceCache import SurfaceCache
+from interfaces.rotationAtlas import RotationAtlas
+from interfaces.forceDiagram import ForceDiagram
+from interfaces.assetPack import load_assets, display_format
 
 class GraphicsManager:
     def __init__(self):
         self.load_images()
         self.font_large = pygame.font.SysFont(None, 40)
         self.font = pygame.font.SysFont(None, 24)
+        self.rope_cache = SurfaceCache(ROPE_CACHE_MAX_ITEMS, ROPE_CACHE_MAX_BYTES)
+        self.text_cache = SurfaceCache(TEXT_CACHE_MAX_ITEMS, TEXT_CACHE_MAX_BYTES)
+        # Both angle indicators share one atlas of the 91 possible rotations
+        self.rotation_atlas = RotationAtlas(self.rotacion_image, 0, 90)
+        self.rotation_atlas.prebuild_async()
+        # Created on first use; the figure is only needed once the graph is opened
+        self.force_diagram = None
 
     def load_images(self):
-        """Load and scale all required images with antialiasing."""
+        """Load the scaled images, from the baked asset pack when it is up to date."""
         try:
-            # Load all images
-            self.rotacion_image = pygame.image.load(ROTACION_IMAGE_PATH).convert_alpha()
-            self.peso_image = pygame.image.load(PESO_IMAGE_PATH).convert_alpha()
-            self.polea_image = pygame.image.load(POLEA_IMAGE_PATH).convert_alpha()
-            self.rope_image = pygame.image.load(ROPE_IMAGE_PATH).convert_alpha()
-            self.fondo_image = pygame.image.load(FONDO_IMAGE_PATH).convert()
-
-            # Scale images with antialiasing
-            self.peso_image = pygame.transform.smoothscale(self.peso_image, (520, 450))
-            self.polea_image = pygame.transform.smoothscale(self.polea_image, (200, 140))
-            self.rotacion_image = pygame.transform.smoothscale(self.rotacion_image, (90, 70))
-            self.rope_image = pygame.transform.smoothscale(self.rope_image, (420, 420))
-            self.fondo_image = pygame.transform.smoothscale(self.fondo_image, (1610, 1000))
+            images = load_assets()
         except Exception as e:
             print(f"Error loading images: {e}")
             raise
+        
+        self.rotacion_image = images['rotacion']
+        self.peso_image = images['peso']
+        self.polea_image = images['polea']
+        self.rope_image = images['rope']
+        self.fondo_image = images['fondo']
+        self.display_format = display_format()
+
+    def ensure_display_format(self):
+        """Reconvert the images if the display pixel format changed; True if it did."""
+        if display_format() == self.display_format:
+            return False
+        self.load_images()
+        self.rope_cache.clear()
+        self.rotation_atlas = RotationAtlas(self.rotacion_image, 0, 90)
+        self.rotation_atlas.prebuild_async()
+        return True
 
-    def draw_scene(self, screen, body_x, body_y, anchor1_x, anchor2_x, anchor_y, theta1, theta2):
-        """Draw all visual elements with antialiasing."""
-        # Draw background
+    def draw_background(self, screen, anchor1_x, anchor_y):
+        """Draw the background image; it only moves with the anchors."""
         fondo_rect = self.fondo_image.get_rect(center=(anchor1_x + 337, anchor_y + 310))
         screen.blit(self.fondo_image, fondo_rect)
 
-        # Draw ropes
-        self.draw_rope(screen, (anchor1_x, anchor_y), (body_x, body_y))
-        self.draw_rope(screen, (anchor2_x, anchor_y), (body_x, body_y))
+    def draw_scene(self, screen, body_x, body_y, anchor1_x, anchor2_x, anchor_y, theta1, theta2, background=True):
+        """Draw all visual elements with antialiasing and return the rects they cover.
 
-        # Draw rotation indicators with smooth rotation
-        rotated_rotacion1 = pygame.transform.rotozoom(self.rotacion_image, theta1, 1.0)
-        rotated_rotacion2 = pygame.transform.rotozoom(self.rotacion_image, theta2, 1.0)
+        Pass background=False when the background is already on screen, e.g.
+        restored from a pre-composited layer.
+        """
+        if background:
+            self.draw_background(screen, anchor1_x, anchor_y)
+
+        # Draw ropes
+        rects = [
+            self.draw_rope(screen, (anchor1_x, anchor_y), (body_x, body_y)),
+            self.draw_rope(screen, (anchor2_x, anchor_y), (body_x, body_y)),
+        ]
+
+        # Draw rotation indicators from the pre-rotated atlas
+        rotated_rotacion1 = self.rotation_atlas.get(theta1)
+        rotated_rotacion2 = self.rotation_atlas.get(theta2)
         
         rot1_rect = rotated_rotacion1.get_rect(center=(anchor1_x, anchor_y + 20))
         rot2_rect = rotated_rotacion2.get_rect(center=(anchor2_x, anchor_y + 20))
         
-        screen.blit(rotated_rotacion1, rot1_rect)
-        screen.blit(rotated_rotacion2, rot2_rect)
+        rects.append(screen.blit(rotated_rotacion1, rot1_rect))
+        rects.append(screen.blit(rotated_rotacion2, rot2_rect))
 
-        # Draw pulleys
+        # Draw pulleys (over the ropes, so they cannot live in the background layer)
         polea1_rect = self.polea_image.get_rect(center=(anchor1_x, anchor_y - 22))
         polea2_rect = self.polea_image.get_rect(center=(anchor2_x, anchor_y - 22))
         
-        screen.blit(self.polea_image, polea1_rect)
-        screen.blit(self.polea_image, polea2_rect)
+        rects.append(screen.blit(self.polea_image, polea1_rect))
+        rects.append(screen.blit(self.polea_image, polea2_rect))
 
         # Draw weight
         peso_rect = self.peso_image.get_rect(center=(body_x, body_y))
-        screen.blit(self.peso_image, peso_rect)
+        rects.append(screen.blit(self.peso_image, peso_rect))
+        return rects
+
+    def render_text(self, font, text, color, antialias=True):
+        """Return font.render(text), shared through a bounded cache of rendered strings."""
+        color = tuple(color)
+        return self.text_cache.get((font, text, color, antialias),
+                                   lambda: font.render(text, antialias, color))
 
     def draw_rope(self, screen, start, end):
         """Draw a rope between two points with antialiasing."""
@@ -68,53 +99,37 @@ class GraphicsManager:
         angle = math.atan2(dy, dx)
         length = math.hypot(dx, dy)
 
-        # Scale and rotate rope with antialiasing
-        scaled_rope = pygame.transform.smoothscale(self.rope_image, (int(length), 450))
-        rotated_rope = pygame.transform.rotozoom(scaled_rope, math.degrees(-angle), 1.0)
+        # Sprites are cached by quantized length and angle
+        length_steps = round(length / ROPE_LENGTH_STEP)
+        angle_steps = round(math.degrees(-angle) / ROPE_ANGLE_STEP)
+        sprite, size, bounds = self.rope_cache.get(
+            (length_steps, angle_steps),
+            lambda: self._build_rope(length_steps * ROPE_LENGTH_STEP, angle_steps * ROPE_ANGLE_STEP))
 
-        rope_rect = rotated_rope.get_rect()
+        rope_rect = pygame.Rect((0, 0), size)
         rope_rect.center = (start[0] + dx/2, start[1] + dy/2)
 
-        screen.blit(rotated_rope, rope_rect)
+        return screen.blit(sprite, rope_rect.move(bounds.topleft))
+
+    def _build_rope(self, length, angle):
+        """Scale and rotate the rope image, cropped to its visible pixels.
+
+        Returns the sprite, the size of the uncropped rotation and where the
+        sprite sits inside it.
+        """
+        scaled_rope = pygame.transform.smoothscale(self.rope_image, (max(int(length), 1), 450))
+        rotated_rope = pygame.transform.rotozoom(scaled_rope, angle, 1.0)
+
+        bounds = rotated_rope.get_bounding_rect()
+        sprite = rotated_rope.subsurface(bounds).copy()
+        return sprite, rotated_rope.get_size(), bounds
 
     def create_graph(self, peso, theta1, theta2, T11, T22):
-        """Create force diagram using matplotlib."""
-        plt.switch_backend('Agg')
-        fig = plt.figure(figsize=(300/100, 300/100), dpi=100)
-        ax = fig.add_subplot(111)
-
-        theta1_rad = math.radians(theta1)
-        theta2_rad = math.radians(theta2)
-
-        ancla1_x, ancla2_x = 0, 10
-        ancla_y = 10
-        cuerpo_x = (ancla1_x + ancla2_x) / 2
-        cuerpo_y = ancla_y - 5
-
-        ax.plot([cuerpo_x], [cuerpo_y], 'ro', markersize=10)
-        ax.quiver(cuerpo_x, cuerpo_y, 0, -1, scale=3, color='g', width=0.005, label=f'Peso: {peso:.2f}N')
-        ax.quiver(cuerpo_x, cuerpo_y, math.cos(theta1_rad), math.sin(theta1_rad), 
-                scale=2, color='b', width=0.005, label=f'Angulo 1: {theta1}')
-        ax.quiver(cuerpo_x, cuerpo_y, -math.cos(theta2_rad), math.sin(theta2_rad), 
-                scale=2, color='r', width=0.005, label=f'Angulo 2: {theta2}')
-
-        ax.set_xlim(-2, 12)
-        ax.set_ylim(0, 12)
-        ax.set_aspect('equal')
-        ax.legend(fontsize='x-small')
-        ax.set_title('Diagrama de Equilibrio', fontsize='small')
-        ax.grid(True)
-
-        plt.tight_layout()
-
-        canvas = FigureCanvasAgg(fig)
-        canvas.draw()
-        renderer = canvas.get_renderer()
-        raw_data = renderer.tostring_rgb()
-        size = canvas.get_width_height()
-
-        plt.close(fig)
-
-        # Convert matplotlib surface to pygame surface with antialiasing
-        surface = pygame.image.fromstring(raw_data, size, "RGB").convert()
-        return pygame.transform.smoothscale(surface, size)
\ No newline at end of file
+        """Update the force diagram and return its surface.
+
+        The surface is shared with the diagram and redrawn in place by the
+        next call; copy it to keep a frame.
+        """
+        if self.force_diagram is None:
+            self.force_diagram = ForceDiagram()
+        return self.force_diagram.update(peso, theta1, theta2)
@@ -0,0 +1,131 @@
+import threading
+import time
+from config.constant import HISTORY_TTL, HISTORY_PAGE_SIZE
+from interfaces.historyClient import HistoryClient
+
+class HistoryCache:
+    """Client-side copy of the saved simulations, loaded a page at a time in the background.
+
+    get() never blocks: it returns the rows loaded so far (empty before the
+    first page arrives) and starts a background fetch of the first page when
+    there is no copy yet, when it is older than the TTL or after invalidate().
+    request_rows() loads further pages as the list is scrolled.
+
+    A refresh only fetches the first page. Saved simulations are never
+    edited or deleted and new ones come first, so that page is merged in
+    front of the rows already loaded: the rows it shares with them (by _id)
+    show how many new rows were inserted. inserted counts those rows over
+    all refreshes, so a view can keep its selection and scroll position.
+    When the first page shares no rows with the loaded ones, it replaces
+    them and resets is incremented.
+
+    fetch(offset, limit) returns (items, total) or just a list of items.
+    """
+
+    def __init__(self, client=None, ttl=HISTORY_TTL, page_size=HISTORY_PAGE_SIZE, fetch=None):
+        self.client = client or HistoryClient()
+        self.ttl = ttl
+        self.page_size = page_size
+        self.fetch = fetch or self.client.fetch_page
+        self.error = None
+        self.total = None
+        self.inserted = 0
+        self.resets = 0
+        self._items = []
+        self._complete = False
+        self._fetched_at = None
+        self._generation = 0
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loading(self):
+        """True while a fetch is running."""
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    @property
+    def loaded(self):
+        """True once a fetch has succeeded, even if the list it returned was empty."""
+        return self._fetched_at is not None and self.error is None
+
+    @property
+    def has_more(self):
+        """True if the backend has rows beyond the ones loaded."""
+        return not self._complete
+
+    def get(self):
+        """Return the loaded rows, starting a refresh if they are missing or stale."""
+        return self.snapshot()[0]
+
+    def snapshot(self):
+        """Like get(), but returns (rows, inserted, resets) read together."""
+        with self._lock:
+            stale = self._fetched_at is None or time.monotonic() - self._fetched_at > self.ttl
+            if stale and not self.loading:
+                self._start(0)
+            return self._items, self.inserted, self.resets
+
+    def request_rows(self, count):
+        """Load the next page in the background if fewer than count rows are loaded and more exist."""
+        with self._lock:
+            if (self.loading or self._fetched_at is None or self.error or self._complete
+                    or len(self._items) >= count):
+                return
+            self._start(len(self._items))
+
+    def invalidate(self):
+        """Drop the freshness of the cached list, e.g. after a save; it is refetched on the next get()."""
+        with self._lock:
+            self._fetched_at = None
+            self._generation += 1
+
+    def _start(self, offset):
+        self._thread = threading.Thread(target=self._load, args=(offset, self._generation), daemon=True)
+        self._thread.start()
+
+    def _load(self, offset, generation):
+        try:
+            result = self.fetch(offset, self.page_size)
+            error = None
+        except Exception as e:
+            result = None
+            error = str(e)
+            print("Error obteniendo el historial:", e)
+
+        with self._lock:
+            self.error = error
+            if offset == 0 and generation == self._generation:
+                # A fetch that raced with invalidate() may miss the newest save: keep it, but stay stale
+                self._fetched_at = time.monotonic()
+            if result is None:
+                return
+            items, total = result if isinstance(result, tuple) else (result, len(result))
+            if offset == 0:
+                self._items = self._merge_first_page(list(items))
+            elif generation == self._generation and offset == len(self._items):
+                # Pages fetched across an invalidate() would be shifted by the new saves
+                self._items = self._items + list(items)
+            else:
+                return
+            self.total = total
+            if total is not None:
+                self._complete = len(self._items) >= total or not items
+            else:
+                self._complete = len(items) < self.page_size
+
+    def _merge_first_page(self, page):
+        """Put a fresh first page in front of the loaded rows it overlaps."""
+        old = self._items
+        if not old:
+            return page
+        ids = [item.get('_id') for item in page]
+        first_id = old[0].get('_id')
+        if first_id is not None and first_id in ids:
+            new_rows = ids.index(first_id)
+            overlap = len(page) - new_rows
+            if ids[new_rows:] == [item.get('_id') for item in old[:overlap]]:
+                self.inserted += new_rows
+                return page + old[overlap:]
+        self.resets += 1
+        return page
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+import requests
+from config.constant import API_URL, HISTORY_CACHED_PAGES
+
+class HistoryClient:
+    """HTTP access to the saved simulations over one pooled requests session.
+
+    The list is requested a page at a time with limit/offset. Every page
+    remembers its ETag and is asked for again with If-None-Match, so a page
+    that has not changed comes back as an empty 304 and the copy we already
+    have is reused. Only the max_pages most recently used pages are kept.
+    """
+
+    def __init__(self, url=API_URL, session=None, timeout=5, max_pages=HISTORY_CACHED_PAGES):
+        self.url = url
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.not_modified = 0
+        self._pages = OrderedDict()  # (offset, limit) -> (etag, items, total), least recently used first
+
+    def fetch_page(self, offset, limit):
+        """Return (items, total) for one page; total is None if the backend does not report it."""
+        key = (offset, limit)
+        cached = self._pages.get(key)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+        response = self.session.get(self.url, params={'limit': limit, 'offset': offset},
+                                    headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            self.not_modified += 1
+            self._pages.move_to_end(key)
+            return cached[1], cached[2]
+        response.raise_for_status()
+
+        items = response.json()
+        total = response.headers.get('X-Total-Count')
+        if total is not None:
+            total = int(total)
+        elif offset == 0 and len(items) > limit:
+            # An older backend ignores the paging parameters and sends the whole list
+            total = len(items)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._pages[key] = (etag, items, total)
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.pop(key, None)
+        return items, total
+
+    def get_simulation(self, simulation_id):
+        """Return one saved simulation, or None if the backend does not have it."""
+        response = self.session.get(f"{self.url}/{simulation_id}", timeout=self.timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        self.session.close()
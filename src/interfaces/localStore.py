@@ -0,0 +1,144 @@
+import numbers
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from config.constant import LOCAL_DB_PATH
+
+# Fields a simulation is saved with, in column order
+FIELDS = ('weight', 'theta1', 'theta2', 'tension1', 'tension2')
+# Sortable and filterable fields and the columns behind them
+COLUMNS = {'weight': 'weight', 'theta1': 'theta1', 'theta2': 'theta2', 'createdAt': 'created_at'}
+
+class LocalStore:
+    """Saved simulations in an embedded SQLite database, no server needed.
+
+    Offers the operations the UI uses on the backend: put() like the save
+    queue, fetch_page() and get_simulation() like the history client, so
+    either can be plugged in. Rows come back as the same dicts the Node
+    backend sends. The database runs in WAL mode with indexes on the
+    weight, the angles and the timestamp; save_many() inserts a whole
+    batch in one transaction.
+
+    The history window pages newest first. The order_by and where of
+    fetch_page() are store-only API for scripts, or for a HistoryCache
+    built with fetch=lambda offset, limit: store.fetch_page(offset, limit, ...).
+    """
+
+    def __init__(self, path=LOCAL_DB_PATH, on_saved=None):
+        self.path = path
+        self.on_saved = on_saved
+        self._lock = threading.Lock()
+        # Used from the main loop and from the history's background fetches
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if path != ':memory:':
+            self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.execute('''CREATE TABLE IF NOT EXISTS simulations (
+                id INTEGER PRIMARY KEY,
+                weight NUMERIC NOT NULL,
+                theta1 NUMERIC NOT NULL,
+                theta2 NUMERIC NOT NULL,
+                tension1 NUMERIC NOT NULL,
+                tension2 NUMERIC NOT NULL,
+                created_at TEXT NOT NULL)''')
+            for column in COLUMNS.values():
+                self._conn.execute(f'CREATE INDEX IF NOT EXISTS simulations_{column} ON simulations ({column})')
+        self._counts = {}
+        self._data_version = None
+
+    def put(self, simulation):
+        """Save one simulation right away (same call as SaveQueue.put)."""
+        try:
+            self.save_many([simulation])
+        except (ValueError, sqlite3.Error) as e:
+            print("Error guardando la simulación:", e)
+
+    def save_many(self, simulations):
+        """Insert simulations in a single transaction."""
+        created_at = _timestamp()
+        rows = [tuple(_field(simulation, name) for name in FIELDS) + (simulation.get('createdAt', created_at),)
+                for simulation in simulations]
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT INTO simulations (weight, theta1, theta2, tension1, tension2, created_at) '
+                                   'VALUES (?, ?, ?, ?, ?, ?)', rows)
+            self._counts.clear()
+        if rows and self.on_saved:
+            self.on_saved()
+
+    def fetch_page(self, offset, limit, order_by='createdAt', descending=True, where=None):
+        """Return (items, total) for one page, newest first unless another order is given.
+
+        where maps a field to an inclusive (low, high) range; either end may be None.
+        """
+        if order_by not in COLUMNS:
+            raise ValueError(f"Cannot sort by {order_by!r}")
+        conditions, params = _conditions(where)
+        direction = 'DESC' if descending else 'ASC'
+        with self._lock:
+            rows = self._conn.execute(
+                f'SELECT * FROM simulations{conditions} ORDER BY {COLUMNS[order_by]} {direction}, id {direction} '
+                'LIMIT ? OFFSET ?', params + [limit, offset]).fetchall()
+            total = self._count(conditions, params)
+        return [_row(row) for row in rows], total
+
+    def get_simulation(self, simulation_id):
+        """Return one saved simulation, or None if there is none with that id."""
+        try:
+            key = int(simulation_id)
+        except (TypeError, ValueError):
+            return None
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM simulations WHERE id = ?', (key,)).fetchone()
+        return _row(row) if row is not None else None
+
+    def close(self):
+        """Close the database; later calls (e.g. a history fetch still running) raise sqlite3.ProgrammingError."""
+        with self._lock:
+            self._conn.close()
+
+    def _count(self, conditions, params):
+        """COUNT(*) is a full index scan, so totals are kept until the table changes."""
+        data_version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+        if data_version != self._data_version:
+            # Another connection wrote to the database
+            self._counts.clear()
+            self._data_version = data_version
+        key = (conditions, tuple(params))
+        total = self._counts.get(key)
+        if total is None:
+            total = self._conn.execute(f'SELECT COUNT(*) FROM simulations{conditions}', params).fetchone()[0]
+            self._counts[key] = total
+        return total
+
+def _conditions(where):
+    clauses, params = [], []
+    for name, (low, high) in (where or {}).items():
+        if name not in COLUMNS:
+            raise ValueError(f"Cannot filter by {name!r}")
+        if low is not None:
+            clauses.append(f'{COLUMNS[name]} >= ?')
+            params.append(low)
+        if high is not None:
+            clauses.append(f'{COLUMNS[name]} <= ?')
+            params.append(high)
+    return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+def _field(simulation, name):
+    value = simulation.get(name)
+    if not isinstance(value, numbers.Real) or isinstance(value, bool):
+        raise ValueError(f"Invalid simulation field {name!r}: {value!r}")
+    # numpy scalars are not accepted by sqlite3
+    return int(value) if isinstance(value, numbers.Integral) else float(value)
+
+def _row(row):
+    simulation = {'_id': str(row['id'])}
+    for name in FIELDS:
+        simulation[name] = row[name]
+    simulation['createdAt'] = row['created_at']
+    return simulation
+
+def _timestamp():
+    """Same format as the timestamps the Node backend returns."""
+    return datetime.now(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
@@ -0,0 +1,120 @@
+import os
+
+# Render without a window; must be set before pygame initialises the display
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import csv
+import io
+import json
+import time
+
+import pygame
+from PIL import Image
+from config.constant import *
+from frameworks.state import StateManager
+from interfaces.graphicInterface import GraphicsManager
+from interfaces.surfaceCache import SurfaceCache
+from interfaces.uiInterface import UI
+
+class RenderService:
+    """Render simulator scenes to PNG with no window.
+
+    Images, fonts and the UI are created once and reused for every render.
+    Encoded PNGs are kept in an LRU cache, bounded by count and by bytes,
+    so identical requests are free.
+    PNGs are encoded with Pillow (a matplotlib dependency) at a low zlib
+    level, which is several times faster than pygame.image.save.
+    """
+
+    def __init__(self, cache_size=512, png_compression=1, max_bytes=256 * 1024 * 1024):
+        pygame.init()
+        # convert()/convert_alpha() need a display mode, even a dummy one
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((WIDTH, HEIGHT))
+
+        self.screen = pygame.Surface((WIDTH, HEIGHT))
+        self.state = StateManager()
+        self.graphics = GraphicsManager()
+        self.ui = UI(self.graphics, self.state)
+
+        self.cache = SurfaceCache(max_items=cache_size, max_bytes=max_bytes)
+        self.png_compression = png_compression
+
+    @property
+    def hits(self):
+        return self.cache.hits
+
+    @property
+    def misses(self):
+        return self.cache.misses
+
+    def render(self, weight, theta1, theta2, show_graph=False, show_converter=False):
+        """Return the PNG bytes for one scene."""
+        key = (weight, theta1, theta2, show_graph, show_converter)
+        return self.cache.get(key, lambda: self._render_png(weight, theta1, theta2, show_graph, show_converter))
+
+    def _render_png(self, weight, theta1, theta2, show_graph, show_converter):
+        self.state.update_state(weight=weight, theta1=theta1, theta2=theta2)
+        self.ui.conversor_visible = show_converter
+        self.ui.mostrar_grafico = show_graph
+        if show_graph:
+            self.ui.update_graph()
+
+        self.ui.draw_scene(self.screen)
+
+        buffer = io.BytesIO()
+        image = Image.frombuffer('RGB', self.screen.get_size(), pygame.image.tobytes(self.screen, 'RGB'))
+        image.save(buffer, 'PNG', compress_level=self.png_compression)
+        return buffer.getvalue()
+
+    def render_batch(self, requests, output_dir):
+        """Render a list of parameter dicts to output_dir and return throughput stats."""
+        os.makedirs(output_dir, exist_ok=True)
+        start = time.perf_counter()
+        for index, params in enumerate(requests):
+            name = params.get('name') or f'render_{index:06d}'
+            png = self.render(float(params['weight']), float(params['theta1']), float(params['theta2']),
+                              _flag(params.get('show_graph')), _flag(params.get('show_converter')))
+            with open(os.path.join(output_dir, f'{name}.png'), 'wb') as f:
+                f.write(png)
+        elapsed = time.perf_counter() - start
+
+        return {
+            'images': len(requests),
+            'seconds': elapsed,
+            'images_per_second': len(requests) / elapsed if elapsed > 0 else 0,
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+        }
+
+def _flag(value):
+    """Read a boolean from JSON or CSV input."""
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes')
+    return bool(value)
+
+def load_requests(path):
+    """Read render requests from a JSON list or a CSV file with weight,theta1,theta2 columns."""
+    with open(path, newline='') as f:
+        if path.endswith('.json'):
+            return json.load(f)
+        return list(csv.DictReader(f))
+
+def main():
+    parser = argparse.ArgumentParser(description="Render simulator scenes to PNG without a window.")
+    parser.add_argument('requests', help="JSON or CSV file with weight, theta1, theta2 (and optional name, show_graph, show_converter)")
+    parser.add_argument('--out', default='renders')
+    parser.add_argument('--cache-size', type=int, default=512)
+    parser.add_argument('--cache-mb', type=int, default=256, help="memory limit of the PNG cache")
+    parser.add_argument('--png-compression', type=int, default=1, choices=range(10), metavar='0-9')
+    args = parser.parse_args()
+
+    service = RenderService(args.cache_size, args.png_compression, args.cache_mb * 1024 * 1024)
+    stats = service.render_batch(load_requests(args.requests), args.out)
+    print(f"{stats['images']} images in {stats['seconds']:.2f}s "
+          f"({stats['images_per_second']:.1f} images/s, {stats['cache_hits']} cache hits)")
+
+if __name__ == '__main__':
+    main()
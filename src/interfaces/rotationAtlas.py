@@ -0,0 +1,45 @@
+import math
+import threading
+import pygame
+
+class RotationAtlas:
+    """One pre-rotated copy of an image for every whole degree in a range.
+
+    Frames are built on first use, or all at once in a background thread
+    with prebuild_async(). Fractional angles use the nearest frame; angles
+    outside the range are rotated on the fly.
+    """
+
+    def __init__(self, image, min_angle=0, max_angle=90):
+        self.image = image
+        self.min_angle = min_angle
+        self.frames = [None] * (max_angle - min_angle + 1)
+        self._thread = None
+
+    def get(self, angle):
+        """Return the image rotated (counter-clockwise, in degrees) to the nearest whole angle."""
+        index = math.floor(angle + 0.5) - self.min_angle
+        if 0 <= index < len(self.frames):
+            frame = self.frames[index]
+            if frame is None:
+                frame = self._build(index)
+            return frame
+        return pygame.transform.rotozoom(self.image, angle, 1.0)
+
+    def _build(self, index):
+        frame = pygame.transform.rotozoom(self.image, self.min_angle + index, 1.0)
+        self.frames[index] = frame
+        return frame
+
+    def prebuild(self):
+        """Build every missing frame."""
+        for index, frame in enumerate(self.frames):
+            if frame is None:
+                self._build(index)
+
+    def prebuild_async(self):
+        """Build the missing frames in a daemon thread; get() keeps working meanwhile."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self.prebuild, name="rotation-atlas", daemon=True)
+            self._thread.start()
+        return self._thread
@@ -0,0 +1,170 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+import requests
+from config.constant import (API_URL, SAVE_JOURNAL_PATH, SAVE_BATCH_SIZE, SAVE_BATCH_WINDOW,
+                             SAVE_RETRY_DELAY, SAVE_MAX_RETRY_DELAY)
+
+class SaveQueue:
+    """Background persistence for saved simulations.
+
+    put() appends to an in-memory queue and rewrites the small JSON journal
+    before returning, so saving never waits on the network but a save is on
+    disk even if the app dies right after. A worker thread sends the queue
+    over one pooled requests session: a burst goes as a single POST to the
+    bulk endpoint when the backend has it, otherwise one POST per
+    simulation. Failures are retried with exponential backoff, and
+    everything not yet confirmed stays in the journal, which is reloaded
+    on the next start.
+    """
+
+    def __init__(self, url=API_URL, journal_path=SAVE_JOURNAL_PATH, session=None, on_saved=None,
+                 batch_size=SAVE_BATCH_SIZE, batch_window=SAVE_BATCH_WINDOW,
+                 retry_delay=SAVE_RETRY_DELAY, max_retry_delay=SAVE_MAX_RETRY_DELAY, timeout=5):
+        self.url = url
+        self.bulk_url = url + '/bulk'
+        self.journal_path = journal_path
+        self.session = session or requests.Session()
+        self.on_saved = on_saved
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.timeout = timeout
+        # None until the first bulk request tells us whether the backend supports it
+        self.bulk_supported = None
+        self.saved = 0
+        self.dropped = 0
+        self.last_error = None
+
+        self._items = deque(self._read_journal())
+        self._closed = False
+        self._condition = threading.Condition()
+        self._journal_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='save-queue', daemon=True)
+        self._thread.start()
+
+    def put(self, simulation):
+        """Queue one simulation and journal it; the network send happens in the background."""
+        with self._condition:
+            self._items.append(dict(simulation))
+        # Journaled before the worker is woken, so the save survives a crash during the batch window
+        self._write_journal()
+        with self._condition:
+            self._condition.notify()
+
+    @property
+    def pending(self):
+        """Number of simulations not yet confirmed by the backend."""
+        return len(self._items)
+
+    def close(self, timeout=2.0):
+        """Stop the worker; whatever was not sent stays in the journal for the next start."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join(timeout)
+        self._write_journal()
+
+    def _run(self):
+        delay = self.retry_delay
+        while True:
+            with self._condition:
+                while not self._items and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                # Give a burst of saves a moment to arrive so it goes out as one request
+                deadline = time.monotonic() + self.batch_window
+                while len(self._items) < self.batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                if self._closed:
+                    return
+                batch = list(self._items)[:self.batch_size]
+
+            try:
+                self._deliver(batch)
+                delay = self.retry_delay
+                self.last_error = None
+            except (requests.RequestException, OSError) as e:
+                self.last_error = str(e)
+                print(f"No se pudo guardar ({self.pending} pendientes), reintento en {delay:.0f}s:", e)
+                with self._condition:
+                    if not self._closed:
+                        self._condition.wait(delay)
+                delay = min(delay * 2, self.max_retry_delay)
+
+    def _deliver(self, batch):
+        """Send a batch, confirming items as the backend accepts them; raises to retry the rest."""
+        if len(batch) > 1 and self.bulk_supported is not False:
+            response = self.session.post(self.bulk_url, json=batch, timeout=self.timeout)
+            if response.status_code == 201:
+                self.bulk_supported = True
+                self._confirm(len(batch))
+                return
+            if response.status_code in (404, 405):
+                # Older backend without the bulk route
+                self.bulk_supported = False
+            elif not _rejected(response):
+                response.raise_for_status()
+            # A rejected batch is sent one by one below so only the bad items are dropped
+
+        for item in batch:
+            response = self.session.post(self.url, json=item, timeout=self.timeout)
+            if _rejected(response):
+                print("Simulación descartada por el servidor:", response.text)
+                self._confirm(1, dropped=True)
+            else:
+                response.raise_for_status()
+                self._confirm(1)
+
+    def _confirm(self, count, dropped=False):
+        """Remove items the backend has answered for from the queue and the journal."""
+        with self._condition:
+            # Counted before the items leave the queue, so pending == 0 means the counters are final
+            if dropped:
+                self.dropped += count
+            else:
+                self.saved += count
+            for _ in range(count):
+                self._items.popleft()
+        self._write_journal()
+        if dropped:
+            return
+        if self.on_saved:
+            self.on_saved()
+
+    def _read_journal(self):
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return []
+        try:
+            with open(self.journal_path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print("No se pudo leer el registro de guardados pendientes:", e)
+            return []
+
+    def _write_journal(self):
+        """Atomically replace the journal with the current queue (removed when empty)."""
+        if not self.journal_path:
+            return
+        with self._journal_lock:
+            with self._condition:
+                items = list(self._items)
+            if not items:
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+                return
+            tmp_path = self.journal_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(items, f)
+            os.replace(tmp_path, self.journal_path)
+
+def _rejected(response):
+    """A client error that retrying cannot fix (not a timeout or rate limit)."""
+    return 400 <= response.status_code < 500 and response.status_code not in (404, 405, 408, 429)
@@ -0,0 +1,68 @@
+import pygame
+from collections import OrderedDict
+
+def surface_bytes(value):
+    """Approximate memory held by a surface, encoded bytes, or the values inside a tuple/list."""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return sum(surface_bytes(item) for item in value)
+    return 0
+
+class SurfaceCache:
+    """Bounded LRU cache of rendered surfaces.
+
+    Entries are evicted least-recently-used first once either the item
+    count or the total pixel memory goes over its limit.
+    """
+
+    def __init__(self, max_items=256, max_bytes=32 * 1024 * 1024):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, build):
+        """Return the cached value for key, calling build() to create it on a miss."""
+        entry = self._items.get(key)
+        if entry is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        value = build()
+        size = surface_bytes(value)
+        self._items[key] = (value, size)
+        self.bytes += size
+
+        # Never evict the entry that was just added
+        while len(self._items) > 1 and (len(self._items) > self.max_items or self.bytes > self.max_bytes):
+            _, (_, evicted_size) = self._items.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+        return value
+
+    def clear(self):
+        self._items.clear()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def stats(self):
+        """Hit/miss counters and current size, for logging or an overlay."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'items': len(self._items),
+            'bytes': self.bytes,
+        }
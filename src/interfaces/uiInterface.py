@@ -1,11 +1,25 @@
 import pygame
 import requests
 from config.constant import *
-from core.physic import calculate_tensions, solution, calculate_body_position, conversor
+from frameworks.physic import conversor
+from frameworks.tension_table import get_tension_table
+from frameworks.profiler import FrameProfiler
+from interfaces.historyCache import HistoryCache
+from interfaces.widgets import Widget, WidgetLayer
 
 class UI:
-    def __init__(self, graphics_manager):
+    def __init__(self, graphics_manager, state_manager, graph_worker=None, profiler=None, save_queue=None,
+                 history=None):
         self.graphics = graphics_manager
+        self.state = state_manager
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        # Saved simulations, fetched in the background and drawn from the cached copy
+        self.history = history if history is not None else HistoryCache()
+        # Anything with put(): the backend's SaveQueue or the LocalStore. Without one, saves are posted synchronously
+        self.save_queue = save_queue
+        # Without a worker the force diagram is drawn synchronously (headless renders, benchmarks)
+        self.graph_worker = graph_worker
+        self._graph_requested = None
         self.conversor_visible = False
         self.mostrar_grafico = False
         self.historial_visible = False
@@ -22,41 +36,90 @@ class UI:
             'tension1': 0,
             'tension2': 0
         }
-        # Sistema de control de clics
-        self.last_click_time = 0
-        self.CLICK_COOLDOWN = 300  # 300ms entre clics
-        self.last_clicked_button = None
-        self.mouse_pressed = False
-        self.has_loaded_simulation = False
-        self.loaded_weight = 0
-        self.loaded_theta1 = 0
-        self.loaded_theta2 = 0
         self.selected_simulation = None
-        
-    def handle_click(self, button_id):
-        """Sistema mejorado de control de clics"""
-        current_time = pygame.time.get_ticks()
-        mouse_pressed = pygame.mouse.get_pressed()[0]
-        
-        # Si el mouse está presionado pero no estaba presionado antes
-        if mouse_pressed and not self.mouse_pressed:
-            if current_time - self.last_click_time > self.CLICK_COOLDOWN:
-                self.last_click_time = current_time
-                self.last_clicked_button = button_id
-                self.mouse_pressed = True
-                return True
-        # Si el mouse no está presionado, resetear el estado
-        elif not mouse_pressed:
-            self.mouse_pressed = False
-            
-        return False
+        self.ROW_HEIGHT = 35  # Altura de cada fila del historial
+        self._max_scroll = 0
+        # Rows the history has inserted at the top so far, to keep the view on the same rows
+        self._history_inserted = 0
+        self._history_resets = 0
+        # Dynamic mode: offset of the swinging body and its peak rope tensions
+        self.body_offset = (0, 0)
+        self.peak_tensions = None
+        # Static layer and the rects drawn over it in the last frame
+        self.static_layer = None
+        self._layer_target = None
+        self._dirty_rects = []
+        self._frame_key = None
+        self.scene_changed = True
+        # History rows on screen: index -> (row data, surface)
+        self._row_surfaces = {}
+        # Overlay backgrounds that only change on resize: name -> (key, surface)
+        self._overlay_surfaces = {}
+        # Clickable areas; the main loop hands every event to handle_event once
+        self.widgets = WidgetLayer()
+        self._register_widgets()
+        
+    def handle_event(self, event):
+        """Route one event to the widgets; returns True if the UI used it."""
+        if event.type == pygame.KEYDOWN and self.active and self.conversor_visible:
+            self._converter_key(event)
+            return True
+        widget = self.widgets.dispatch(event)
+        if event.type == pygame.MOUSEBUTTONDOWN and (widget is None or widget.widget_id != 'input'):
+            # Un clic fuera del campo de texto lo desactiva
+            self.active = False
+        return widget is not None
+
+    def _register_widgets(self):
+        """Create the widgets for the bar buttons and every panel; visible() switches them with their panel."""
+        add = self.widgets.add
+        for text, button_rect, button_id in self._buttons():
+            add(Widget(button_id, button_rect, lambda event, button_id=button_id: self._on_bar_button(button_id)))
+
+        converter_open = lambda: self.conversor_visible
+        add(Widget('converter_panel', (0, 580, 440, 235), visible=converter_open, z=1))
+        add(Widget('convert', (65, 680, 300, 40), lambda event: self._convert(), visible=converter_open, z=2))
+        add(Widget('input', (65, 630, 300, 45), lambda event: setattr(self, 'active', True),
+                   visible=converter_open, z=2))
+
+        # The graph's rects depend on the diagram's size and are set when it is drawn
+        graph_open = lambda: self.mostrar_grafico and self.superficie_grafico is not None
+        add(Widget('graph_panel', (0, 0, 0, 0), visible=graph_open, z=3))
+        add(Widget('close_graph', (0, 0, 0, 0), lambda event: setattr(self, 'mostrar_grafico', False),
+                   visible=graph_open, z=4))
+
+        panel_rect, content_rect, close_rect, cargar_rect = self._historial_layout()
+        historial_open = lambda: self.historial_visible
+        add(Widget('historial_panel', panel_rect, visible=historial_open, z=5))
+        add(Widget('historial_rows', content_rect, self._select_row, self._scroll_rows, visible=historial_open, z=6))
+        add(Widget('close_historial', close_rect, lambda event: setattr(self, 'historial_visible', False),
+                   visible=historial_open, z=6))
+        add(Widget('cargar_simulacion', cargar_rect, lambda event: self.cargar_simulacion_seleccionada(),
+                   visible=lambda: self.historial_visible and self.selected_simulation is not None, z=6))
+
+    def _on_bar_button(self, button_id):
+        if button_id == "guardar":
+            self.save_simulation()
+        elif button_id == "historial":
+            self.historial_visible = not self.historial_visible
+        elif button_id == "conversor":
+            self.conversor_visible = not self.conversor_visible
+        elif button_id == "graficar":
+            self.mostrar_grafico = not self.mostrar_grafico
+            if self.mostrar_grafico:
+                self.update_graph()
 
     def save_simulation(self):
         """Envía los datos de la simulación al backend para guardarlos."""
-        url = "http://localhost:5000/api/simulations"
+        if self.save_queue is not None:
+            # Se envía en segundo plano; el historial se invalida cuando el servidor confirma
+            self.save_queue.put(self.last_simulation)
+            print("Simulación en cola para guardar")
+            return
         try:
-            response = requests.post(url, json=self.last_simulation)
+            response = requests.post(API_URL, json=self.last_simulation)
             if response.status_code == 201:
+                self.history.invalidate()
                 print("Simulación guardada exitosamente!")
             else:
                 print("Error guardando la simulación:", response.text)
@@ -65,35 +128,131 @@ class UI:
             
     def load_simulation(self, simulation_id):
         """Carga una simulación guardada desde el backend."""
-        url = f"http://localhost:5000/api/simulations/{simulation_id}"
         try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print("Error cargando la simulación:", response.text)
+            simulation = self.history.client.get_simulation(simulation_id)
+            if simulation is None:
+                print("Error cargando la simulación: no existe", simulation_id)
+            return simulation
         except Exception as e:
             print("Error de conexión:", e)
         return None
 
-    def draw_scene(self, screen, weight, theta1, theta2):
-        """Draw the complete simulation scene."""
-        
-        if hasattr(self, 'has_loaded_simulation') and self.has_loaded_simulation:
-            weight = self.loaded_weight
-            theta1 = self.loaded_theta1
-            theta2 = self.loaded_theta2
-            self.has_loaded_simulation = True # Reiniciar flag después de aplicar
+    def draw_scene(self, screen):
+        """Draw the simulation scene and return the screen rects that changed.
+
+        The background and both bars are composited once into a static layer.
+        Each frame only the rects covered by the previous frame's moving
+        elements are restored from it before the moving elements are drawn
+        again; a frame where nothing changed draws nothing.
+        """
+        anchor1_x, anchor2_x, anchor_y = self.anchors()
+        
+        # Physics results and labels are only recomputed when the state changes
+        body_x, body_y = self.state.derived('physics', self._solve)
+        labels = self.state.derived('labels', self._render_labels)
+        
+        body_x += int(self.body_offset[0])
+        body_y += int(self.body_offset[1])
+        
+        overlays = (self.conversor_visible, self.mostrar_grafico, self.historial_visible,
+                    self.profiler.overlay_visible)
+        frame_key = (self.state.version, body_x, body_y, self.peak_tensions, self._hovered_button(), overlays)
+        
+        full = (self.static_layer is None or self.static_layer.get_size() != screen.get_size()
+                or screen is not self._layer_target)
+        self.scene_changed = full or frame_key != self._frame_key
+        # Overlays are interactive, so they are redrawn every frame while open
+        if not self.scene_changed and not any(overlays):
+            return []
+        self._frame_key = frame_key
+        
+        if full:
+            self._build_static_layer(screen)
+            screen.blit(self.static_layer, (0, 0))
+        else:
+            for rect in self._dirty_rects:
+                screen.blit(self.static_layer, rect, rect)
+        
+        with self.profiler.stage('scene'):
+            rects = self.graphics.draw_scene(screen, body_x, body_y, anchor1_x, anchor2_x, anchor_y,
+                                             self.state.theta1, self.state.theta2, background=False)
+        
+        with self.profiler.stage('hud'):
+            rects += self._draw_measurements(screen, body_x, body_y, labels)
+            
+            # The bars are drawn above the scene: put them back wherever the scene overlapped them
+            for bar in self._bar_rects():
+                for rect in rects:
+                    overlap = rect.clip(bar)
+                    if overlap:
+                        screen.blit(self.static_layer, overlap, overlap)
+            rects += self._draw_ui_elements(screen, labels)
+        
+        with self.profiler.stage('overlays'):
+            if self.conversor_visible:
+                rects.append(self._draw_converter(screen))
+                
+            if self.mostrar_grafico and self.superficie_grafico:
+                rects.append(self._draw_graph(screen))
+                
+            if self.historial_visible:
+                rects.append(self._draw_historial(screen))
         
-        screen.fill(WHITE)
-        mass = weight / GRAVITY
+        if self.profiler.overlay_visible:
+            rects.append(self._draw_profiler(screen))
         
-        anchor1_x = WIDTH // 4
-        anchor2_x = 3 * WIDTH // 4
-        anchor_y = HEIGHT // 4
+        previous = self._dirty_rects
+        self._dirty_rects = [rect for rect in rects if rect]
+        if full:
+            return [screen.get_rect()]
+        return previous + self._dirty_rects
+
+    def invalidate_layers(self):
+        """Rebuild the static layer and redraw the whole screen on the next frame."""
+        self.static_layer = None
+        self._frame_key = None
+        self._overlay_surfaces = {}
+
+    def _overlay_surface(self, name, screen, build, key=None):
+        """Return a reusable overlay surface, calling build(surface_like) only when missing or key changes."""
+        cached = self._overlay_surfaces.get(name)
+        if cached is None or cached[0] != key:
+            cached = self._overlay_surfaces[name] = (key, build(screen))
+        return cached[1]
+
+    def _build_dim_layer(self, screen):
+        """Black at half opacity; surface alpha blends the same as a per-pixel alpha fill, but faster."""
+        layer = pygame.Surface((WIDTH, HEIGHT), 0, screen)
+        layer.fill(BLACK)
+        layer.set_alpha(128)
+        return layer
+
+    def _build_static_layer(self, screen):
+        """Composite everything that never moves: background image and both bars."""
+        anchor1_x, anchor2_x, anchor_y = self.anchors()
+        layer = pygame.Surface(screen.get_size(), 0, screen)
+        layer.fill(WHITE)
+        self.graphics.draw_background(layer, anchor1_x, anchor_y)
+        for bar in self._bar_rects():
+            pygame.draw.rect(layer, BLUE, bar)
+        self.static_layer = layer
+        self._layer_target = screen
+        self._dirty_rects = []
+
+    def _bar_rects(self):
+        return [pygame.Rect(0, 0, WIDTH, 45), pygame.Rect(0, HEIGHT - 45, WIDTH, 45)]
+    
+    def anchors(self):
+        """Return the x of both rope anchors and their shared y."""
+        return WIDTH // 4, 3 * WIDTH // 4, HEIGHT // 4
+
+    def _solve(self):
+        """Compute tensions and body position for the current state."""
+        weight, theta1, theta2 = self.state.weight, self.state.theta1, self.state.theta2
+        anchor1_x, anchor2_x, anchor_y = self.anchors()
         
-        T1, T2 = calculate_tensions(weight, theta1, theta2)
-        T11, T22 = solution(weight, theta1, theta2)
+        table = get_tension_table()
+        T11, T22 = table.solution(weight, theta1, theta2)
         
         self.last_simulation = {
             'weight': int(weight),
@@ -103,55 +262,44 @@ class UI:
             'tension2': T22
         }
         
-        body_x, body_y = calculate_body_position(anchor1_x, anchor2_x, anchor_y, T1, T2, theta1, theta2)
-        
-        self.graphics.draw_scene(screen, body_x, body_y, anchor1_x, anchor2_x, anchor_y, theta1, theta2)
-        self._draw_measurements(screen, body_x, body_y, T11, T22, theta1, theta2, weight, mass)
-        self._draw_ui_elements(screen, weight, theta1, theta2)
-        
-        if self.conversor_visible:
-            self._draw_converter(screen)
-            
-        if self.mostrar_grafico and self.superficie_grafico:
-            self._draw_graph(screen)
-            
-        if self.historial_visible:
-            self._draw_historial(screen)
-    
-    
-    def _draw_measurements(self, screen, body_x, body_y, T11, T22, theta1, theta2, weight, mass):
+        return table.body_position(anchor1_x, anchor2_x, anchor_y, weight, theta1, theta2)
+
+    def _render_labels(self):
+        """Render the measurement and top bar texts for the current state."""
+        self.state.derived('physics', self._solve)
+        weight, theta1, theta2 = self.state.weight, self.state.theta1, self.state.theta2
+        T11 = self.last_simulation['tension1']
+        T22 = self.last_simulation['tension2']
+        mass = weight / GRAVITY
+        font = self.graphics.font
+        
+        return {
+            'T1': self.graphics.render_text(font, f"T1: {T11:.2f} N", BLACK),
+            'T2': self.graphics.render_text(font, f"T2: {T22:.2f} N", BLACK),
+            'theta1': self.graphics.render_text(font, f"θ1: {int(theta1)}°", BLACK),
+            'theta2': self.graphics.render_text(font, f"θ2: {int(theta2)}°", BLACK),
+            'weight': self.graphics.render_text(font, f"P = {int(weight)} N", BLACK),
+            'mass': self.graphics.render_text(font, f"W = {mass:.2f} kg", BLACK),
+            'bar_weight': self.graphics.render_text(font, f"Weight: {int(weight)}N", WHITE),
+            'bar_theta1': self.graphics.render_text(font, f"θ1: {int(theta1)}°", WHITE),
+            'bar_theta2': self.graphics.render_text(font, f"θ2: {int(theta2)}°", WHITE),
+            'bar_T1': self.graphics.render_text(font, f"T1: {T11:.1f}N", WHITE),
+            'bar_T2': self.graphics.render_text(font, f"T2: {T22:.1f}N", WHITE),
+        }
+
+    def _draw_measurements(self, screen, body_x, body_y, labels):
         """Draw all measurement text."""
-        text_T1 = self.graphics.font.render(f"T1: {T11:.2f} N", True, BLACK)
-        text_T2 = self.graphics.font.render(f"T2: {T22:.2f} N", True, BLACK)
-        text_theta1 = self.graphics.font.render(f"θ1: {int(theta1)}°", True, BLACK)
-        text_theta2 = self.graphics.font.render(f"θ2: {int(theta2)}°", True, BLACK)
-        text_weight = self.graphics.font.render(f"P = {int(weight)} N", True, BLACK)
-        text_mass = self.graphics.font.render(f"W = {mass:.2f} kg", True, BLACK)
-        
-        screen.blit(text_T1, (body_x - 150, body_y - 30))
-        screen.blit(text_T2, (body_x + 50, body_y - 30))
-        screen.blit(text_theta1, (body_x - 150, body_y - 60))
-        screen.blit(text_theta2, (body_x + 50, body_y - 60))
-        screen.blit(text_weight, (body_x - 30, body_y + 30))
-        screen.blit(text_mass, (body_x - 30, body_y + 50))
-
-    def _draw_ui_elements(self, screen, weight, theta1, theta2):
-        """Draw UI buttons and elements."""
-        pygame.draw.rect(screen, BLUE, (0, 0, WIDTH, 45))
-        pygame.draw.rect(screen, BLUE, (0, HEIGHT - 45, WIDTH, 45))
-        
-        weight_text = self.graphics.font.render(f"Weight: {int(weight)}N", True, WHITE)
-        theta1_text = self.graphics.font.render(f"θ1: {int(theta1)}°", True, WHITE)
-        theta2_text = self.graphics.font.render(f"θ2: {int(theta2)}°", True, WHITE)
-        tension1_text = self.graphics.font.render(f"T1: {self.last_simulation['tension1']:.1f}N", True, WHITE)
-        tension2_text = self.graphics.font.render(f"T2: {self.last_simulation['tension2']:.1f}N", True, WHITE)
-        
-        screen.blit(weight_text, (10, 10))
-        screen.blit(theta1_text, (200, 10))
-        screen.blit(theta2_text, (350, 10))
-        screen.blit(tension1_text, (500, 10))
-        screen.blit(tension2_text, (650, 10))
-        
+        return [
+            screen.blit(labels['T1'], (body_x - 150, body_y - 30)),
+            screen.blit(labels['T2'], (body_x + 50, body_y - 30)),
+            screen.blit(labels['theta1'], (body_x - 150, body_y - 60)),
+            screen.blit(labels['theta2'], (body_x + 50, body_y - 60)),
+            screen.blit(labels['weight'], (body_x - 30, body_y + 30)),
+            screen.blit(labels['mass'], (body_x - 30, body_y + 50)),
+        ]
+
+    def _buttons(self):
+        """Return (text, rect, button_id) for every button of the bottom bar."""
         button_width = 150
         button_height = 35
         button_margin = 20
@@ -159,178 +307,197 @@ class UI:
         button_y = HEIGHT - 40
         
         buttons = [
-            ("Conversor", start_x, "conversor"),
-            ("Graficar", start_x + button_width + button_margin, "graficar"),
-            ("Historial", start_x + 2 * (button_width + button_margin), "historial"),
-            ("Guardar", start_x + 3 * (button_width + button_margin), "guardar")
+            ("Conversor", "conversor"),
+            ("Graficar", "graficar"),
+            ("Historial", "historial"),
+            ("Guardar", "guardar")
+        ]
+        return [(text, pygame.Rect(start_x + i * (button_width + button_margin), button_y, button_width, button_height), button_id)
+                for i, (text, button_id) in enumerate(buttons)]
+
+    def _hovered_button(self):
+        widget = self.widgets.hit(pygame.mouse.get_pos())
+        return widget.widget_id if widget is not None else None
+
+    def _draw_ui_elements(self, screen, labels):
+        """Draw the bar texts and buttons; the bars themselves are in the static layer."""
+        rects = [
+            screen.blit(labels['bar_weight'], (10, 10)),
+            screen.blit(labels['bar_theta1'], (200, 10)),
+            screen.blit(labels['bar_theta2'], (350, 10)),
+            screen.blit(labels['bar_T1'], (500, 10)),
+            screen.blit(labels['bar_T2'], (650, 10)),
         ]
         
-        mouse_pos = pygame.mouse.get_pos()
+        if self.peak_tensions is not None:
+            peak1, peak2 = self.peak_tensions
+            peak_text = self.graphics.render_text(self.graphics.font, f"Pico T1: {peak1:.1f}N  T2: {peak2:.1f}N", WHITE)
+            rects.append(screen.blit(peak_text, (800, 10)))
         
-        for text, x, button_id in buttons:
-            button_rect = pygame.Rect(x, button_y, button_width, button_height)
-            
-            if button_rect.collidepoint(mouse_pos):
+        hovered = self._hovered_button()
+        
+        for text, button_rect, button_id in self._buttons():
+            if button_id == hovered:
                 pygame.draw.rect(screen, (0, 50, 100), button_rect)
-                
-                if self.handle_click(button_id):
-                    if text == "Guardar":
-                        self.save_simulation()
-                    elif text == "Historial":
-                        self.historial_visible = not self.historial_visible
-                    elif text == "Conversor":
-                        self.conversor_visible = not self.conversor_visible
-                    elif text == "Graficar":
-                        if self.superficie_grafico is None:
-                            self.superficie_grafico = self.graphics.create_graph(
-                                int(weight), int(theta1), int(theta2),
-                                self.last_simulation['tension1'],
-                                self.last_simulation['tension2']
-                            )
-                        self.mostrar_grafico = not self.mostrar_grafico
             else:
                 pygame.draw.rect(screen, BLUE, button_rect)
                 
             pygame.draw.rect(screen, WHITE, button_rect, 1)
-            text_surface = self.graphics.font.render(text, True, WHITE)
+            text_surface = self.graphics.render_text(self.graphics.font, text, WHITE)
             text_rect = text_surface.get_rect(center=button_rect.center)
             screen.blit(text_surface, text_rect)
+            rects.append(button_rect)
+        return rects
 
     def _draw_converter(self, screen):
-        """Draw the converter interface."""
-        pygame.draw.rect(screen, BLUE, (0, 580, 440, 235))
-        pygame.draw.rect(screen, WHITE, (7, 590, 422, 215))
-        
-        title = self.graphics.font_large.render('Conversor de Kg a N', True, BLACK)
-        result = self.graphics.font_large.render(f"{self.result_conversion:.2f} N", True, BLACK)
+        """Draw the converter interface and return the rect it covers."""
+        panel_rect = screen.blit(self._overlay_surface('converter', screen, self._build_converter_box), (0, 580))
         
-        screen.blit(title, (70, 600))
+        result = self.graphics.render_text(self.graphics.font_large, f"{self.result_conversion:.2f} N", BLACK)
         screen.blit(result, (145, 730))
         
-        convert_button = pygame.Rect(65, 680, 300, 40)
-        pygame.draw.rect(screen, BLACK, convert_button)
-        convert_text = self.graphics.font_large.render('Convertir', True, WHITE)
-        screen.blit(convert_text, (155, 685))
-        
-        input_rect = pygame.Rect(65, 630, 300, 45)
+        input_rect = self.widgets.get('input').rect
         color = (30, 144, 255) if self.active else BLACK
         pygame.draw.rect(screen, color, input_rect, 2)
-        text_surface = self.graphics.font.render(self.text, True, BLACK)
+        text_surface = self.graphics.render_text(self.graphics.font, self.text, BLACK)
         screen.blit(text_surface, (input_rect.x + 5, input_rect.y + 5))
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        if convert_button.collidepoint(mouse_pos):
-            if self.handle_click("convert"):
-                try:
-                    kg = float(self.text)
-                    self.result_conversion = conversor(kg)
-                except ValueError:
-                    self.result_conversion = 0
-                
-        if input_rect.collidepoint(mouse_pos):
-            if self.handle_click("input"):
-                self.active = not self.active
+        return panel_rect
+
+    def _convert(self):
+        try:
+            kg = float(self.text)
+            self.result_conversion = conversor(kg)
+        except ValueError:
+            self.result_conversion = 0
+
+    def _converter_key(self, event):
+        """Text entry in the converter while its field is active."""
+        if event.key == pygame.K_BACKSPACE:
+            self.text = self.text[:-1]
+        elif event.key == pygame.K_RETURN:
+            self._convert()
+            self.active = False
+        elif event.unicode.isdigit() or event.unicode == '.':
+            self.text += event.unicode
+
+    def _build_converter_box(self, screen):
+        """The converter panel without its changing parts (result, input box); drawn at (0, 580)."""
+        box = pygame.Surface((440, 235), 0, screen)
+        box.fill(BLUE)
+        pygame.draw.rect(box, WHITE, (7, 10, 422, 215))
+        title = self.graphics.render_text(self.graphics.font_large, 'Conversor de Kg a N', BLACK)
+        box.blit(title, (70, 20))
+        pygame.draw.rect(box, BLACK, (65, 100, 300, 40))
+        convert_text = self.graphics.render_text(self.graphics.font_large, 'Convertir', WHITE)
+        box.blit(convert_text, (155, 105))
+        return box
+
+    def update_graph(self):
+        """Bring the force diagram up to date with the state.
+
+        With a graph worker the new diagram is requested in the background
+        and the last finished one stays on screen until it arrives. If the
+        worker dies, the diagram is drawn synchronously again.
+        """
+        if self.graph_worker is not None:
+            state = self.state
+            if self._graph_requested != state.version:
+                self.graph_worker.request(state.version, state.weight, state.theta1, state.theta2)
+                self._graph_requested = state.version
             
-        if self.active:
-            for event in pygame.event.get(pygame.KEYDOWN):
-                if event.key == pygame.K_BACKSPACE:
-                    self.text = self.text[:-1]
-                elif event.key == pygame.K_RETURN:
-                    try:
-                        kg = float(self.text)
-                        self.result_conversion = conversor(kg)
-                    except ValueError:
-                        self.result_conversion = 0
-                    self.active = False
-                elif event.unicode.isdigit() or event.unicode == '.':
-                    self.text += event.unicode
+            result = self.graph_worker.poll()
+            if result is not None:
+                self.superficie_grafico = result[1]
+            if not self.graph_worker.failed:
+                return
+            # The worker process is gone: draw the diagram here from now on
+            self.graph_worker.close()
+            self.graph_worker = None
+        
+        self.superficie_grafico = self.state.derived('graph', self._create_graph)
+
+    def _create_graph(self):
+        state = self.state
+        T1, T2 = get_tension_table().tensions(state.weight, state.theta1, state.theta2)
+        return self.graphics.create_graph(state.weight, state.theta1, state.theta2, T1, T2)
 
     def _draw_graph(self, screen):
-        """Draw the force diagram graph."""
+        """Draw the force diagram graph and return the rect it covers."""
         if self.superficie_grafico is None:
-            return
+            return None
             
         grafico_x = WIDTH - self.superficie_grafico.get_width() - 10
         grafico_y = HEIGHT - self.superficie_grafico.get_height() - 70
         
-        fondo_grafico = pygame.Surface((self.superficie_grafico.get_width() + 20, 
-                                      self.superficie_grafico.get_height() + 20))
-        fondo_grafico.fill(WHITE)
-        screen.blit(fondo_grafico, (grafico_x - 10, grafico_y - 10))
-        
-        pygame.draw.rect(screen, BLACK, (grafico_x - 10, grafico_y - 10, 
-                     self.superficie_grafico.get_width() + 20, 
-                     self.superficie_grafico.get_height() + 20), 2)
+        size = self.superficie_grafico.get_size()
+        fondo_grafico = self._overlay_surface('graph', screen, lambda screen: self._build_graph_frame(screen, size),
+                                              key=size)
+        frame_rect = screen.blit(fondo_grafico, (grafico_x - 10, grafico_y - 10))
+        self.widgets.move('graph_panel', frame_rect)
         
         screen.blit(self.superficie_grafico, (grafico_x, grafico_y))
         
         close_button = pygame.Rect(grafico_x + self.superficie_grafico.get_width() - 20, grafico_y - 5, 20, 20)
         pygame.draw.rect(screen, BLUE, close_button)
-        close_text = self.graphics.font.render("X", True, WHITE)
+        close_text = self.graphics.render_text(self.graphics.font, "X", WHITE)
         close_rect = close_text.get_rect(center=close_button.center)
         screen.blit(close_text, close_rect)
-        
-        mouse_pos = pygame.mouse.get_pos()
-        
-        if close_button.collidepoint(mouse_pos):
-            if self.handle_click("close_graph"):
-                self.mostrar_grafico = False
-        
+        self.widgets.move('close_graph', close_button)
+        return frame_rect
+        
+    def _build_graph_frame(self, screen, size):
+        """White background with a black border around a diagram of the given size."""
+        frame = pygame.Surface((size[0] + 20, size[1] + 20), 0, screen)
+        frame.fill(WHITE)
+        pygame.draw.rect(frame, BLACK, frame.get_rect(), 2)
+        return frame
+
+    def _draw_profiler(self, screen):
+        """Draw the per-stage p50/p95/p99 frame timings (ms) and return the rect they cover."""
+        rows = [("Etapa (ms)", "p50", "p95", "p99")]
+        for name, stats in self.profiler.recent_summary(PROFILER_OVERLAY_INTERVAL).items():
+            rows.append((name, f"{stats['p50']:.2f}", f"{stats['p95']:.2f}", f"{stats['p99']:.2f}"))
+        
+        font = self.graphics.font
+        line_height = font.get_linesize()
+        col_x = [0, 120, 185, 250]
+        panel = pygame.Rect(WIDTH - 330, 55, 320, line_height * len(rows) + 10)
+        pygame.draw.rect(screen, BLACK, panel)
+        for i, row in enumerate(rows):
+            for x, text in zip(col_x, row):
+                screen.blit(self.graphics.render_text(font, text, WHITE), (panel.x + 8 + x, panel.y + 5 + i * line_height))
+        return panel
+
     def _draw_historial(self, screen):
         """Dibuja la ventana de historial con mejor organización y función de cargar."""
         if not self.historial_visible:
-            return
-
-        padding = 20
-        historial_width = 600
-        historial_height = 450  # Aumentado para dar más espacio
-        x = (WIDTH - historial_width) // 2
-        y = (HEIGHT - historial_height) // 2
-        
-        # Fondo semitransparente
-        background = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(background, (0, 0, 0, 128), (0, 0, WIDTH, HEIGHT))
-        screen.blit(background, (0, 0))
-
-        # Ventana principal
-        pygame.draw.rect(screen, WHITE, (x, y, historial_width, historial_height))
-        pygame.draw.rect(screen, BLUE, (x, y, historial_width, historial_height), 2)
-
-        # Título
-        title = self.graphics.font_large.render("Historial de Simulaciones", True, BLUE)
-        title_rect = title.get_rect(centerx=x + historial_width//2, top=y + padding)
-        screen.blit(title, title_rect)
+            return None
 
-        # Área de contenido
-        content_rect = pygame.Rect(
-            x + padding, 
-            y + title_rect.height + padding*2,
-            historial_width - padding*2, 
-            historial_height - title_rect.height - padding*4 - 40  # Espacio para botón cargar
-        )
-        pygame.draw.rect(screen, (240, 240, 240), content_rect)
-
-        # Encabezados de columnas
+        panel_rect, content_rect, close_button, cargar_button_rect = self._historial_layout()
+        x, y = panel_rect.topleft
         header_y = content_rect.top + 5
         col_widths = [45, 100, 80, 80, 140, 135]  # Ancho de cada columna
-        header_texts = ["#", "Peso", "Ángulo 1", "Ángulo 2", "Tensión 1", "Tensión 2"]
-        header_x = content_rect.left + 5
         
-        for i, text in enumerate(header_texts):
-            header_surface = self.graphics.font.render(text, True, BLUE)
-            screen.blit(header_surface, (header_x, header_y))
-            header_x += col_widths[i]
-        
-        # Línea divisora debajo de los encabezados
-        pygame.draw.line(screen, BLUE, 
-                        (content_rect.left, header_y + 25), 
-                        (content_rect.right, header_y + 25), 1)
+        # Fondo semitransparente
+        dim_rect = screen.blit(self._overlay_surface('dim', screen, self._build_dim_layer), (0, 0))
+
+        # Ventana principal con título y encabezados, dibujada una sola vez
+        panel = self._overlay_surface('historial', screen, lambda screen: self._build_historial_panel(
+            screen, panel_rect.width, panel_rect.height, content_rect.move(-x, -y), col_widths))
+        screen.blit(panel, (x, y))
 
         # Mostrar datos de simulaciones
         historial = self.obtener_historial()
-        line_height = 35  # Altura de cada fila
-        self.selected_simulation = getattr(self, 'selected_simulation', None)
+        if not historial:
+            if self.history.loading:
+                message = "Cargando historial..."
+            elif self.history.error:
+                message = "No se pudo conectar con el servidor"
+            else:
+                message = "No hay simulaciones guardadas"
+            message_surface = self.graphics.render_text(self.graphics.font, message, BLACK)
+            screen.blit(message_surface, message_surface.get_rect(center=content_rect.center))
+        line_height = self.ROW_HEIGHT
         
         # Área visible para las filas (después de los encabezados)
         data_start_y = header_y + 30
@@ -339,91 +506,39 @@ class UI:
         # Calcular simulaciones visibles
         simulaciones_visibles = len(historial)
         max_scroll = max(0, (simulaciones_visibles * line_height) - visible_height)
+        self._max_scroll = max_scroll
         self.scroll_y = min(self.scroll_y, max_scroll)  # Prevenir scroll excesivo
         
-        for i, sim in enumerate(historial):
+        # Solo se recorren las filas dentro del área visible
+        first_row = max(0, -(-self.scroll_y // line_height))
+        last_row = min(simulaciones_visibles, (self.scroll_y + visible_height) // line_height + 1)
+        # Pedir la siguiente página antes de llegar al final de lo cargado
+        self.history.request_rows(last_row + HISTORY_PREFETCH_ROWS)
+
+        # Las filas que salen de la vista dejan de estar en caché
+        self._row_surfaces = {i: self._row_surfaces[i] for i in range(first_row, last_row) if i in self._row_surfaces}
+        for i in range(first_row, last_row):
+            sim = historial[i]
             y_pos = data_start_y + i * line_height - self.scroll_y
             
             # Solo dibujar si está dentro del área visible
             if data_start_y <= y_pos < content_rect.bottom:
-                # Alternar colores para filas
-                row_color = (230, 230, 240) if i % 2 == 0 else (245, 245, 250)
-                
-                # Si esta fila está seleccionada, usar un color distinto
-                if self.selected_simulation == i:
-                    row_color = (200, 220, 255)
-                    
-                pygame.draw.rect(screen, row_color,
-                            (content_rect.left, y_pos, content_rect.width, line_height))
-                
-                # Dibujar datos en columnas
-                col_x = content_rect.left + 5
-                
-                # Número de simulación
-                num_text = f"#{i+1}"
-                num_surface = self.graphics.font.render(num_text, True, BLACK)
-                screen.blit(num_surface, (col_x, y_pos + (line_height - num_surface.get_height())//2))
-                col_x += col_widths[0]
-                
-                # Peso
-                weight_text = f"P={sim['weight']}N"
-                weight_surface = self.graphics.font.render(weight_text, True, BLACK)
-                screen.blit(weight_surface, (col_x, y_pos + (line_height - weight_surface.get_height())//2))
-                col_x += col_widths[1]
-                
-                # Ángulo 1
-                theta1_text = f"θ1={sim['theta1']}°"
-                theta1_surface = self.graphics.font.render(theta1_text, True, BLACK)
-                screen.blit(theta1_surface, (col_x, y_pos + (line_height - theta1_surface.get_height())//2))
-                col_x += col_widths[2]
-                
-                # Ángulo 2
-                theta2_text = f"θ2={sim['theta2']}°"
-                theta2_surface = self.graphics.font.render(theta2_text, True, BLACK)
-                screen.blit(theta2_surface, (col_x, y_pos + (line_height - theta2_surface.get_height())//2))
-                col_x += col_widths[3]
-                
-                # Tensión 1
-                t1_text = f"T1={sim['tension1']:.1f}N"
-                t1_surface = self.graphics.font.render(t1_text, True, BLACK)
-                screen.blit(t1_surface, (col_x, y_pos + (line_height - t1_surface.get_height())//2))
-                col_x += col_widths[4]
-                
-                # Tensión 2
-                t2_text = f"T2={sim['tension2']:.1f}N"
-                t2_surface = self.graphics.font.render(t2_text, True, BLACK)
-                screen.blit(t2_surface, (col_x, y_pos + (line_height - t2_surface.get_height())//2))
-                
-                # Línea divisora entre filas
-                pygame.draw.line(screen, (200, 200, 200), 
-                                (content_rect.left, y_pos + line_height), 
-                                (content_rect.right, y_pos + line_height), 1)
-                
-                # Detectar clic en la fila para selección
-                mouse_pos = pygame.mouse.get_pos()
-                row_rect = pygame.Rect(content_rect.left, y_pos, content_rect.width, line_height)
-                if row_rect.collidepoint(mouse_pos) and self.handle_click(f"select_sim_{i}"):
-                    self.selected_simulation = i
+                # Cada fila se dibuja una sola vez y se reutiliza mientras no cambie
+                screen.blit(self._history_row(i, sim, content_rect.width, line_height, col_widths),
+                            (content_rect.left, y_pos))
 
         # Botón de cargar
-        cargar_button_rect = pygame.Rect(
-            x + historial_width//2 - 75,
-            y + historial_height - padding - 35,
-            150,
-            35
-        )
         cargar_color = (0, 120, 0) if self.selected_simulation is not None else (150, 150, 150)
         pygame.draw.rect(screen, cargar_color, cargar_button_rect)
         pygame.draw.rect(screen, WHITE, cargar_button_rect, 1)
         
-        cargar_text = self.graphics.font.render("Cargar Simulación", True, WHITE)
+        cargar_text = self.graphics.render_text(self.graphics.font, "Cargar Simulación", WHITE)
         cargar_text_rect = cargar_text.get_rect(center=cargar_button_rect.center)
         screen.blit(cargar_text, cargar_text_rect)
         
         # Botón de cerrar
-        close_button = pygame.Rect(x + historial_width - 40, y + 10, 30, 30)
         pygame.draw.rect(screen, BLUE, close_button)
-        close_text = self.graphics.font.render("X", True, WHITE)
+        close_text = self.graphics.render_text(self.graphics.font, "X", WHITE)
         close_rect = close_text.get_rect(center=close_button.center)
         screen.blit(close_text, close_rect)
 
@@ -442,24 +557,101 @@ class UI:
             pygame.draw.rect(screen, BLUE,
                         (content_rect.right - scrollbar_width - 3, scrollbar_y,
                             scrollbar_width, scrollbar_height))
+        return dim_rect
+
+    def _historial_layout(self):
+        """Rects of the history window: the window, its content area and the close and load buttons."""
+        padding = 20
+        historial_width = 600
+        historial_height = 450  # Aumentado para dar más espacio
+        x = (WIDTH - historial_width) // 2
+        y = (HEIGHT - historial_height) // 2
+        title_height = self.graphics.font_large.get_height()
+        panel_rect = pygame.Rect(x, y, historial_width, historial_height)
+        # Área de contenido, debajo del título
+        content_rect = pygame.Rect(
+            x + padding, 
+            y + title_height + padding*2,
+            historial_width - padding*2, 
+            historial_height - title_height - padding*4 - 40  # Espacio para botón cargar
+        )
+        close_rect = pygame.Rect(x + historial_width - 40, y + 10, 30, 30)
+        cargar_rect = pygame.Rect(x + historial_width//2 - 75, y + historial_height - padding - 35, 150, 35)
+        return panel_rect, content_rect, close_rect, cargar_rect
 
-        # Manejo de eventos
-        mouse_pos = pygame.mouse.get_pos()
+    def _select_row(self, event):
+        """Select the history row under a click in the content area."""
+        content_rect = self.widgets.get('historial_rows').rect
+        data_start_y = content_rect.top + 35  # Debajo de los encabezados
+        if event.pos[1] < data_start_y:
+            return
+        i = (event.pos[1] - data_start_y + self.scroll_y) // self.ROW_HEIGHT
+        # La fila cortada por arriba no se dibuja, así que no se puede elegir
+        if data_start_y + i * self.ROW_HEIGHT - self.scroll_y < data_start_y:
+            return
+        if i < len(self.obtener_historial()):
+            self.selected_simulation = i
+
+    def _scroll_rows(self, event):
+        self.scroll_y = max(0, min(self.scroll_y - event.y * 20, self._max_scroll))
+
+    def _build_historial_panel(self, screen, width, height, content_rect, col_widths):
+        """The history window without its rows: frame, title, content area and column headers."""
+        panel = pygame.Surface((width, height), 0, screen)
+        panel.fill(WHITE)
+        pygame.draw.rect(panel, BLUE, panel.get_rect(), 2)
+
+        padding = 20
+        title = self.graphics.render_text(self.graphics.font_large, "Historial de Simulaciones", BLUE)
+        panel.blit(title, title.get_rect(centerx=width//2, top=padding))
+        pygame.draw.rect(panel, (240, 240, 240), content_rect)
+
+        # Encabezados de columnas
+        header_y = content_rect.top + 5
+        header_texts = ["#", "Peso", "Ángulo 1", "Ángulo 2", "Tensión 1", "Tensión 2"]
+        header_x = content_rect.left + 5
+        for text, col_width in zip(header_texts, col_widths):
+            header_surface = self.graphics.render_text(self.graphics.font, text, BLUE)
+            panel.blit(header_surface, (header_x, header_y))
+            header_x += col_width
         
-        # Cerrar historial
-        if close_button.collidepoint(mouse_pos):
-            if self.handle_click("close_historial"):
-                self.historial_visible = False
-                
-        # Cargar simulación seleccionada
-        if cargar_button_rect.collidepoint(mouse_pos) and self.selected_simulation is not None:
-            if self.handle_click("cargar_simulacion"):
-                self.cargar_simulacion_seleccionada()
+        # Línea divisora debajo de los encabezados
+        pygame.draw.line(panel, BLUE, 
+                        (content_rect.left, header_y + 25), 
+                        (content_rect.right, header_y + 25), 1)
+        return panel
+
+    def _history_row(self, i, sim, width, line_height, col_widths):
+        """Return the surface of one history row, rendered again only when its data or selection changes."""
+        key = (sim['weight'], sim['theta1'], sim['theta2'], sim['tension1'], sim['tension2'],
+               self.selected_simulation == i)
+        cached = self._row_surfaces.get(i)
+        if cached is not None and cached[0] == key:
+            return cached[1]
 
-        # Manejo del scroll
-        for event in pygame.event.get(pygame.MOUSEWHEEL):
-            if content_rect.collidepoint(mouse_pos):
-                self.scroll_y = max(0, min(self.scroll_y - event.y * 20, max_scroll))
+        # One pixel wider and taller for the divider line; the rest of that margin stays transparent
+        surface = pygame.Surface((width + 1, line_height + 1))
+        surface.fill(ROW_COLORKEY)
+        surface.set_colorkey(ROW_COLORKEY)
+
+        # Alternar colores para filas; la seleccionada usa un color distinto
+        row_color = (230, 230, 240) if i % 2 == 0 else (245, 245, 250)
+        if self.selected_simulation == i:
+            row_color = (200, 220, 255)
+        pygame.draw.rect(surface, row_color, (0, 0, width, line_height))
+
+        texts = [f"#{i+1}", f"P={sim['weight']}N", f"θ1={sim['theta1']}°", f"θ2={sim['theta2']}°",
+                 f"T1={sim['tension1']:.1f}N", f"T2={sim['tension2']:.1f}N"]
+        col_x = 5
+        for text, col_width in zip(texts, col_widths):
+            text_surface = self.graphics.render_text(self.graphics.font, text, BLACK)
+            surface.blit(text_surface, (col_x, (line_height - text_surface.get_height())//2))
+            col_x += col_width
+
+        # Línea divisora entre filas
+        pygame.draw.line(surface, (200, 200, 200), (0, line_height), (width, line_height), 1)
+        self._row_surfaces[i] = (key, surface)
+        return surface
 
     def cargar_simulacion_seleccionada(self):
         """Carga la simulación seleccionada a la interfaz."""
@@ -470,32 +662,29 @@ class UI:
         if 0 <= self.selected_simulation < len(historial):
             sim = historial[self.selected_simulation]
             
-            # Aquí devolvemos los valores para ser utilizados en la interfaz principal
-            # Se pueden devolver como variables globales o como atributos de la clase
-            # para que el programa principal los utilice
-            self.loaded_weight = sim['weight']
-            self.loaded_theta1 = sim['theta1']
-            self.loaded_theta2 = sim['theta2']
+            # Los valores cargados pasan directamente al estado de la simulación
+            self.state.update_state(weight=sim['weight'], theta1=sim['theta1'], theta2=sim['theta2'])
             
             # Notificar que se ha cargado una simulación
             print(f"Simulación cargada: Peso={sim['weight']}N, θ1={sim['theta1']}°, θ2={sim['theta2']}°")
             
             # Opcional: cerrar el historial después de cargar
             self.historial_visible = False
-            
-            # Este flag indicará que hay valores cargados pendientes de aplicar
-            self.has_loaded_simulation = True
 
 
     def obtener_historial(self):
-        """Obtiene el historial de simulaciones desde el backend."""
-        url = "http://localhost:5000/api/simulations"
-        try:
-            response = requests.get(url)
-            if response.status_code == 200:
-                return response.json()
-            else:
-                print("Error obteniendo el historial:", response.text)
-        except Exception as e:
-            print("Error de conexión:", e)
-        return []
\ No newline at end of file
+        """Devuelve el historial en caché; se actualiza en segundo plano sin bloquear el dibujo."""
+        historial, inserted, resets = self.history.snapshot()
+        if resets != self._history_resets:
+            # The list was loaded again from scratch: old indices mean nothing
+            self.selected_simulation = None
+            self.scroll_y = 0
+        elif inserted != self._history_inserted:
+            # New rows above the loaded ones: follow the rows the user was looking at
+            shift = inserted - self._history_inserted
+            if self.selected_simulation is not None:
+                self.selected_simulation += shift
+            if self.scroll_y > 0:
+                self.scroll_y += shift * self.ROW_HEIGHT
+        self._history_inserted, self._history_resets = inserted, resets
+        return historial
@@ -0,0 +1,105 @@
+import pygame
+
+class Widget:
+    """A rect that takes pointer input.
+
+    on_click and on_wheel receive the pygame event; a widget without
+    handlers still takes the events that land on it, so panels can stop
+    clicks from reaching what is drawn underneath. visible() decides
+    whether the widget takes input right now; among overlapping widgets
+    the one with the highest z wins.
+    """
+
+    __slots__ = ('widget_id', 'rect', 'on_click', 'on_wheel', 'visible', 'z')
+
+    def __init__(self, widget_id, rect, on_click=None, on_wheel=None, visible=None, z=0):
+        self.widget_id = widget_id
+        self.rect = pygame.Rect(rect)
+        self.on_click = on_click
+        self.on_wheel = on_wheel
+        self.visible = visible
+        self.z = z
+
+    def active(self):
+        return self.visible is None or self.visible()
+
+class WidgetLayer:
+    """Routes pointer events to widgets through a uniform grid of their rects.
+
+    Every widget is listed in each grid cell its rect touches, so finding
+    the widget under the pointer only looks at the few widgets of one cell
+    however many there are. Events are handed in once by the main loop.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self._widgets = {}
+        self._cells = {}
+
+    def add(self, widget):
+        self.remove(widget.widget_id)
+        self._widgets[widget.widget_id] = widget
+        self._index(widget)
+        return widget
+
+    def remove(self, widget_id):
+        widget = self._widgets.pop(widget_id, None)
+        if widget is not None:
+            self._unindex(widget)
+
+    def get(self, widget_id):
+        return self._widgets.get(widget_id)
+
+    def move(self, widget_id, rect):
+        """Give a widget a new rect, e.g. when the panel it belongs to changes size."""
+        widget = self._widgets[widget_id]
+        if widget.rect == rect:
+            return
+        self._unindex(widget)
+        widget.rect = pygame.Rect(rect)
+        self._index(widget)
+
+    def hit(self, pos):
+        """Return the topmost active widget at pos, or None."""
+        cell = (pos[0] // self.cell_size, pos[1] // self.cell_size)
+        best = None
+        for widget in self._cells.get(cell, ()):
+            if (best is None or widget.z > best.z) and widget.rect.collidepoint(pos) and widget.active():
+                best = widget
+        return best
+
+    def dispatch(self, event):
+        """Hand one event to the widget under the pointer; returns that widget, or None if none took it."""
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            widget = self.hit(event.pos)
+            if widget is not None and event.button == 1 and widget.on_click:
+                widget.on_click(event)
+            return widget
+        if event.type == pygame.MOUSEWHEEL:
+            widget = self.hit(pygame.mouse.get_pos())
+            if widget is not None and widget.on_wheel:
+                widget.on_wheel(event)
+            return widget
+        return None
+
+    def _cells_of(self, rect):
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield (cx, cy)
+
+    def _index(self, widget):
+        if widget.rect.width <= 0 or widget.rect.height <= 0:
+            return
+        for cell in self._cells_of(widget.rect):
+            self._cells.setdefault(cell, []).append(widget)
+
+    def _unindex(self, widget):
+        if widget.rect.width <= 0 or widget.rect.height <= 0:
+            return
+        for cell in self._cells_of(widget.rect):
+            widgets = self._cells.get(cell)
+            if widgets is not None:
+                widgets.remove(widget)
+                if not widgets:
+                    del self._cells[cell]
@@ -1,4 +1,4 @@
-from core.simulator import PhysicsSimulator
+from frameworks.simulator import PhysicsSimulator
 
 def main():
     simulator = PhysicsSimulator()
@@ -9,4 +9,7 @@ const SimulationSchema = new mongoose.Schema({
     createdAt: { type: Date, default: Date.now },
 });
 
+// Serves the history's newest-first sort, including its tiebreak on _id
+SimulationSchema.index({ createdAt: -1, _id: -1 });
+
 module.exports = mongoose.model('Simulation', SimulationSchema);
\ No newline at end of file
@@ -1,11 +1,14 @@
 const express = require('express');
-const { saveSimulation, getSimulations, getSimulationById } = require('../controllers/simulationController');
+const { saveSimulation, saveSimulations, getSimulations, getSimulationById } = require('../controllers/simulationController');
 
 const router = express.Router();
 
 // Guardar una simulación
 router.post('/', saveSimulation);
 
+// Guardar varias simulaciones en una sola petición
+router.post('/bulk', saveSimulations);
+
 // Obtener todas las simulaciones
 router.get('/', getSimulations);
 
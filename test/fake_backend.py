@@ -0,0 +1,82 @@
+"""Stand-in for the Node backend's /api/simulations routes, for tests.
+
+Serves an in-memory list on a local port with the same paging (limit,
+offset, X-Total-Count) and conditional GET (ETag, If-None-Match) behaviour.
+"""
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+class FakeBackend:
+
+    def __init__(self, simulations=()):
+        self.simulations = list(simulations)  # newest first, like the real sort
+        self.requests = []
+        self.connections = 0
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/simulations"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def add(self, simulation):
+        self.simulations.insert(0, dict(simulation, _id=str(len(self.simulations) + 1)))
+
+    def _handler(self):
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                backend.connections += 1
+                super().setup()
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path = parsed.path.rstrip('/')
+                backend.requests.append((path, parsed.query))
+                if path == '/api/simulations':
+                    query = parse_qs(parsed.query)
+                    limit = int(query.get('limit', ['0'])[0])
+                    offset = int(query.get('offset', ['0'])[0])
+                    headers = {}
+                    items = backend.simulations
+                    if limit > 0:
+                        items = items[offset:offset + limit]
+                        headers['X-Total-Count'] = str(len(backend.simulations))
+                    self._send(200, items, headers)
+                    return
+                simulation_id = path.rsplit('/', 1)[-1]
+                for simulation in backend.simulations:
+                    if simulation.get('_id') == simulation_id:
+                        self._send(200, simulation)
+                        return
+                self._send(404, {'message': 'Simulación no encontrada'})
+
+            def _send(self, status, payload, headers=None):
+                body = json.dumps(payload).encode()
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if status == 200 and self.headers.get('If-None-Match') == etag:
+                    status, body = 304, b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
@@ -0,0 +1,42 @@
+"""Helpers shared by the tests: polling for background work, an in-memory
+history source and a display set up for the UI tests.
+"""
+import os
+import sys
+import time
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from config.constant import WIDTH, HEIGHT
+from interfaces.graphicInterface import GraphicsManager
+
+def wait_until(condition, timeout=5):
+    """Poll condition() until it is true; fail after timeout seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.005)
+
+class ListHistory:
+    """History client over a list of count rows, for HistoryCache(client=...)."""
+
+    def __init__(self, count=100):
+        self.rows = [{'_id': str(i), 'weight': i, 'theta1': 30, 'theta2': 45, 'tension1': 1.0, 'tension2': 2.0}
+                     for i in range(count)]
+
+    def fetch_page(self, offset, limit):
+        return self.rows[offset:offset + limit], len(self.rows)
+
+class UITestCase(unittest.TestCase):
+    """Opens a WIDTH x HEIGHT window on the dummy driver and shares one GraphicsManager."""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.font.init()
+        cls.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        cls.graphics = GraphicsManager()
@@ -0,0 +1,102 @@
+import os
+import sys
+import tempfile
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from interfaces.assetPack import AssetPack, build_pack, load_assets
+
+class TestAssetPack(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((64, 64))
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        sprite = pygame.Surface((40, 30), pygame.SRCALPHA)
+        sprite.fill((200, 30, 30, 128))
+        pygame.draw.circle(sprite, (0, 90, 200, 255), (20, 15), 10)
+        background = pygame.Surface((50, 50))
+        background.fill((10, 120, 40))
+        pygame.draw.line(background, (255, 255, 255), (0, 0), (49, 49), 3)
+
+        self.specs = {}
+        for name, image, size, alpha in (('sprite', sprite, (25, 17), True), ('fondo', background, (77, 60), False)):
+            path = os.path.join(self.tmp.name, f'{name}.png')
+            pygame.image.save(image, path)
+            self.specs[name] = (path, size, alpha)
+        self.pack_path = os.path.join(self.tmp.name, 'assets.pack')
+
+    def test_pack_matches_decoded_images(self):
+        build_pack(self.specs, self.pack_path)
+        packed = load_assets(self.specs, self.pack_path)
+        decoded = load_assets(self.specs, os.path.join(self.tmp.name, 'missing.pack'))
+
+        for name, (_, size, alpha) in self.specs.items():
+            self.assertEqual(packed[name].get_size(), size)
+            self.assertEqual(bool(packed[name].get_flags() & pygame.SRCALPHA), alpha)
+            self.assertEqual(pygame.image.tobytes(packed[name], 'RGBA'),
+                             pygame.image.tobytes(decoded[name], 'RGBA'))
+
+    def test_stale_pack_is_not_used(self):
+        build_pack(self.specs, self.pack_path)
+        path, size, alpha = self.specs['fondo']
+        pack = AssetPack(self.pack_path)
+        try:
+            self.assertTrue(pack.matches(self.specs))
+            self.assertFalse(pack.matches({**self.specs, 'fondo': (path, (80, 60), alpha)}))
+
+            # Editing a source image invalidates its entry
+            pygame.image.save(pygame.Surface((90, 90)), path)
+            self.assertFalse(pack.matches(self.specs))
+        finally:
+            pack.close()
+        self.assertEqual(load_assets(self.specs, self.pack_path)['fondo'].get_at((0, 0)), (0, 0, 0, 255))
+
+    def test_same_size_edit_is_noticed(self):
+        build_pack(self.specs, self.pack_path)
+        path = self.specs['fondo'][0]
+        with open(path, 'rb') as f:
+            data = bytearray(f.read())
+        data[-20] ^= 0xFF
+        with open(path, 'wb') as f:
+            f.write(data)
+        pack = AssetPack(self.pack_path)
+        try:
+            self.assertFalse(pack.matches(self.specs))
+        finally:
+            pack.close()
+
+    def test_touched_source_still_matches(self):
+        build_pack(self.specs, self.pack_path)
+        path = self.specs['fondo'][0]
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        pack = AssetPack(self.pack_path)
+        try:
+            self.assertTrue(pack.matches(self.specs))
+        finally:
+            pack.close()
+
+    def test_unreadable_pack_falls_back_to_the_sources(self):
+        build_pack(self.specs, self.pack_path)
+        with open(self.pack_path, 'rb') as f:
+            data = f.read()
+        decoded = load_assets(self.specs, os.path.join(self.tmp.name, 'missing.pack'))
+
+        for content in (data[:len(data) // 2], data[:10], b'', b'not a pack at all', data[:12] + b'{broken' + data[19:]):
+            with open(self.pack_path, 'wb') as f:
+                f.write(content)
+            images = load_assets(self.specs, self.pack_path)
+            for name in self.specs:
+                self.assertEqual(pygame.image.tobytes(images[name], 'RGBA'),
+                                 pygame.image.tobytes(decoded[name], 'RGBA'))
+
+if __name__ == '__main__':
+    unittest.main()
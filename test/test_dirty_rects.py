@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from config.constant import WIDTH, HEIGHT
+from frameworks.state import StateManager
+from interfaces.uiInterface import UI
+from helpers import UITestCase
+
+def pixels(surface):
+    return pygame.image.tobytes(surface, 'RGB')
+
+class TestDirtyRects(UITestCase):
+
+    def setUp(self):
+        # Keep the pointer off the buttons so hover highlighting is the same in every render
+        patcher = mock.patch('pygame.mouse.get_pos', return_value=(WIDTH - 1, HEIGHT // 2))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.state = StateManager(100, 30, 45)
+        self.ui = UI(self.graphics, self.state)
+
+    def full_render(self):
+        """The same frame drawn from scratch by a new UI on a new surface."""
+        state = StateManager(self.state.weight, self.state.theta1, self.state.theta2)
+        ui = UI(self.graphics, state)
+        ui.body_offset = self.ui.body_offset
+        ui.conversor_visible = self.ui.conversor_visible
+        ui.mostrar_grafico = self.ui.mostrar_grafico
+        if ui.mostrar_grafico:
+            ui.update_graph()
+        surface = pygame.Surface((WIDTH, HEIGHT), 0, self.screen)
+        self.assertEqual(ui.draw_scene(surface), [surface.get_rect()])
+        return pixels(surface)
+
+    def step(self, change):
+        change()
+        if self.ui.mostrar_grafico:
+            self.ui.update_graph()
+        rects = self.ui.draw_scene(self.screen)
+        self.assertTrue(rects)
+        self.assertEqual(pixels(self.screen), self.full_render())
+
+    def test_incremental_frames_match_full_renders(self):
+        self.assertEqual(self.ui.draw_scene(self.screen), [self.screen.get_rect()])
+        self.assertEqual(pixels(self.screen), self.full_render())
+
+        steps = [
+            lambda: self.state.update_state(weight=250),
+            lambda: self.state.update_state(theta1=10),
+            lambda: self.state.update_state(theta2=80),
+            lambda: self.state.update_state(weight=20, theta1=60, theta2=60),
+            lambda: setattr(self.ui, 'body_offset', (25.0, -12.0)),
+            lambda: setattr(self.ui, 'body_offset', (0, 0)),
+            lambda: setattr(self.ui, 'conversor_visible', True),
+            lambda: self.state.update_state(weight=400),
+            lambda: setattr(self.ui, 'conversor_visible', False),
+            lambda: setattr(self.ui, 'mostrar_grafico', True),
+            lambda: self.state.update_state(theta1=45),
+            lambda: setattr(self.ui, 'mostrar_grafico', False),
+            lambda: self.state.update_state(weight=100, theta1=30, theta2=45),
+        ]
+        for change in steps:
+            self.step(change)
+
+    def test_unchanged_frame_draws_nothing(self):
+        self.ui.draw_scene(self.screen)
+        self.assertEqual(self.ui.draw_scene(self.screen), [])
+        self.assertFalse(self.ui.scene_changed)
+        # Setting a value to what it already is does not count as a change
+        self.state.update_state(weight=100)
+        self.assertEqual(self.ui.draw_scene(self.screen), [])
+
+    def test_invalidate_layers_redraws_the_whole_screen(self):
+        self.ui.draw_scene(self.screen)
+        self.ui.invalidate_layers()
+        self.assertEqual(self.ui.draw_scene(self.screen), [self.screen.get_rect()])
+        self.assertEqual(self.ui.draw_scene(self.screen), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from config.constant import WIDTH, HEIGHT
+from frameworks import simulator
+from frameworks.simulator import PhysicsSimulator, use_scaled_display
+
+
+class TestScaledDisplay(unittest.TestCase):
+    def test_scaled_only_when_the_desktop_is_too_small(self):
+        self.assertTrue(use_scaled_display(None, [(1280, 720)]))
+        self.assertTrue(use_scaled_display(None, [(1920, 800)]))
+        self.assertFalse(use_scaled_display(None, [(WIDTH, HEIGHT)]))
+        self.assertFalse(use_scaled_display(None, [(1920, 1080), (1280, 720)]))
+        self.assertFalse(use_scaled_display(None, []))
+
+    def test_setting_overrides_the_desktop(self):
+        self.assertTrue(use_scaled_display(True, [(1920, 1080)]))
+        self.assertFalse(use_scaled_display(False, [(1280, 720)]))
+
+    def create_window(self, desktop):
+        with mock.patch.object(simulator, 'DISPLAY_SCALED', None), \
+             mock.patch('pygame.display.get_desktop_sizes', return_value=[desktop]), \
+             mock.patch('pygame.display.set_mode') as set_mode:
+            PhysicsSimulator._create_window(None)
+        return set_mode.call_args
+
+    def test_window_on_a_720p_desktop_is_scaled(self):
+        self.assertEqual(self.create_window((1280, 720)),
+                         mock.call((WIDTH, HEIGHT), pygame.SCALED | pygame.RESIZABLE))
+
+    def test_window_that_fits_is_not_scaled(self):
+        self.assertEqual(self.create_window((1920, 1080)),
+                         mock.call((WIDTH, HEIGHT), pygame.RESIZABLE))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.physic import calculate_tensions_batch
+from frameworks.dynamics import SwingBatch
+
+class TestSwingBatch(unittest.TestCase):
+
+    def test_equilibrium_is_at_rest(self):
+        swing = SwingBatch(100, 30, 60)
+        swing.step(100)
+        self.assertTrue(swing.settled().all())
+        T1, T2 = swing.tensions
+        self.assertAlmostEqual(T1[0], 86.6, delta=0.01)
+        self.assertAlmostEqual(T2[0], 50, delta=0.01)
+
+    def test_perturbed_batch_settles_to_static_tensions(self):
+        rng = np.random.default_rng(0)
+        n = 500
+        weight = rng.uniform(10, 500, n)
+        theta1 = rng.integers(10, 80, n)
+        theta2 = rng.integers(10, 80, n)
+        swing = SwingBatch(weight, theta1, theta2, rng.normal(0, 0.02, n), rng.normal(0, 0.02, n))
+
+        self.assertTrue(swing.run_until_settled(tolerance=1e-5))
+        T1, T2 = swing.tensions
+        expected1, expected2 = calculate_tensions_batch(weight, theta1, theta2)
+        np.testing.assert_allclose(T1, expected1, rtol=1e-3)
+        np.testing.assert_allclose(T2, expected2, rtol=1e-3)
+
+        # Every perturbed body overshoots, so some rope peaks above its static tension
+        peak1, peak2 = swing.peak_tensions
+        self.assertTrue(np.all(np.maximum(peak1 - expected1, peak2 - expected2) > 0))
+
+    def test_weightless_body_has_no_tension(self):
+        swing = SwingBatch(0, 45, 45, offset_y=0.1)
+        swing.step(10)
+        T1, T2 = swing.tensions
+        self.assertEqual((T1[0], T2[0]), (0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
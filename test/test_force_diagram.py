@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from frameworks.state import StateManager
+from interfaces.forceDiagram import ForceDiagram
+from interfaces.uiInterface import UI
+from helpers import UITestCase
+
+def pixels(surface):
+    return pygame.image.tobytes(surface, 'RGBA')
+
+class TestForceDiagram(unittest.TestCase):
+
+    def test_update_redraws_over_the_clean_background(self):
+        fresh = ForceDiagram()
+        expected = pixels(fresh.update(100, 20, 70))
+
+        diagram = ForceDiagram()
+        diagram.update(500, 60, 10)
+        # Nothing of the previous arrows or legend is left behind
+        self.assertEqual(pixels(diagram.update(100, 20, 70)), expected)
+
+    def test_changes_show_up_in_the_shared_surface(self):
+        diagram = ForceDiagram()
+        surface = diagram.update(100, 30, 45)
+        before = pixels(surface)
+        self.assertIs(diagram.update(100, 30, 45), surface)
+        self.assertEqual(pixels(surface), before)
+
+        diagram.update(100, 30, 60)
+        self.assertNotEqual(pixels(surface), before)
+
+    def test_render_rgba_is_a_copy(self):
+        diagram = ForceDiagram()
+        size, rgba = diagram.render_rgba(100, 30, 45)
+        self.assertEqual(len(rgba), size[0] * size[1] * 4)
+        diagram.update(100, 80, 5)
+        self.assertEqual(diagram.render_rgba(100, 30, 45)[1], rgba)
+
+class TestGraphInvalidation(UITestCase):
+
+    def setUp(self):
+        self.state = StateManager(100, 30, 45)
+        self.ui = UI(self.graphics, self.state)
+        self.ui.mostrar_grafico = True
+
+    def test_graph_is_kept_while_the_state_is_unchanged(self):
+        self.ui.update_graph()
+        before = pixels(self.ui.superficie_grafico)
+        with mock.patch.object(self.graphics, 'create_graph') as create_graph:
+            self.ui.update_graph()
+            self.state.update_state(weight=100)
+            self.ui.update_graph()
+        create_graph.assert_not_called()
+        self.assertEqual(pixels(self.ui.superficie_grafico), before)
+
+    def test_state_change_redraws_the_graph(self):
+        self.ui.update_graph()
+        self.state.update_state(theta1=60)
+        self.ui.update_graph()
+        self.assertEqual(pixels(self.ui.superficie_grafico), pixels(ForceDiagram().update(100, 60, 45)))
+
+if __name__ == '__main__':
+    unittest.main()
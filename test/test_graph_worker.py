@@ -0,0 +1,125 @@
+import os
+import sys
+import time
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.state import StateManager
+from interfaces.graphWorker import GraphWorker
+from interfaces.uiInterface import UI
+from helpers import UITestCase
+
+def kill(worker):
+    worker.start()
+    worker._process.kill()
+    worker._process.wait(10)
+
+def wait_connected(worker, timeout=30):
+    worker.start()
+    deadline = time.monotonic() + timeout
+    while not worker._connected():
+        if time.monotonic() > deadline or worker.failed:
+            raise AssertionError("the worker did not connect")
+        time.sleep(0.01)
+
+def wait_for_result(worker, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = worker.poll()
+        if result is not None:
+            return result
+        time.sleep(0.01)
+    raise AssertionError("the worker produced no diagram")
+
+class TestGraphWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.worker = GraphWorker()
+
+    def tearDown(self):
+        self.worker.close()
+
+    def test_process_starts_on_the_first_request(self):
+        self.assertIsNone(self.worker._process)
+        self.assertIsNone(self.worker.poll())
+        self.assertFalse(self.worker.busy)
+        self.worker.request(1, 100, 30, 60)
+        self.assertIsNotNone(self.worker._process)
+        self.assertEqual(wait_for_result(self.worker)[0], 1)
+
+    def test_close_without_starting(self):
+        worker = GraphWorker()
+        worker.close()
+        self.assertIsNone(worker._process)
+
+    def test_stale_requests_are_dropped(self):
+        wait_connected(self.worker)
+        # The first request goes straight out; the rest of the drag only overwrites the pending slot
+        for key in range(1, 7):
+            self.worker.request(key, 100 + key, 30, 60)
+        self.assertEqual(self.worker.sent, 1)
+
+        key, surface = wait_for_result(self.worker)
+        self.assertEqual(key, 1)
+        key, surface = wait_for_result(self.worker)
+        self.assertEqual(key, 6)
+        self.assertEqual(self.worker.sent, 2)
+        self.assertEqual(surface.get_size(), (300, 300))
+
+    def test_poll_returns_each_result_once(self):
+        self.worker.request(1, 100, 30, 60)
+        self.assertEqual(wait_for_result(self.worker)[0], 1)
+        self.assertIsNone(self.worker.poll())
+
+    def test_dead_worker_is_reported(self):
+        self.worker.request(1, 100, 30, 60)
+        wait_for_result(self.worker)
+        kill(self.worker)
+
+        self.worker.request(2, 120, 30, 60)
+        deadline = time.monotonic() + 10
+        while not self.worker.failed and time.monotonic() < deadline:
+            self.assertIsNone(self.worker.poll())
+            time.sleep(0.01)
+        self.assertTrue(self.worker.failed)
+        self.assertFalse(self.worker.busy)
+
+        sent = self.worker.sent
+        self.worker.request(3, 140, 30, 60)
+        self.assertIsNone(self.worker.poll())
+        self.assertEqual(self.worker.sent, sent)
+
+    def test_worker_dying_mid_request(self):
+        wait_connected(self.worker)
+        self.worker.request(1, 100, 30, 60)
+        self.assertEqual(self.worker.sent, 1)
+        kill(self.worker)
+        self.assertIsNone(self.worker.poll())
+        self.assertTrue(self.worker.failed)
+        self.assertFalse(self.worker.busy)
+
+    def test_worker_dying_before_it_connects(self):
+        self.worker.request(1, 100, 30, 60)
+        kill(self.worker)
+        self.assertIsNone(self.worker.poll())
+        self.assertTrue(self.worker.failed)
+        self.assertFalse(self.worker.busy)
+
+class TestGraphFallback(UITestCase):
+
+    def test_ui_draws_the_graph_itself_once_the_worker_dies(self):
+        worker = GraphWorker()
+        self.addCleanup(worker.close)
+        ui = UI(self.graphics, StateManager(100, 30, 45), graph_worker=worker)
+        ui.mostrar_grafico = True
+        kill(worker)
+
+        ui.update_graph()
+        self.assertIsNone(ui.graph_worker)
+        self.assertIsNotNone(ui.superficie_grafico)
+        self.assertEqual(ui.superficie_grafico.get_size(), (300, 300))
+
+if __name__ == '__main__':
+    unittest.main()
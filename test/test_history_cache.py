@@ -0,0 +1,111 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from helpers import wait_until
+from interfaces.historyCache import HistoryCache
+
+class TestHistoryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def fetch(self, offset, limit):
+        self.calls += 1
+        self.release.wait(5)
+        return [{'weight': self.calls}]
+
+    def test_get_does_not_block_and_caches(self):
+        self.release.clear()
+        cache = HistoryCache(ttl=60, fetch=self.fetch)
+        self.assertEqual(cache.get(), [])
+        self.assertTrue(cache.loading)
+        # Further frames while the fetch runs do not start another one
+        cache.get()
+        self.release.set()
+        wait_until(lambda: cache.loaded)
+
+        self.assertEqual(cache.get(), [{'weight': 1}])
+        self.assertEqual(cache.get(), [{'weight': 1}])
+        self.assertEqual(self.calls, 1)
+
+    def test_invalidate_and_ttl_trigger_refetch(self):
+        cache = HistoryCache(ttl=60, fetch=self.fetch)
+        cache.get()
+        wait_until(lambda: cache.loaded)
+
+        cache.invalidate()
+        cache.get()
+        wait_until(lambda: cache.loaded and cache.get() == [{'weight': 2}])
+
+        cache.ttl = 0
+        time.sleep(0.01)
+        cache.get()
+        wait_until(lambda: self.calls == 3 and not cache.loading)
+
+    def test_errors_keep_the_last_list(self):
+        results = [[{'weight': 1}], ConnectionError("backend down")]
+
+        def fetch(offset, limit):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        cache = HistoryCache(ttl=60, fetch=fetch)
+        cache.get()
+        wait_until(lambda: cache.loaded)
+        cache.invalidate()
+        cache.get()
+        wait_until(lambda: cache.error is not None)
+        self.assertEqual(cache.get(), [{'weight': 1}])
+        self.assertFalse(cache.loading)
+
+    def test_refresh_keeps_the_rows_loaded_past_the_first_page(self):
+        rows = [{'_id': str(i), 'weight': i} for i in range(200, 0, -1)]
+        cache = HistoryCache(ttl=60, page_size=50, fetch=lambda offset, limit: (rows[offset:offset + limit], len(rows)))
+        cache.get()
+        wait_until(lambda: cache.loaded)
+        cache.request_rows(60)
+        wait_until(lambda: len(cache.get()) == 100)
+
+        # Three saves since: the fresh first page overlaps the loaded rows
+        rows[:0] = [{'_id': str(i), 'weight': i} for i in (203, 202, 201)]
+        cache.invalidate()
+        cache.get()
+        wait_until(lambda: cache.loaded and len(cache.get()) == 103)
+        self.assertEqual(cache.get(), rows[:103])
+        self.assertEqual((cache.inserted, cache.resets), (3, 0))
+        self.assertEqual(cache.total, 203)
+
+        # Nothing new: the rows stay as they are
+        cache.invalidate()
+        cache.get()
+        wait_until(lambda: cache.loaded)
+        self.assertEqual(cache.get(), rows[:103])
+        self.assertEqual((cache.inserted, cache.resets), (3, 0))
+
+    def test_refresh_without_overlap_starts_over(self):
+        rows = [{'_id': str(i), 'weight': i} for i in range(100, 0, -1)]
+        cache = HistoryCache(ttl=60, page_size=50, fetch=lambda offset, limit: (rows[offset:offset + limit], len(rows)))
+        cache.get()
+        wait_until(lambda: cache.loaded)
+        cache.request_rows(60)
+        wait_until(lambda: len(cache.get()) == 100)
+
+        rows[:0] = [{'_id': str(i), 'weight': i} for i in range(160, 100, -1)]
+        cache.invalidate()
+        cache.get()
+        wait_until(lambda: cache.loaded)
+        self.assertEqual(cache.get(), rows[:50])
+        self.assertEqual((cache.inserted, cache.resets), (0, 1))
+        self.assertTrue(cache.has_more)
+
+if __name__ == '__main__':
+    unittest.main()
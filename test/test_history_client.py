@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from helpers import wait_until
+from fake_backend import FakeBackend
+from interfaces.historyClient import HistoryClient
+from interfaces.historyCache import HistoryCache
+
+def simulations(count):
+    return [{'_id': str(count - i), 'weight': count - i, 'theta1': 30, 'theta2': 45,
+             'tension1': 1.0, 'tension2': 2.0} for i in range(count)]
+
+class TestHistoryClient(unittest.TestCase):
+
+    def test_pages_are_conditional_and_share_a_connection(self):
+        with FakeBackend(simulations(120)) as backend:
+            client = HistoryClient(url=backend.url)
+            items, total = client.fetch_page(0, 50)
+            self.assertEqual(total, 120)
+            self.assertEqual([item['weight'] for item in items[:2]], [120, 119])
+
+            # Unchanged page: 304 and the copy we already had
+            self.assertEqual(client.fetch_page(0, 50), (items, 120))
+            self.assertEqual(client.not_modified, 1)
+
+            # A new save changes the page, so it is downloaded again
+            backend.add({'weight': 999})
+            items, total = client.fetch_page(0, 50)
+            self.assertEqual((items[0]['weight'], total), (999, 121))
+            self.assertEqual(client.not_modified, 1)
+
+            self.assertEqual(client.get_simulation('5')['weight'], 5)
+            self.assertIsNone(client.get_simulation('missing'))
+            self.assertEqual(backend.connections, 1)
+            client.close()
+
+    def test_page_cache_is_bounded(self):
+        with FakeBackend(simulations(120)) as backend:
+            client = HistoryClient(url=backend.url, max_pages=2)
+            for offset in (0, 10, 20):
+                client.fetch_page(offset, 10)
+            self.assertEqual(list(client._pages), [(10, 10), (20, 10)])
+
+            # A revalidated page becomes the most recent; the oldest one goes
+            client.fetch_page(10, 10)
+            self.assertEqual(client.not_modified, 1)
+            client.fetch_page(0, 10)
+            self.assertEqual(list(client._pages), [(10, 10), (0, 10)])
+            self.assertEqual(client.not_modified, 1)
+            client.close()
+
+    def test_cache_loads_pages_as_rows_are_requested(self):
+        with FakeBackend(simulations(120)) as backend:
+            cache = HistoryCache(client=HistoryClient(url=backend.url), ttl=60, page_size=50)
+            cache.get()
+            wait_until(lambda: cache.loaded)
+            # Opening the history costs one page whatever the size of the list
+            self.assertEqual(len(cache.get()), 50)
+            self.assertEqual(len(backend.requests), 1)
+
+            cache.request_rows(40)
+            self.assertFalse(cache.loading)
+            cache.request_rows(70)
+            wait_until(lambda: len(cache.get()) == 100)
+            cache.request_rows(200)
+            wait_until(lambda: len(cache.get()) == 120)
+            self.assertFalse(cache.has_more)
+            self.assertEqual([row['weight'] for row in cache.get()], list(range(120, 0, -1)))
+
+            # A refresh fetches the first page only and keeps the rows loaded past it
+            requests_before = len(backend.requests)
+            backend.add({'weight': 999})
+            cache.invalidate()
+            cache.get()
+            wait_until(lambda: cache.loaded and cache.get()[0]['weight'] == 999)
+            self.assertEqual(len(backend.requests), requests_before + 1)
+            self.assertEqual([row['weight'] for row in cache.get()], [999] + list(range(120, 0, -1)))
+            self.assertEqual(cache.inserted, 1)
+            self.assertFalse(cache.has_more)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.state import StateManager
+from interfaces.historyCache import HistoryCache
+from interfaces.uiInterface import UI
+from helpers import ListHistory, UITestCase
+
+class TestHistoryTable(UITestCase):
+
+    def setUp(self):
+        self.ui = UI(self.graphics, StateManager(), history=HistoryCache(client=ListHistory(100000)))
+        self.ui.historial_visible = True
+        # The first frame starts the fetch, the second one draws the rows
+        self.draw()
+        self.draw()
+
+    def draw(self):
+        self.ui._draw_historial(self.screen)
+        thread = self.ui.history._thread
+        if thread is not None:
+            thread.join(5)
+
+    def surfaces(self):
+        return {i: surface for i, (_, surface) in self.ui._row_surfaces.items()}
+
+    def test_rows_are_rendered_once(self):
+        before = self.surfaces()
+        self.assertTrue(before)
+        self.draw()
+        self.assertEqual(self.surfaces(), before)
+        self.assertTrue(all(self.surfaces()[i] is before[i] for i in before))
+
+        # Scrolling one row renders only the row that comes into view
+        self.ui.scroll_y = 35
+        self.draw()
+        after = self.surfaces()
+        self.assertEqual(sorted(set(after) - set(before)), [max(after)])
+        self.assertTrue(all(after[i] is before[i] for i in after if i in before))
+
+        # Selecting a row renders that row again
+        self.ui.selected_simulation = 3
+        self.draw()
+        self.assertIsNot(self.surfaces()[3], after[3])
+        self.assertIs(self.surfaces()[4], after[4])
+
+    def test_only_visible_rows_are_kept(self):
+        visible = len(self.ui._row_surfaces)
+        self.ui.scroll_y = 35 * 40
+        for _ in range(5):
+            self.draw()
+        self.assertGreaterEqual(len(self.ui.history.get()), 50)
+        self.assertEqual(len(self.ui._row_surfaces), visible)
+        self.assertEqual(min(self.ui._row_surfaces), 40)
+
+    def test_refresh_after_scrolling_past_the_first_page(self):
+        history = self.ui.history
+        rows = history.client.rows
+        # Scroll down a page at a time, as the wheel would, so the next pages load
+        for scroll_y in (35 * 20, 35 * 40, 35 * 60):
+            self.ui.scroll_y = scroll_y
+            self.draw()
+            self.draw()
+        self.assertEqual(self.ui.scroll_y, 35 * 60)
+        self.ui.selected_simulation = 70
+        selected = rows[70]
+        self.assertGreaterEqual(len(history.get()), 100)
+
+        # Two saves, then the refresh a save triggers
+        rows[:0] = [dict(rows[0], _id=f'new{i}') for i in range(2)]
+        history.invalidate()
+        self.draw()
+        self.draw()
+
+        self.assertEqual(history.inserted, 2)
+        self.assertGreaterEqual(len(history.get()), 102)
+        self.assertEqual(self.ui.scroll_y, 35 * 62)
+        self.assertIs(history.get()[self.ui.selected_simulation], selected)
+        self.assertEqual(min(self.ui._row_surfaces), 62)
+
+    def test_overlay_backgrounds_are_reused(self):
+        overlays = dict(self.ui._overlay_surfaces)
+        self.assertIn('dim', overlays)
+        self.assertIn('historial', overlays)
+        self.draw()
+        self.assertEqual(self.ui._overlay_surfaces, overlays)
+
+        # A resize rebuilds them
+        self.ui.invalidate_layers()
+        self.draw()
+        self.assertIsNot(self.ui._overlay_surfaces['dim'][1], overlays['dim'][1])
+
+if __name__ == '__main__':
+    unittest.main()
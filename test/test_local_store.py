@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from interfaces.localStore import LocalStore
+from interfaces.historyCache import HistoryCache
+
+def simulation(weight, theta1=30, theta2=45, created_at=None):
+    result = {'weight': weight, 'theta1': theta1, 'theta2': theta2, 'tension1': 1.5, 'tension2': 2.5}
+    if created_at:
+        result['createdAt'] = created_at
+    return result
+
+class TestLocalStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'simulations.db')
+        self.store = LocalStore(self.path)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp.cleanup()
+
+    def test_saves_and_pages_newest_first(self):
+        saved = []
+        self.store.on_saved = lambda: saved.append(True)
+        self.store.save_many([simulation(w, created_at=f'2024-01-01T00:00:{w:02d}.000Z') for w in range(1, 31)])
+        self.store.put(simulation(99))
+        self.assertEqual(len(saved), 2)
+
+        items, total = self.store.fetch_page(0, 10)
+        self.assertEqual(total, 31)
+        self.assertEqual([item['weight'] for item in items[:3]], [99, 30, 29])
+        self.assertEqual(set(items[0]), {'_id', 'weight', 'theta1', 'theta2', 'tension1', 'tension2', 'createdAt'})
+
+        items, _ = self.store.fetch_page(29, 10)
+        self.assertEqual([item['weight'] for item in items], [2, 1])
+        self.assertEqual(self.store.get_simulation(items[0]['_id']), items[0])
+        self.assertIsNone(self.store.get_simulation('nope'))
+
+    def test_filters_and_sorts_in_the_store(self):
+        self.store.save_many([simulation(w, theta1=w % 90) for w in range(1, 201)])
+        items, total = self.store.fetch_page(0, 5, order_by='weight', descending=False,
+                                             where={'weight': (50, 100), 'theta1': (None, 60)})
+        self.assertEqual(total, 22)
+        self.assertEqual([item['weight'] for item in items], [50, 51, 52, 53, 54])
+        with self.assertRaises(ValueError):
+            self.store.fetch_page(0, 5, order_by='weight; DROP TABLE simulations')
+
+        plan = ' '.join(row[3] for row in self.store._conn.execute(
+            'EXPLAIN QUERY PLAN SELECT * FROM simulations WHERE weight >= 50 ORDER BY weight'))
+        self.assertIn('simulations_weight', plan)
+
+    def test_uses_wal_and_sees_other_writers(self):
+        self.assertEqual(self.store._conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        self.store.put(simulation(1))
+        self.assertEqual(self.store.fetch_page(0, 10)[1], 1)
+
+        other = LocalStore(self.path)
+        other.put(simulation(2))
+        other.close()
+        self.assertEqual(self.store.fetch_page(0, 10)[1], 2)
+
+    def test_rejects_invalid_simulations(self):
+        with self.assertRaises(ValueError):
+            self.store.save_many([simulation(1), {'weight': 'heavy'}])
+        # The batch is all or nothing
+        self.assertEqual(self.store.fetch_page(0, 10), ([], 0))
+        self.store.put({'weight': None})
+        self.assertEqual(self.store.fetch_page(0, 10)[1], 0)
+
+    def test_plugs_into_the_history_cache(self):
+        self.store.save_many([simulation(w) for w in range(1, 121)])
+        cache = HistoryCache(client=self.store, ttl=60, page_size=50)
+        cache.get()
+        cache._thread.join(5)
+        self.assertEqual(len(cache.get()), 50)
+        cache.request_rows(80)
+        cache._thread.join(5)
+        self.assertEqual(len(cache.get()), 100)
+
+    def test_calls_after_close_raise_programming_error(self):
+        self.store.save_many([simulation(1)])
+        self.store.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.store.fetch_page(0, 10)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.store.get_simulation('1')
+        with self.assertRaises(sqlite3.ProgrammingError):
+            self.store.save_many([simulation(2)])
+        # put() reports the error like any other failed save; closing twice is harmless
+        self.store.put(simulation(3))
+        self.store.close()
+
+        cache = HistoryCache(client=self.store, ttl=60)
+        cache.get()
+        cache._thread.join(5)
+        self.assertIn('closed', cache.error)
+        self.assertEqual(cache.get(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.physic import (calculate_tensions, solution, calculate_body_position,
+                               calculate_tensions_batch, solution_batch, calculate_body_position_batch)
+
+class TestPhysicsBatch(unittest.TestCase):
+
+    def setUp(self):
+        theta1, theta2 = np.meshgrid(np.arange(1, 91), np.arange(1, 91), indexing='ij')
+        self.theta1 = theta1.ravel()
+        self.theta2 = theta2.ravel()
+        self.weight = np.linspace(0, 500, self.theta1.size)
+
+    def test_calculate_tensions_matches_scalar(self):
+        T1, T2 = calculate_tensions_batch(self.weight, self.theta1, self.theta2)
+        for i in range(0, self.theta1.size, 37):
+            t1, t2 = calculate_tensions(self.weight[i], self.theta1[i], self.theta2[i])
+            self.assertAlmostEqual(T1[i], t1, places=9)
+            self.assertAlmostEqual(T2[i], t2, places=9)
+
+    def test_calculate_tensions_degenerate(self):
+        T1, T2 = calculate_tensions_batch([100, 100], [0, 30], [0, 60])
+        self.assertEqual((T1[0], T2[0]), calculate_tensions(100, 0, 0))
+        self.assertAlmostEqual(T1[1], 86.6, delta=0.01)
+        self.assertAlmostEqual(T2[1], 50, delta=0.01)
+
+    def test_solution_matches_scalar(self):
+        T11, T22 = solution_batch(self.weight, self.theta1, self.theta2)
+        for i in range(0, self.theta1.size, 37):
+            t11, t22 = solution(self.weight[i], self.theta1[i], self.theta2[i])
+            self.assertAlmostEqual(T11[i], t11, places=6)
+            self.assertAlmostEqual(T22[i], t22, places=6)
+
+    def test_solution_degenerate(self):
+        with self.assertRaises(ZeroDivisionError):
+            solution(100, 0, 0)
+        with self.assertRaises(ZeroDivisionError):
+            solution_batch([100, 100], [0, 45], [0, 45])
+
+        T11, T22 = solution_batch([100, 100], [0, 45], [0, 45], strict=False)
+        self.assertTrue(np.isnan(T11[0]) and np.isnan(T22[0]))
+        self.assertAlmostEqual(T11[1], solution(100, 45, 45)[0])
+
+    def test_body_position_matches_scalar(self):
+        T1, T2 = calculate_tensions_batch(self.weight, self.theta1, self.theta2)
+        x, y = calculate_body_position_batch(337, 1012, 210, T1, T2, self.theta1, self.theta2)
+        self.assertEqual(x.dtype, np.int64)
+        for i in range(0, self.theta1.size, 37):
+            expected = calculate_body_position(337, 1012, 210, T1[i], T2[i], self.theta1[i], self.theta2[i])
+            self.assertEqual((x[i], y[i]), expected)
+
+    def test_body_position_degenerate(self):
+        x, y = calculate_body_position_batch(337, 1012, 210, [0, 50], [0, 50], 45, 45)
+        self.assertEqual((x[0], y[0]), calculate_body_position(337, 1012, 210, 0, 0, 45, 45))
+        self.assertEqual((x[1], y[1]), calculate_body_position(337, 1012, 210, 50, 50, 45, 45))
+
+    def test_broadcasting(self):
+        T1, T2 = calculate_tensions_batch(100, np.arange(10, 80), 45)
+        self.assertEqual(T1.shape, (70,))
+        self.assertEqual(T2.shape, (70,))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.profiler import FrameProfiler, NULL_STAGE
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def run_frames(self, profiler, count):
+        for _ in range(count):
+            profiler.begin_frame()
+            with profiler.stage('update'):
+                with profiler.stage('physics'):
+                    pass
+            with profiler.stage('draw'):
+                pass
+            profiler.end_frame()
+
+    def test_disabled_records_nothing(self):
+        profiler = FrameProfiler()
+        self.assertIs(profiler.stage('draw'), NULL_STAGE)
+        self.run_frames(profiler, 3)
+        self.assertEqual(profiler.samples, {})
+        self.assertEqual(len(profiler.frames), 0)
+
+    def test_rolling_percentiles(self):
+        profiler = FrameProfiler(enabled=True, window=5)
+        self.run_frames(profiler, 8)
+        self.assertEqual(len(profiler.frames), 5)
+        summary = profiler.summary()
+        self.assertEqual(set(summary), {'update', 'physics', 'draw', 'frame'})
+        self.assertEqual(summary['draw']['count'], 5)
+        p50, p95, p99 = profiler.percentiles('frame')
+        self.assertLessEqual(p50, p95)
+        self.assertLessEqual(p95, p99)
+        self.assertIsNone(profiler.percentiles('missing'))
+
+    def test_overlay_toggle_enables_profiling(self):
+        profiler = FrameProfiler()
+        profiler.toggle_overlay()
+        self.assertTrue(profiler.enabled)
+        profiler.toggle_overlay()
+        self.assertFalse(profiler.enabled)
+
+    def test_recent_summary_is_recomputed_after_max_age(self):
+        profiler = FrameProfiler(enabled=True, window=50)
+        self.run_frames(profiler, 3)
+        summary = profiler.recent_summary(3600)
+        self.run_frames(profiler, 4)
+        self.assertIs(profiler.recent_summary(3600), summary)
+        self.assertEqual(summary['draw']['count'], 3)
+
+        fresh = profiler.recent_summary(0)
+        self.assertEqual(fresh['draw']['count'], 7)
+        self.assertEqual(fresh, profiler.summary())
+
+    def test_exports(self):
+        profiler = FrameProfiler(enabled=True)
+        self.run_frames(profiler, 3)
+        with tempfile.TemporaryDirectory() as tmp:
+            jsonl_path = os.path.join(tmp, 'profile.jsonl')
+            trace_path = os.path.join(tmp, 'profile.trace.json')
+            profiler.export_jsonl(jsonl_path)
+            profiler.export_chrome_trace(trace_path)
+
+            with open(jsonl_path) as f:
+                frames = [json.loads(line) for line in f]
+            self.assertEqual([frame['frame'] for frame in frames], [0, 1, 2])
+            self.assertEqual(set(frames[0]['stages']), {'update', 'physics', 'draw'})
+
+            with open(trace_path) as f:
+                events = json.load(f)['traceEvents']
+            self.assertEqual(len(events), 3 * 4)
+            frame, update, physics = events[0], events[2], events[1]
+            self.assertEqual((frame['name'], physics['name'], update['name']), ('frame', 'physics', 'update'))
+            # Nested stages lie inside their parent
+            self.assertGreaterEqual(physics['ts'], update['ts'])
+            self.assertLessEqual(physics['ts'] + physics['dur'], update['ts'] + update['dur'] + 1e-3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import io
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from PIL import Image
+from config.constant import WIDTH, HEIGHT
+from interfaces.renderService import RenderService
+
+class TestRenderService(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.service = RenderService()
+
+    def setUp(self):
+        self.service.cache.clear()
+
+    def test_repeated_render_is_a_cache_hit(self):
+        hits, misses = self.service.hits, self.service.misses
+        png = self.service.render(100, 30, 60)
+        self.assertIs(self.service.render(100, 30, 60), png)
+        self.assertEqual((self.service.hits - hits, self.service.misses - misses), (1, 1))
+
+        other = self.service.render(120, 30, 60)
+        self.assertNotEqual(other, png)
+        self.assertEqual(self.service.misses - misses, 2)
+
+    def test_output_is_a_valid_png(self):
+        png = self.service.render(100, 30, 60, show_converter=True)
+        self.assertTrue(png.startswith(b'\x89PNG\r\n\x1a\n'))
+        image = Image.open(io.BytesIO(png))
+        image.load()
+        self.assertEqual(image.size, (WIDTH, HEIGHT))
+
+    def test_cache_is_bounded_by_bytes(self):
+        png = self.service.render(100, 30, 60)
+        self.service.cache.max_bytes = int(len(png) * 2.5)
+        for weight in range(101, 106):
+            self.service.render(weight, 30, 60)
+        self.assertLessEqual(self.service.cache.bytes, self.service.cache.max_bytes)
+        self.assertLess(len(self.service.cache), 6)
+        self.service.cache.max_bytes = 256 * 1024 * 1024
+
+if __name__ == '__main__':
+    unittest.main()
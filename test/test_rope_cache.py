@@ -0,0 +1,42 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config.constant import WIDTH, HEIGHT
+from frameworks.tension_table import get_tension_table
+from helpers import UITestCase
+
+class TestRopeCache(UITestCase):
+
+    def setUp(self):
+        self.graphics.rope_cache.clear()
+
+    def drag(self, theta1, theta2):
+        """Draw both ropes for every frame of a weight drag, one pixel of mouse travel per frame."""
+        anchor1_x, anchor2_x, anchor_y = WIDTH // 4, 3 * WIDTH // 4, HEIGHT // 4
+        table = get_tension_table()
+        for weight in range(2, 402, 2):
+            body = table.body_position(anchor1_x, anchor2_x, anchor_y, weight, theta1, theta2)
+            self.graphics.draw_rope(self.screen, (anchor1_x, anchor_y), body)
+            self.graphics.draw_rope(self.screen, (anchor2_x, anchor_y), body)
+
+    def test_weight_drag_reuses_sprites(self):
+        for theta1, theta2 in ((30, 45), (10, 80), (60, 60)):
+            self.graphics.rope_cache.clear()
+            hits, misses = self.graphics.rope_cache.hits, self.graphics.rope_cache.misses
+            self.drag(theta1, theta2)
+            hits = self.graphics.rope_cache.hits - hits
+            misses = self.graphics.rope_cache.misses - misses
+            self.assertGreater(hits / (hits + misses), 0.5, (theta1, theta2))
+
+    def test_dragging_back_builds_nothing(self):
+        self.drag(30, 45)
+        misses = self.graphics.rope_cache.misses
+        self.drag(30, 45)
+        self.assertEqual(self.graphics.rope_cache.misses, misses)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from interfaces.rotationAtlas import RotationAtlas
+
+class TestRotationAtlas(unittest.TestCase):
+
+    def setUp(self):
+        self.image = pygame.Surface((40, 10), pygame.SRCALPHA)
+        self.image.fill((200, 50, 50, 255))
+        self.atlas = RotationAtlas(self.image, 0, 90)
+
+    def test_frames_are_built_once(self):
+        frame = self.atlas.get(30)
+        self.assertIs(self.atlas.get(30), frame)
+        self.assertEqual(sum(f is not None for f in self.atlas.frames), 1)
+
+    def test_frame_matches_a_direct_rotation(self):
+        expected = pygame.transform.rotozoom(self.image, 30, 1.0)
+        frame = self.atlas.get(30)
+        self.assertEqual(frame.get_size(), expected.get_size())
+        self.assertEqual(pygame.image.tobytes(frame, 'RGBA'), pygame.image.tobytes(expected, 'RGBA'))
+
+    def test_fractional_angles_snap_to_the_nearest_degree(self):
+        frame = self.atlas.get(30)
+        self.assertIs(self.atlas.get(29.5), frame)
+        self.assertIs(self.atlas.get(30.49), frame)
+        self.assertIs(self.atlas.get(30.5), self.atlas.get(31))
+        self.assertIs(self.atlas.get(-0.4), self.atlas.get(0))
+        self.assertIs(self.atlas.get(90.4), self.atlas.get(90))
+
+    def test_angles_outside_the_range_are_rotated_on_the_fly(self):
+        frame = self.atlas.get(120)
+        self.assertNotIn(frame, self.atlas.frames)
+        self.assertEqual(frame.get_size(), pygame.transform.rotozoom(self.image, 120, 1.0).get_size())
+        self.assertIsNot(self.atlas.get(120), frame)
+        self.assertTrue(all(f is None for f in self.atlas.frames))
+
+    def test_offset_range(self):
+        atlas = RotationAtlas(self.image, 10, 20)
+        self.assertEqual(len(atlas.frames), 11)
+        self.assertIs(atlas.get(10), atlas.frames[0])
+        self.assertIs(atlas.get(20), atlas.frames[10])
+        self.assertNotIn(atlas.get(5), atlas.frames)
+
+    def test_prebuild_async_fills_every_frame(self):
+        first = self.atlas.get(45)
+        self.atlas.prebuild_async().join(10)
+        self.assertTrue(all(f is not None for f in self.atlas.frames))
+        # Frames that already existed are kept
+        self.assertIs(self.atlas.get(45), first)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from helpers import wait_until
+from interfaces.saveQueue import SaveQueue
+
+URL = 'http://backend/api/simulations'
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.text = ''
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code}")
+
+class FakeSession:
+    """Records posts; status(url, body) decides the response, an exception means the backend is down."""
+
+    def __init__(self, status):
+        self.status = status
+        self.posts = []
+        self.lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        with self.lock:
+            self.posts.append((url, json))
+        result = self.status(url, json)
+        if isinstance(result, Exception):
+            raise result
+        return FakeResponse(result)
+
+class TestSaveQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.journal = os.path.join(self.tmp.name, 'pending.json')
+
+    def make_queue(self, session, batch_window=0.05, **kwargs):
+        queue = SaveQueue(URL, self.journal, session, batch_window=batch_window, retry_delay=0.01,
+                          max_retry_delay=0.02, **kwargs)
+        self.addCleanup(queue.close)
+        return queue
+
+    def test_burst_is_sent_in_bulk(self):
+        session = FakeSession(lambda url, body: 201)
+        saved = []
+        queue = self.make_queue(session, on_saved=lambda: saved.append(1))
+        for weight in range(5):
+            queue.put({'weight': weight})
+        wait_until(lambda: queue.pending == 0)
+
+        self.assertEqual(session.posts, [(URL + '/bulk', [{'weight': w} for w in range(5)])])
+        self.assertTrue(queue.bulk_supported)
+        self.assertEqual(queue.saved, 5)
+        self.assertTrue(saved)
+        self.assertFalse(os.path.exists(self.journal))
+
+    def test_falls_back_to_single_posts_without_bulk_route(self):
+        session = FakeSession(lambda url, body: 404 if url.endswith('/bulk') else 201)
+        queue = self.make_queue(session)
+        queue.put({'weight': 1})
+        queue.put({'weight': 2})
+        wait_until(lambda: queue.saved == 2)
+
+        self.assertFalse(queue.bulk_supported)
+        self.assertEqual([url for url, _ in session.posts], [URL + '/bulk', URL, URL])
+
+    def test_retries_and_journals_until_the_backend_answers(self):
+        down = [True]
+        session = FakeSession(lambda url, body: requests.ConnectionError("down") if down[0] else 201)
+        queue = self.make_queue(session)
+        queue.put({'weight': 7})
+        wait_until(lambda: len(session.posts) >= 3)
+
+        with open(self.journal) as f:
+            self.assertEqual(json.load(f), [{'weight': 7}])
+        self.assertIsNotNone(queue.last_error)
+
+        down[0] = False
+        wait_until(lambda: queue.pending == 0)
+        self.assertIsNone(queue.last_error)
+        self.assertFalse(os.path.exists(self.journal))
+
+    def test_put_journals_before_returning(self):
+        session = FakeSession(lambda url, body: 201)
+        queue = self.make_queue(session, batch_window=10)
+        queue.put({'weight': 1})
+        queue.put({'weight': 2})
+        # Still inside the batch window: nothing sent, both saves already on disk
+        with open(self.journal) as f:
+            self.assertEqual(json.load(f), [{'weight': 1}, {'weight': 2}])
+        self.assertEqual(session.posts, [])
+
+    def test_unsent_saves_survive_a_restart(self):
+        failing = FakeSession(lambda url, body: requests.ConnectionError("down"))
+        queue = self.make_queue(failing)
+        queue.put({'weight': 1})
+        queue.put({'weight': 2})
+        queue.close()
+
+        session = FakeSession(lambda url, body: 201)
+        restarted = self.make_queue(session)
+        wait_until(lambda: restarted.saved == 2)
+        self.assertEqual(session.posts, [(URL + '/bulk', [{'weight': 1}, {'weight': 2}])])
+
+    def test_rejected_items_are_dropped(self):
+        session = FakeSession(lambda url, body: 400 if body == {'weight': -1} or url.endswith('/bulk') else 201)
+        queue = self.make_queue(session)
+        queue.put({'weight': 1})
+        queue.put({'weight': -1})
+        wait_until(lambda: queue.pending == 0)
+        self.assertEqual((queue.saved, queue.dropped), (1, 1))
+        self.assertEqual([body for url, body in session.posts if url == URL], [{'weight': 1}, {'weight': -1}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from frameworks.scheduler import FrameScheduler
+
+class TestFrameScheduler(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((64, 64))
+
+    def setUp(self):
+        pygame.event.clear()
+
+    def test_active_frames_run_at_full_rate(self):
+        scheduler = FrameScheduler(active_fps=100, idle_fps=2, linger_ms=1000)
+        start = time.perf_counter()
+        for _ in range(5):
+            scheduler.next_frame(True)
+        self.assertFalse(scheduler.idle)
+        self.assertLess(time.perf_counter() - start, 0.4)
+
+    def test_idle_loop_sleeps_until_timeout(self):
+        scheduler = FrameScheduler(active_fps=100, idle_fps=10, linger_ms=0)
+        start = time.perf_counter()
+        self.assertEqual(scheduler.next_frame(False), [])
+        self.assertTrue(scheduler.idle)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.08)
+
+    def test_idle_loop_wakes_on_event(self):
+        scheduler = FrameScheduler(active_fps=100, idle_fps=0.5, linger_ms=0)
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, code=1))
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, code=2))
+        start = time.perf_counter()
+        events = scheduler.next_frame(False)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual([event.code for event in events if event.type == pygame.USEREVENT], [1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
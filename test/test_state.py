@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.state import StateManager
+
+class TestStateManager(unittest.TestCase):
+
+    def test_version_only_moves_on_change(self):
+        state = StateManager(100, 45, 45)
+        self.assertFalse(state.update_state(weight=100))
+        self.assertEqual(state.version, 0)
+        self.assertTrue(state.update_state(weight=120, theta1=30))
+        self.assertEqual(state.version, 1)
+        self.assertEqual(state.get_state(), {'weight': 120, 'theta1': 30, 'theta2': 45})
+
+    def test_derived_values_are_cached_per_version(self):
+        state = StateManager(100, 45, 45)
+        calls = []
+        compute = lambda: calls.append(state.weight) or state.weight * 2
+
+        self.assertEqual(state.derived('double', compute), 200)
+        self.assertEqual(state.derived('double', compute), 200)
+        self.assertEqual(len(calls), 1)
+
+        state.update_state(weight=50)
+        self.assertEqual(state.derived('double', compute), 100)
+        self.assertEqual(len(calls), 2)
+
+        state.invalidate('double')
+        state.derived('double', compute)
+        self.assertEqual(len(calls), 3)
+
+    def test_unknown_parameter(self):
+        with self.assertRaises(KeyError):
+            StateManager().update_state(mass=3)
+
+if __name__ == '__main__':
+    unittest.main()
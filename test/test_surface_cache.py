@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+import pygame
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from interfaces.surfaceCache import SurfaceCache, surface_bytes
+
+class TestSurfaceCache(unittest.TestCase):
+
+    def test_hits_and_misses(self):
+        cache = SurfaceCache()
+        builds = []
+        build = lambda: builds.append(1) or pygame.Surface((10, 10), pygame.SRCALPHA)
+
+        first = cache.get('rope', build)
+        self.assertIs(cache.get('rope', build), first)
+        self.assertEqual(len(builds), 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+        self.assertEqual(cache.bytes, 400)
+
+    def test_evicts_least_recently_used(self):
+        cache = SurfaceCache(max_items=2)
+        for key in ('a', 'b'):
+            cache.get(key, lambda: pygame.Surface((4, 4)))
+        cache.get('a', lambda: None)
+        cache.get('c', lambda: pygame.Surface((4, 4)))
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        cache.get('a', lambda: self.fail("'a' should still be cached"))
+
+    def test_byte_budget(self):
+        cache = SurfaceCache(max_bytes=1000)
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        for key in range(5):
+            cache.get(key, lambda: (surface.copy(), (10, 10)))
+        self.assertLessEqual(cache.bytes, 1000)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(surface_bytes((surface, surface)), 800)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.physic import calculate_tensions
+from frameworks.sweep import SweepGrid, run_sweep, load_results, shard_path
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.grid = SweepGrid.from_ranges((0, 100, 50), (0, 90, 10), (0, 90, 15))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output_dir = tmp.name
+
+    def _collect(self, fmt, output_dir=None):
+        chunks = list(load_results(output_dir or self.output_dir, fmt))
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+    def test_grid_points(self):
+        self.assertEqual(self.grid.shape, (3, 10, 7))
+        weight, theta1, theta2 = self.grid.points(0, self.grid.size)
+        self.assertEqual(len(weight), 210)
+        self.assertEqual((weight[-1], theta1[-1], theta2[-1]), (100, 90, 90))
+
+    def test_sweep_matches_scalar(self):
+        for fmt in ('npz', 'csv'):
+            output_dir = os.path.join(self.output_dir, fmt)
+            evaluated = run_sweep(self.grid, output_dir, chunk_size=64, fmt=fmt, workers=2, progress=None)
+            self.assertEqual(evaluated, self.grid.size)
+
+            results = self._collect(fmt, output_dir)
+            self.assertEqual(len(results['weight']), self.grid.size)
+            for i in range(0, self.grid.size, 11):
+                T1, T2 = calculate_tensions(results['weight'][i], results['theta1'][i], results['theta2'][i])
+                np.testing.assert_allclose((results['tension1'][i], results['tension2'][i]), (T1, T2), rtol=1e-12)
+
+    def test_resume_only_runs_missing_shards(self):
+        run_sweep(self.grid, self.output_dir, chunk_size=64, workers=1, progress=None)
+        os.remove(shard_path(self.output_dir, 1, 'npz'))
+
+        evaluated = run_sweep(self.grid, self.output_dir, chunk_size=64, workers=1, progress=None)
+        self.assertEqual(evaluated, 64)
+        self.assertEqual(len(self._collect('npz')['weight']), self.grid.size)
+
+    def test_custom_progress_prints_nothing(self):
+        calls = []
+        output = io.StringIO()
+        with redirect_stdout(output):
+            run_sweep(self.grid, self.output_dir, chunk_size=64, workers=1,
+                      progress=lambda done, total, elapsed: calls.append((done, total)))
+        self.assertEqual(output.getvalue(), '')
+        self.assertEqual(calls[-1], (self.grid.size, self.grid.size))
+
+    def test_refuses_to_mix_sweeps(self):
+        run_sweep(self.grid, self.output_dir, chunk_size=64, workers=1, progress=None)
+        other = SweepGrid.from_ranges((0, 10, 5), (0, 90, 10), (0, 90, 15))
+        with self.assertRaises(ValueError):
+            run_sweep(other, self.output_dir, chunk_size=64, workers=1, progress=None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.physic import calculate_tensions, solution, calculate_body_position
+from frameworks.tension_table import TensionTable, get_tension_table
+
+class TestTensionTable(unittest.TestCase):
+
+    def setUp(self):
+        self.table = get_tension_table()
+
+    def test_shared_instance(self):
+        self.assertIs(self.table, get_tension_table())
+
+    def test_integer_angles_match_scalar(self):
+        for theta1 in range(0, 91, 7):
+            for theta2 in range(1, 91, 7):
+                T1, T2 = self.table.tensions(250, theta1, theta2)
+                t1, t2 = calculate_tensions(250, theta1, theta2)
+                self.assertAlmostEqual(T1, t1, places=6)
+                self.assertAlmostEqual(T2, t2, places=6)
+
+                T11, T22 = self.table.solution(250, theta1, theta2)
+                t11, t22 = solution(250, theta1, theta2)
+                self.assertAlmostEqual(T11, t11, places=6)
+                self.assertAlmostEqual(T22, t22, places=6)
+
+                x, y = self.table.body_position(337, 1012, 210, 250, theta1, theta2)
+                ex, ey = calculate_body_position(337, 1012, 210, t1, t2, theta1, theta2)
+                self.assertAlmostEqual(x, ex, delta=1)
+                self.assertAlmostEqual(y, ey, delta=1)
+
+    def test_whole_float_angles_read_the_same_cell(self):
+        self.assertEqual(self.table.tensions(100, 30.0, 60.0), self.table.tensions(100, 30, 60))
+        self.assertEqual(self.table.solution(100, 30.0, 60), self.table.solution(100, 30, 60))
+        self.assertEqual(self.table.body_position(337, 1012, 210, 100, 30.0, 60.0),
+                         self.table.body_position(337, 1012, 210, 100, 30, 60))
+
+    def test_fractional_angles_interpolate(self):
+        T1, T2 = self.table.tensions(100, 30.5, 60.25)
+        t1, t2 = calculate_tensions(100, 30.5, 60.25)
+        self.assertAlmostEqual(T1, t1, delta=0.05)
+        self.assertAlmostEqual(T2, t2, delta=0.05)
+
+    def test_next_to_degenerate_corners(self):
+        for theta1, theta2 in ((0.5, 0.5), (0.25, 0.75), (89.5, 89.5), (89.9, 89.25)):
+            T1, T2 = self.table.tensions(10, theta1, theta2)
+            t1, t2 = calculate_tensions(10, theta1, theta2)
+            self.assertAlmostEqual(T1, t1, delta=abs(t1) * 1e-9)
+            self.assertAlmostEqual(T2, t2, delta=abs(t2) * 1e-9)
+        self.assertAlmostEqual(self.table.tensions(10, 0.5, 0.5)[0], 5.0, places=3)
+        self.assertEqual(self.table.tensions(10, 90, 90), calculate_tensions(10, 90, 90))
+
+    def test_degenerate_and_out_of_range(self):
+        self.assertEqual(self.table.tensions(100, 0, 0), calculate_tensions(100, 0, 0))
+        self.assertEqual(self.table.body_position(337, 1012, 210, 0, 45, 45), (337, 210))
+        self.assertEqual(self.table.body_position(337, 1012, 210, 100, 0, 0), (337, 210))
+        with self.assertRaises(ZeroDivisionError):
+            self.table.solution(100, 0, 0)
+        self.assertEqual(self.table.tensions(100, 120, 45), calculate_tensions(100, 120, 45))
+
+    def test_smaller_table(self):
+        table = TensionTable(max_angle=45)
+        self.assertEqual(table.tensions(100, 60, 30), calculate_tensions(100, 60, 30))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from helpers import UITestCase
+
+class TestTextCache(UITestCase):
+
+    def setUp(self):
+        self.graphics.text_cache.clear()
+
+    def test_same_text_returns_the_cached_surface(self):
+        font = self.graphics.font
+        surface = self.graphics.render_text(font, "T1: 50.00 N", (0, 0, 0))
+        hits = self.graphics.text_cache.hits
+        self.assertIs(self.graphics.render_text(font, "T1: 50.00 N", (0, 0, 0)), surface)
+        # Colors given as lists or tuples share an entry
+        self.assertIs(self.graphics.render_text(font, "T1: 50.00 N", [0, 0, 0]), surface)
+        self.assertEqual(self.graphics.text_cache.hits, hits + 2)
+        self.assertEqual(len(self.graphics.text_cache), 1)
+
+    def test_font_text_and_color_are_part_of_the_key(self):
+        font = self.graphics.font
+        surface = self.graphics.render_text(font, "T1: 50.00 N", (0, 0, 0))
+        self.assertIsNot(self.graphics.render_text(font, "T1: 51.00 N", (0, 0, 0)), surface)
+        self.assertIsNot(self.graphics.render_text(font, "T1: 50.00 N", (255, 255, 255)), surface)
+        self.assertIsNot(self.graphics.render_text(self.graphics.font_large, "T1: 50.00 N", (0, 0, 0)), surface)
+        self.assertEqual(len(self.graphics.text_cache), 4)
+
+    def test_cached_surface_matches_a_direct_render(self):
+        font = self.graphics.font
+        expected = font.render("θ1: 30°", True, (255, 255, 255))
+        surface = self.graphics.render_text(font, "θ1: 30°", (255, 255, 255))
+        self.assertEqual(pygame.image.tobytes(surface, 'RGBA'), pygame.image.tobytes(expected, 'RGBA'))
+
+if __name__ == '__main__':
+    unittest.main()
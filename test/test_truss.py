@@ -0,0 +1,95 @@
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from frameworks.physic import calculate_tensions
+from frameworks.truss import Structure, IndeterminateError, MechanismError
+
+def two_rope_structure(theta1, theta2):
+    """Body hanging from two anchors, angles measured from the vertical."""
+    structure = Structure()
+    body = structure.add_node(0, 0)
+    anchor1 = structure.add_anchor(-math.sin(math.radians(theta1)), math.cos(math.radians(theta1)))
+    anchor2 = structure.add_anchor(math.sin(math.radians(theta2)), math.cos(math.radians(theta2)))
+    structure.add_rope(body, anchor1)
+    structure.add_rope(body, anchor2)
+    return structure, body
+
+def cantilever(n_nodes):
+    """Triangulated cantilever: every new node is braced to the two previous ones."""
+    structure = Structure()
+    structure.add_anchor(0, 0)
+    structure.add_anchor(0, 1)
+    for i in range(n_nodes):
+        node = structure.add_node(1 + i // 2, i % 2)
+        structure.add_member(node, node - 1)
+        structure.add_member(node, node - 2)
+    return structure
+
+class TestTruss(unittest.TestCase):
+
+    def test_two_ropes_match_calculate_tensions(self):
+        for theta1, theta2 in [(45, 45), (30, 60), (10, 75)]:
+            structure, body = two_rope_structure(theta1, theta2)
+            result = structure.solve({body: (0, -100)})
+            T1, T2 = calculate_tensions(100, theta1, theta2)
+            self.assertAlmostEqual(result.forces[0], T1, places=9)
+            self.assertAlmostEqual(result.forces[1], T2, places=9)
+            self.assertTrue(result.taut)
+            self.assertAlmostEqual(result.reactions.sum(axis=0)[1], 100, places=9)
+
+    def test_slack_rope(self):
+        structure, body = two_rope_structure(30, 60)
+        result = structure.solve({body: (0, 100)})
+        self.assertFalse(result.taut)
+        self.assertTrue(result.slack.all())
+
+    def test_reuses_factorization_for_new_loads(self):
+        structure, body = two_rope_structure(30, 60)
+        structure.solve({body: (0, -100)})
+        lu = structure._lu
+        loads = np.zeros((3, 3, 2))
+        loads[:, body, 1] = [-100, -200, -300]
+        result = structure.solve(loads)
+        self.assertIs(structure._lu, lu)
+        np.testing.assert_allclose(result.forces[:, 0] / result.forces[0, 0], [1, 2, 3])
+
+    def test_indeterminate_and_mechanism(self):
+        structure, body = two_rope_structure(30, 60)
+        structure.add_rope(body, structure.add_anchor(0, 1))
+        with self.assertRaises(IndeterminateError):
+            structure.solve({body: (0, -100)})
+
+        structure = Structure()
+        body = structure.add_node(0, 0)
+        structure.add_rope(body, structure.add_anchor(0, 1))
+        with self.assertRaises(MechanismError):
+            structure.solve({body: (0, -100)})
+
+        # Two collinear ropes cannot hold a sideways load
+        structure = Structure()
+        body = structure.add_node(0, 0)
+        structure.add_rope(body, structure.add_anchor(0, 1))
+        structure.add_rope(body, structure.add_anchor(0, 2))
+        with self.assertRaises(MechanismError):
+            structure.solve({body: (1, -100)})
+
+    def test_large_structure(self):
+        structure = cantilever(2000)
+        loads = np.zeros((len(structure.points), 2))
+        loads[-1] = (0, -100)
+        result = structure.solve(loads)
+        self.assertEqual(result.forces.shape, (4000,))
+        np.testing.assert_allclose(result.reactions.sum(axis=0), (0, 100), atol=1e-6)
+
+        # A second solve reuses the factorization; forces scale with the load
+        doubled = structure.solve(loads * 2)
+        np.testing.assert_allclose(doubled.forces, result.forces * 2, atol=1e-6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pygame
+from config.constant import WIDTH, HEIGHT
+from frameworks.state import StateManager
+from interfaces.historyCache import HistoryCache
+from interfaces.uiInterface import UI
+from interfaces.widgets import Widget, WidgetLayer
+from helpers import ListHistory, UITestCase
+
+def click(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+
+class TestWidgetLayer(unittest.TestCase):
+
+    def test_topmost_visible_widget_takes_the_click(self):
+        clicks = []
+        layer = WidgetLayer(cell_size=50)
+        shown = [True]
+        layer.add(Widget('back', (0, 0, 200, 200), lambda event: clicks.append('back')))
+        layer.add(Widget('front', (50, 50, 100, 100), lambda event: clicks.append('front'),
+                         visible=lambda: shown[0], z=1))
+
+        self.assertIs(layer.dispatch(click((60, 60))), layer.get('front'))
+        self.assertEqual(layer.dispatch(click((10, 10))).widget_id, 'back')
+        shown[0] = False
+        layer.dispatch(click((60, 60)))
+        self.assertIsNone(layer.dispatch(click((300, 300))))
+        # Other buttons are taken by the widget but do not click it
+        self.assertIsNotNone(layer.dispatch(click((10, 10), button=3)))
+        self.assertEqual(clicks, ['front', 'back', 'back'])
+
+    def test_move_reindexes(self):
+        layer = WidgetLayer(cell_size=50)
+        layer.add(Widget('w', (0, 0, 0, 0)))
+        self.assertIsNone(layer.hit((10, 10)))
+        layer.move('w', (400, 400, 20, 20))
+        self.assertIsNone(layer.hit((10, 10)))
+        self.assertEqual(layer.hit((410, 410)).widget_id, 'w')
+        layer.remove('w')
+        self.assertIsNone(layer.hit((410, 410)))
+        self.assertEqual(layer._cells, {})
+
+class TestUIEvents(UITestCase):
+
+    def setUp(self):
+        self.ui = UI(self.graphics, StateManager(), history=HistoryCache(client=ListHistory()))
+        self.buttons = {button_id: rect for text, rect, button_id in self.ui._buttons()}
+
+    def test_each_click_toggles_once(self):
+        # No cooldown: two quick clicks open and close the converter
+        self.assertTrue(self.ui.handle_event(click(self.buttons['conversor'].center)))
+        self.assertTrue(self.ui.conversor_visible)
+        self.ui.handle_event(click(self.buttons['conversor'].center))
+        self.assertFalse(self.ui.conversor_visible)
+        # A click on the scene is left to the simulator
+        self.assertFalse(self.ui.handle_event(click((WIDTH // 2, HEIGHT // 2))))
+
+    def test_converter_takes_typing_only_while_active(self):
+        self.ui.handle_event(click(self.buttons['conversor'].center))
+        self.ui.text = ''
+        key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_2, unicode='2', mod=0)
+        self.assertFalse(self.ui.handle_event(key))
+        self.ui.handle_event(click((100, 650)))
+        self.assertTrue(self.ui.active)
+        self.assertTrue(self.ui.handle_event(key))
+        self.ui.handle_event(click((100, 700)))
+        self.assertFalse(self.ui.active)
+        self.assertEqual(self.ui.text, '2')
+        self.assertAlmostEqual(self.ui.result_conversion, 2 * 9.81)
+
+    def test_history_rows_select_and_scroll(self):
+        self.ui.handle_event(click(self.buttons['historial'].center))
+        self.ui.draw_scene(self.screen)
+        self.ui.history._thread.join(5)
+        self.ui.draw_scene(self.screen)
+
+        rows = self.ui.widgets.get('historial_rows').rect
+        first_row_y = rows.top + 35
+        self.assertTrue(self.ui.handle_event(click((rows.centerx, first_row_y + 2 * 35 + 5))))
+        self.assertEqual(self.ui.selected_simulation, 2)
+
+        wheel = pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1)
+        with mock.patch('pygame.mouse.get_pos', return_value=rows.center):
+            self.assertTrue(self.ui.handle_event(wheel))
+        self.assertEqual(self.ui.scroll_y, 20)
+
+        close = self.ui.widgets.get('close_historial').rect
+        self.ui.handle_event(click(close.center))
+        self.assertFalse(self.ui.historial_visible)
+
+if __name__ == '__main__':
+    unittest.main()